@@ -83,8 +83,10 @@ class AssertionGenerator(cv.ChromosomeVisitor):
         with self._plain_executor.temporarily_add_observer(
             ato.AssertionTraceObserver()
         ):
-            for test in test_cases:
-                self._add_assertions_for(test, self._plain_executor.execute(test))
+            for test, result in zip(
+                test_cases, self._plain_executor.execute_many(test_cases), strict=True
+            ):
+                self._add_assertions_for(test, result)
 
         # Perform filtering executions to remove trivially flaky assertions.
         with self._plain_executor.temporarily_add_observer(
@@ -94,10 +96,12 @@ class AssertionGenerator(cv.ChromosomeVisitor):
                 # Create a copy of the list that is shuffled.
                 shuffled_copy = list(test_cases)
                 randomness.RNG.shuffle(shuffled_copy)
-                for test in shuffled_copy:
-                    self.__remove_non_holding_assertions(
-                        test, self._plain_executor.execute(test)
-                    )
+                for test, result in zip(
+                    shuffled_copy,
+                    self._plain_executor.execute_many(shuffled_copy),
+                    strict=True,
+                ):
+                    self.__remove_non_holding_assertions(test, result)
 
     @staticmethod
     def __remove_non_holding_assertions(test: tc.TestCase, result: ex.ExecutionResult):
@@ -301,8 +305,12 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
                     module_name=config.configuration.module_name,
                     mutated_module=mutated_module,
                 )
-                for test, results in tests_and_results:
-                    results.append(self._mutation_executor.execute(test))
+                for (_, results), result in zip(
+                    tests_and_results,
+                    self._mutation_executor.execute_many(test_cases),
+                    strict=True,
+                ):
+                    results.append(result)
 
         summary = self.__compute_mutation_summary(
             len(self._mutated_modules), tests_and_results
@@ -46,12 +46,20 @@ class AssertionTraceObserver(ex.ExecutionObserver):
 
         def __init__(self):  # noqa: D107
             super().__init__()
+            self.reset()
+
+        def reset(self) -> None:
+            """Reset the assertion data for a new execution."""
             self.trace: at.AssertionTrace = at.AssertionTrace()
             self.watch_list: list[vr.VariableReference] = []
 
     def __init__(self) -> None:  # noqa: D107
         self._assertion_local_state = AssertionTraceObserver.AssertionLocalState()
 
+    @property
+    def rewrites_statements(self) -> bool:  # noqa: D102
+        return False
+
     def get_trace(self) -> at.AssertionTrace:
         """Get a copy of the gathered trace.
 
@@ -61,12 +69,8 @@ class AssertionTraceObserver(ex.ExecutionObserver):
         """
         return self._assertion_local_state.trace.clone()
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
-
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self._assertion_local_state.reset()
 
     def before_statement_execution(  # noqa: D102
         self, statement: st.Statement, node: ast.stmt, exec_ctx: ex.ExecutionContext
@@ -267,17 +271,17 @@ class AssertionVerificationObserver(ex.ExecutionObserver):
 
         def __init__(self):  # noqa: D107
             super().__init__()
+            self.reset()
+
+        def reset(self) -> None:
+            """Reset the verification trace for a new execution."""
             self.trace = at.AssertionVerificationTrace()
 
     def __init__(self):  # noqa: D107
         self.state = AssertionVerificationObserver.AssertionExecutorLocalState()
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
-
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self.state.reset()
 
     def after_test_case_execution_inside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ex.ExecutionResult
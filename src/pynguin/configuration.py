@@ -217,6 +217,14 @@ class StatisticsOutputConfiguration:
     """When exporting type guesses for parameters, how many guesses per parameter
     should be exported? Expects positive integers."""
 
+    profile_instrumentation: bool = False
+    """Count the invocations of the hooks of the instrumentation and the time spent
+    in them, per hook and code object, and report them as the output variables
+    InstrumentationHookCalls, InstrumentationHookTime, and InstrumentationProfile.
+    Profiling slows down the execution of the instrumented code.  Executions in
+    forked processes, e.g., with several execution processes or prefix snapshots,
+    are not profiled."""
+
 
 @dataclasses.dataclass
 class TestCaseOutputConfiguration:
@@ -538,6 +546,21 @@ class SearchAlgorithmConfiguration:
     """Focus search by filtering out elements from the test cluster when
      they are fully covered."""
 
+    execution_trace_memory_budget: int = 0
+    """Memory (in MiB) that the execution traces of the chromosomes retained by the
+    search may occupy.  Once exceeded, the traces of chromosomes that are neither
+    part of the archive nor of the currently best test suite are dropped, largest
+    first, and recomputed by executing their test case again when needed.  A value
+    of 0 keeps all traces."""
+
+    deinstrument_covered_code: bool = False
+    """Remove the instrumentation of functions without loops during the search, once
+    all their coverage goals are covered, such that executing them is cheaper.  As
+    the removed instrumentation does not report to the execution trace anymore, the
+    archive does not replace the covering test cases of such goals by shorter ones.
+    The instrumentation is restored after the search.  Not applied when optimising
+    for checked coverage."""
+
 
 @dataclasses.dataclass
 class StoppingConfiguration:
@@ -587,6 +610,56 @@ class StoppingConfiguration:
     (up to maximum_test_execution_timeout)."""
 
 
+@dataclasses.dataclass
+class TestExecutionConfiguration:
+    """Configuration related to the execution of the generated test cases."""
+
+    number_of_execution_processes: int = 1
+    """Number of forked worker processes over which batches of test cases are
+    spread for execution.  A value of 1 executes all test cases in-process.  Larger
+    values are only effective on platforms that support forking processes and not
+    while the test cases themselves are instrumented for checked coverage."""
+
+    number_of_prefix_snapshots: int = 0
+    """Maximum number of snapshot processes that hold the state of an execution
+    before a statement, if the statements before it took long to execute.  During
+    the search, the execution of a test case that starts with the same statements,
+    e.g., a mutated offspring, is resumed from the longest such snapshot instead of
+    executing it from scratch.  Each snapshot process keeps a copy-on-write copy of
+    the memory of the Pynguin process alive.  A value of 0 disables snapshots.  They
+    are not used together with several execution processes, while the test cases
+    themselves are instrumented for checked coverage, or with the stopping
+    conditions on the maximum number of test or statement executions."""
+
+    prefix_snapshot_interval: float = 0.05
+    """Minimum time (in seconds) that the statements of a test case have to take to
+    execute, since its start or since its last snapshot, before another snapshot
+    of its execution is taken."""
+
+    compiled_code_cache_size: int = 1024
+    """Maximum number of code objects of statements and assertions, which are
+    instrumented for checked coverage, that are kept for reuse when a statement of
+    the same shape is executed again.  Code that is not instrumented is compiled for
+    every execution, because that is faster than looking it up.  A value of 0
+    disables the cache."""
+
+    execution_result_cache_memory_budget: int = 0
+    """Memory (in MiB) that the execution results kept during the search to be
+    reused for structurally equal test cases, instead of executing them again, may
+    occupy, approximated by the size of their execution traces.  A result is only
+    reused once two executions agreed on it; results of test cases that timed out or
+    behaved nondeterministically are never reused.  A value of 0 disables the
+    cache."""
+
+    instrumentation_cache_path: str = ""
+    """Path to a directory that caches the instrumented code of the module under
+    test across runs, similar to ``__pycache__``.  An entry is only reused for the
+    same source code, Python version, Pynguin version and instrumentation, e.g.,
+    coverage metrics.  The entries are unpickled when they are reused, thus the
+    directory must only be writable by trusted users.  An empty path disables the
+    cache."""
+
+
 @dataclasses.dataclass
 class Configuration:
     """General configuration for the test generator."""
@@ -613,6 +686,11 @@ class Configuration:
     )
     """Stopping configuration."""
 
+    test_execution: TestExecutionConfiguration = dataclasses.field(
+        default_factory=TestExecutionConfiguration
+    )
+    """Test execution configuration."""
+
     seeding: SeedingConfiguration = dataclasses.field(
         default_factory=SeedingConfiguration
     )
@@ -17,6 +17,7 @@ import pynguin.ga.testcasechromosome as tcc
 
 from pynguin.ga.algorithms.archive import CoverageArchive
 from pynguin.ga.algorithms.generationalgorithm import GenerationAlgorithm
+from pynguin.ga.computations import run_test_case_chromosomes
 from pynguin.ga.operators.comparator import DominanceComparator
 from pynguin.utils import randomness
 from pynguin.utils.exceptions import ConstructionFailedException
@@ -32,6 +33,9 @@ class AbstractMOSAAlgorithm(GenerationAlgorithm[CoverageArchive], metaclass=ABCM
         self._population: list[tcc.TestCaseChromosome] = []
         self._number_of_goals = -1
 
+    def _get_retained_chromosomes(self) -> list[tcc.TestCaseChromosome]:
+        return self._population
+
     def _breed_next_generation(self) -> list[tcc.TestCaseChromosome]:
         offspring_population: list[tcc.TestCaseChromosome] = []
         for _ in range(int(config.configuration.search_algorithm.population / 2)):
@@ -78,6 +82,9 @@ class AbstractMOSAAlgorithm(GenerationAlgorithm[CoverageArchive], metaclass=ABCM
                 offspring_population.append(tch)
 
         self._logger.debug("Number of offsprings = %d", len(offspring_population))
+        # Execute the offspring as one batch, instead of one by one on their first
+        # fitness evaluation.
+        run_test_case_chromosomes(self._executor, offspring_population)
         return offspring_population
 
     @staticmethod
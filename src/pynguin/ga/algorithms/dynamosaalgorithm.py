@@ -64,7 +64,9 @@ class DynaMOSAAlgorithm(AbstractMOSAAlgorithm):
         )
         for i in range(fronts.get_number_of_sub_fronts()):
             fast_epsilon_dominance_assignment(
-                fronts.get_sub_front(i), self._goals_manager.current_goals
+                fronts.get_sub_front(i),
+                self._goals_manager.current_goals,
+                fronts.fitness_matrix,
             )
 
         self.before_first_search_iteration(
@@ -113,7 +115,9 @@ class DynaMOSAAlgorithm(AbstractMOSAAlgorithm):
 
         while remain > 0 and remain >= len(front) != 0:
             # Assign crowding distance to individuals
-            fast_epsilon_dominance_assignment(front, self._goals_manager.current_goals)
+            fast_epsilon_dominance_assignment(
+                front, self._goals_manager.current_goals, fronts.fitness_matrix
+            )
             # Add the individuals of this front
             self._population.extend(front)
             # Decrement remain
@@ -125,7 +129,9 @@ class DynaMOSAAlgorithm(AbstractMOSAAlgorithm):
 
         # Remain is less than len(front[index]), insert only the best one
         if remain > 0 and len(front) != 0:
-            fast_epsilon_dominance_assignment(front, self._goals_manager.current_goals)
+            fast_epsilon_dominance_assignment(
+                front, self._goals_manager.current_goals, fronts.fitness_matrix
+            )
             front.sort(key=lambda t: t.distance, reverse=True)
             self._population.extend(front[k] for k in range(remain))
 
@@ -17,13 +17,17 @@ from typing import TypeVar
 
 import pynguin.ga.algorithms.archive as arch
 import pynguin.ga.testsuitechromosome as tsc
+import pynguin.utils.statistics.statistics as stat
 
 from pynguin.utils.orderedset import OrderedSet
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Sequence
 
+    import pynguin.ga.chromosome as chrom
     import pynguin.ga.chromosomefactory as cf
     import pynguin.ga.computations as ff
     import pynguin.ga.coveragegoals as bg
@@ -36,6 +40,7 @@ if TYPE_CHECKING:
     from pynguin.ga.operators.ranking import RankingFunction
     from pynguin.ga.operators.selection import SelectionFunction
     from pynguin.ga.stoppingcondition import StoppingCondition
+    from pynguin.ga.tracebudget import ExecutionTraceBudget
     from pynguin.testcase.execution import AbstractTestCaseExecutor
 
 A = TypeVar("A", bound=arch.Archive)
@@ -65,6 +70,7 @@ class GenerationAlgorithm(Generic[A]):
         ] = OrderedSet()
         self._branch_goal_pool: bg.BranchGoalPool
         self._search_observers: list[so.SearchObserver] = []
+        self._execution_trace_budget: ExecutionTraceBudget | None = None
 
     @property
     def chromosome_factory(self) -> cf.ChromosomeFactory:
@@ -244,6 +250,21 @@ class GenerationAlgorithm(Generic[A]):
     ) -> None:
         self._test_suite_coverage_functions = test_suite_coverage_functions
 
+    @property
+    def execution_trace_budget(self) -> ExecutionTraceBudget | None:
+        """Provides the memory budget for the retained execution traces, if any.
+
+        Returns:
+            The execution trace budget
+        """
+        return self._execution_trace_budget
+
+    @execution_trace_budget.setter
+    def execution_trace_budget(
+        self, execution_trace_budget: ExecutionTraceBudget | None
+    ) -> None:
+        self._execution_trace_budget = execution_trace_budget
+
     def create_test_suite(
         self, population: Iterable[tcc.TestCaseChromosome]
     ) -> tsc.TestSuiteChromosome:
@@ -309,11 +330,31 @@ class GenerationAlgorithm(Generic[A]):
         """
         for obs in self._search_observers:
             obs.after_search_iteration(best)
+        if self._execution_trace_budget is not None:
+            self._execution_trace_budget.enforce(
+                self._get_retained_chromosomes(), [best]
+            )
 
     def after_search_finish(self) -> None:
         """Has to be called when the search has finished."""
         for obs in self._search_observers:
             obs.after_search_finish()
+        if self._execution_trace_budget is not None:
+            stat.track_output_variable(
+                RuntimeVariable.ShedExecutionTraceMemory,
+                self._execution_trace_budget.saved_memory,
+            )
+
+    def _get_retained_chromosomes(self) -> Sequence[chrom.Chromosome]:
+        """Provides the chromosomes the search keeps beyond the current iteration.
+
+        Their execution traces may be shed to stay within the execution trace
+        budget, unless they are part of the currently best test suite.
+
+        Returns:
+            The retained chromosomes
+        """
+        return []
 
     def resources_left(self) -> bool:
         """Checks if there are still resources left, e.g., time or test case executions.
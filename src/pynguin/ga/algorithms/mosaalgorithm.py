@@ -49,6 +49,7 @@ class MOSAAlgorithm(AbstractMOSAAlgorithm):
             fast_epsilon_dominance_assignment(
                 fronts.get_sub_front(i),
                 self._archive.uncovered_goals,  # type: ignore[arg-type]
+                fronts.fitness_matrix,
             )
 
         self.before_first_search_iteration(
@@ -99,7 +100,9 @@ class MOSAAlgorithm(AbstractMOSAAlgorithm):
 
         while remain > 0 and remain >= len(front) != 0:
             # Assign crowding distance to individuals
-            fast_epsilon_dominance_assignment(front, uncovered_goals)
+            fast_epsilon_dominance_assignment(
+                front, uncovered_goals, fronts.fitness_matrix
+            )
             # Add the individuals of this front
             self._population.extend(front)
             # Decrement remain
@@ -111,7 +114,9 @@ class MOSAAlgorithm(AbstractMOSAAlgorithm):
 
         # Remain is less than len(front[index]), insert only the best one
         if remain > 0 and len(front) != 0:
-            fast_epsilon_dominance_assignment(front, uncovered_goals)
+            fast_epsilon_dominance_assignment(
+                front, uncovered_goals, fronts.fitness_matrix
+            )
             front.sort(key=lambda t: t.distance, reverse=True)
             self._population.extend(front[k] for k in range(remain))
 
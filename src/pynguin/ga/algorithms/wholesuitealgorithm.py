@@ -101,6 +101,9 @@ class WholeSuiteAlgorithm(GenerationAlgorithm[arch.CoverageArchive]):
         self._update_archive()
         self._sort_population()
 
+    def _get_retained_chromosomes(self) -> list[tsc.TestSuiteChromosome]:
+        return self._population
+
     def _get_random_population(self) -> list[tsc.TestSuiteChromosome]:
         population = []
         for _ in range(config.configuration.search_algorithm.population):
@@ -9,7 +9,9 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import functools
 import math
+import operator
 import statistics
 
 from abc import abstractmethod
@@ -22,10 +24,17 @@ import pynguin.utils.opcodes as op
 from pynguin.slicer.dynamicslicer import AssertionSlicer
 from pynguin.slicer.dynamicslicer import DynamicSlicer
 from pynguin.testcase.execution import ExecutionTrace
+from pynguin.utils.compactcollections import DenseCountMapping
+from pynguin.utils.compactcollections import DenseDistanceMapping
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Collection
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+    import pynguin.ga.testsuitechromosome as tsc
 
     from pynguin.slicer.dynamicslicer import SlicingCriterion
     from pynguin.testcase.execution import AbstractTestCaseExecutor
@@ -56,9 +65,13 @@ class TestCaseChromosomeComputation(ChromosomeComputation, metaclass=abc.ABCMeta
         Returns:
             A list of execution results
         """
-        if individual.changed or individual.get_last_execution_result() is None:
+        if (
+            individual.changed
+            or individual.get_last_execution_result() is None
+            or individual.execution_trace_shed
+        ):
             individual.set_last_execution_result(
-                self._executor.execute(individual.test_case)
+                self._executor.execute(individual.read_only_test_case)
             )
             individual.changed = False
         result = individual.get_last_execution_result()
@@ -80,25 +93,68 @@ class TestSuiteChromosomeComputation(ChromosomeComputation, metaclass=abc.ABCMet
         Returns:
             A list of execution results
         """
+        run_test_case_chromosomes(self._executor, individual.test_case_chromosomes)
         results: list[ExecutionResult] = []
         for test_case_chromosome in individual.test_case_chromosomes:
-            if (
-                test_case_chromosome.changed
-                or test_case_chromosome.get_last_execution_result() is None
-            ):
-                test_case_chromosome.set_last_execution_result(
-                    self._executor.execute(test_case_chromosome.test_case)
-                )
-                test_case_chromosome.changed = False
-                # If we execute a suite which in turn executes it's test cases,
-                # then we have to invalidate the values of the test cases, because
-                # the test case is no longer aware that it was changed.
-                test_case_chromosome.invalidate_cache()
             result = test_case_chromosome.get_last_execution_result()
             assert result is not None
             results.append(result)
         return results
 
+    def _merge_test_suite_traces(
+        self, individual: tsc.TestSuiteChromosome
+    ) -> ExecutionTrace:
+        """Runs a test suite and merges the traces of its test cases.
+
+        Test suite chromosomes keep their merged trace, such that only the traces of
+        test cases with a new execution result have to be merged again.
+
+        Args:
+            individual: The individual to run
+
+        Returns:
+            The merged trace
+        """
+        results = self._run_test_suite_chromosome(individual)
+        return individual.aggregated_trace.update(results)
+
+
+def run_test_case_chromosomes(
+    executor: AbstractTestCaseExecutor, individuals: Iterable
+) -> None:
+    """Runs the given test case chromosomes and updates their execution results.
+
+    All test cases that were changed or never executed are executed as one batch,
+    together with the unchanged test cases whose execution trace was shed.
+
+    Args:
+        executor: The executor to execute the test cases with
+        individuals: The test case chromosomes to run
+    """
+    to_run = [
+        individual
+        for individual in individuals
+        if individual.changed
+        or individual.get_last_execution_result() is None
+        or individual.execution_trace_shed
+    ]
+    if not to_run:
+        return
+    results = executor.execute_many(
+        [individual.read_only_test_case for individual in to_run]
+    )
+    for individual, result in zip(to_run, results, strict=True):
+        # A test case is only executed again to restore its shed trace, if it is
+        # unchanged, so its cached values remain valid.
+        outdated = individual.changed or not individual.execution_trace_shed
+        individual.set_last_execution_result(result)
+        individual.changed = False
+        if outdated:
+            # If we execute test cases outside their own computations, e.g., from a
+            # suite, then we have to invalidate their cached values, because the
+            # test case is no longer aware that it was changed.
+            individual.invalidate_cache()
+
 
 class FitnessFunction:
     """Interface for a fitness function."""
@@ -215,8 +271,7 @@ class BranchDistanceTestSuiteFitnessFunction(TestSuiteFitnessFunction):
         self._excluded_false_predicates.update(exclude_false)
 
     def compute_fitness(self, individual) -> float:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
 
         return compute_branch_distance_fitness(
@@ -228,8 +283,7 @@ class BranchDistanceTestSuiteFitnessFunction(TestSuiteFitnessFunction):
         )
 
     def compute_is_covered(self, individual) -> bool:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
 
         return compute_branch_distance_fitness_is_covered(
@@ -248,15 +302,13 @@ class LineTestSuiteFitnessFunction(TestSuiteFitnessFunction):
     """A fitness function based on lines covered and entered code objects."""
 
     def compute_fitness(self, individual) -> float:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
         existing_lines = tracer.get_subject_properties().existing_lines
         return len(existing_lines) - len(merged_trace.covered_line_ids)
 
     def compute_is_covered(self, individual) -> bool:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
 
         return compute_line_coverage_fitness_is_covered(
@@ -276,8 +328,7 @@ class StatementCheckedTestSuiteFitnessFunction(TestSuiteFitnessFunction):
     """
 
     def compute_fitness(self, individual) -> float:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
 
         return len(tracer.get_subject_properties().existing_lines) - len(
@@ -285,8 +336,7 @@ class StatementCheckedTestSuiteFitnessFunction(TestSuiteFitnessFunction):
         )
 
     def compute_is_covered(self, individual) -> bool:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
 
         return compute_checked_coverage_statement_fitness_is_covered(
@@ -329,8 +379,7 @@ class TestSuiteBranchCoverageFunction(TestSuiteCoverageFunction):
     """Computes branch coverage on test suites."""
 
     def compute_coverage(self, individual) -> float:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
         return compute_branch_coverage(merged_trace, tracer.get_subject_properties())
 
@@ -349,8 +398,7 @@ class TestSuiteLineCoverageFunction(TestSuiteCoverageFunction):
     """Computes line coverage on test suites."""
 
     def compute_coverage(self, individual) -> float:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
         return compute_line_coverage(merged_trace, tracer.get_subject_properties())
 
@@ -369,8 +417,7 @@ class TestSuiteStatementCheckedCoverageFunction(TestSuiteCoverageFunction):
     """Computes checked coverage on the statements of test suites."""
 
     def compute_coverage(self, individual) -> float:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
 
         existing = len(tracer.get_subject_properties().existing_lines)
@@ -408,8 +455,7 @@ class TestSuiteAssertionCheckedCoverageFunction(TestSuiteCoverageFunction):
     """Computes checked coverage on test suites with assertions."""
 
     def compute_coverage(self, individual) -> float:  # noqa: D102
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
+        merged_trace = self._merge_test_suite_traces(individual)
         tracer = self._executor.tracer
         return compute_assertion_checked_coverage(
             merged_trace, tracer.get_subject_properties()
@@ -608,6 +654,27 @@ class ComputationCache:
         )
         return self._fitness_cache[fitness_function]
 
+    def get_fitness_values(
+        self, fitness_functions: Collection[FitnessFunction]
+    ) -> list[float]:
+        """Returns the fitness values of several fitness functions at once.
+
+        If the chromosome is unchanged and all values are cached, the values are
+        read from the cache without checking it for every fitness function.
+
+        Args:
+            fitness_functions: The fitness functions
+
+        Returns:
+            Their fitness values, in the order of the given fitness functions
+        """
+        if not self._chromosome.changed:
+            try:
+                return [self._fitness_cache[func] for func in fitness_functions]
+            except KeyError:
+                pass
+        return [self.get_fitness_for(func) for func in fitness_functions]
+
     def get_is_covered(self, fitness_function: FitnessFunction) -> bool:
         """Check if the individual covers this fitness function.
 
@@ -729,24 +796,88 @@ def compute_branch_distance_fitness(
     exclude_true = set() if exclude_true is None else exclude_true
     exclude_false = set() if exclude_false is None else exclude_false
 
-    # Check if all predicates are covered
-    predicate_fitness: float = 0.0
-    for predicate in subject_properties.existing_predicates:
-        if predicate not in exclude_true:
-            predicate_fitness += _predicate_fitness(
-                predicate, trace.true_distances, trace
-            )
-        if predicate not in exclude_false:
-            predicate_fitness += _predicate_fitness(
-                predicate, trace.false_distances, trace
-            )
+    # Sum up the fitness of all branches. The branches are summed in the order of
+    # the predicates, to obtain the same floating point result on every path.
+    contributions = _dense_branch_fitness_contributions(
+        trace, subject_properties, exclude_true, exclude_false
+    )
+    if contributions is None:
+        contributions = []
+        for predicate in subject_properties.existing_predicates:
+            if predicate not in exclude_true:
+                contributions.append(
+                    _predicate_fitness(predicate, trace.true_distances, trace)
+                )
+            if predicate not in exclude_false:
+                contributions.append(
+                    _predicate_fitness(predicate, trace.false_distances, trace)
+                )
+    predicate_fitness: float = functools.reduce(operator.add, contributions, 0.0)
 
     assert predicate_fitness >= 0.0, "Predicate fitness cannot be negative."
     return code_objects_missing + predicate_fitness
 
 
+def _dense_branch_fitness_contributions(
+    trace: ExecutionTrace,
+    subject_properties: SubjectProperties,
+    exclude_true: set[int],
+    exclude_false: set[int],
+) -> list[float] | None:
+    """Computes the fitness of all branches from the dense distances of a trace.
+
+    Instead of inspecting every predicate, all branches start with the fitness of a
+    branch that was not reached; only the branches of executed predicates are then
+    updated, and excluded branches contribute zero.  Adding zero does not change
+    the sum, so summing the result in order yields the same value as the scalar
+    computation in _predicate_fitness.
+
+    Args:
+        trace: The execution trace
+        subject_properties: All known data
+        exclude_true: Ids of predicates whose True branch should not be considered.
+        exclude_false: Ids of predicates whose False branch should not be
+            considered.
+
+    Returns:
+        The fitness of the true and false branch of every predicate, interleaved
+        in the order of the predicate ids, or None, if the trace is not stored
+        densely or the predicate ids are not consecutive.
+    """
+    if not (
+        isinstance(trace.true_distances, DenseDistanceMapping)
+        and isinstance(trace.false_distances, DenseDistanceMapping)
+        and isinstance(trace.executed_predicates, DenseCountMapping)
+    ):
+        return None
+    number_of_predicates = len(subject_properties.existing_predicates)
+    if list(subject_properties.existing_predicates) != list(
+        range(number_of_predicates)
+    ):
+        return None
+
+    contributions = [1.0] * (2 * number_of_predicates)
+    counts = trace.executed_predicates
+    for offset, distances, excluded in (
+        (0, trace.true_distances, exclude_true),
+        (1, trace.false_distances, exclude_false),
+    ):
+        for predicate in distances:
+            if predicate >= number_of_predicates:
+                continue
+            distance = distances[predicate]
+            if distance == 0.0:
+                contributions[2 * predicate + offset] = 0.0
+            elif counts.get(predicate, 0) >= 2:
+                contributions[2 * predicate + offset] = normalise(distance)
+        for predicate in excluded:
+            if 0 <= predicate < number_of_predicates:
+                contributions[2 * predicate + offset] = 0.0
+    return contributions
+
+
 def _predicate_fitness(
-    predicate: int, branch_distances: dict[int, float], trace: ExecutionTrace
+    predicate: int, branch_distances: Mapping[int, float], trace: ExecutionTrace
 ) -> float:
     if predicate in branch_distances and branch_distances[predicate] == 0.0:
         return 0.0
@@ -796,16 +927,15 @@ def compute_branch_distance_fitness_is_covered(
     exclude_false = set() if exclude_false is None else exclude_false
 
     # Check if all predicates are covered
-    for predicate in subject_properties.existing_predicates:
-        if (
-            predicate not in exclude_true
-            and (predicate, 0.0) not in trace.true_distances
-        ):
-            return False
-        if (
-            predicate not in exclude_false
-            and (predicate, 0.0) not in trace.false_distances
-        ):
+    predicates = subject_properties.existing_predicates.keys()
+    for distances, excluded in (
+        (trace.true_distances, exclude_true),
+        (trace.false_distances, exclude_false),
+    ):
+        covered = {
+            predicate for predicate, distance in distances.items() if distance == 0.0
+        }
+        if not covered.issuperset(predicates - excluded):
             return False
     return True
 
@@ -946,9 +1076,28 @@ def compute_statement_checked_lines(
     Returns:
         The checked line ids of lines checked by the statements
     """
-    known_code_objects = subject_properties.existing_code_objects
-    dynamic_slicer = DynamicSlicer(known_code_objects)
-    checked_lines_ids = set()
+    return compute_criteria_checked_lines(
+        trace,
+        subject_properties,
+        select_statement_slicing_criteria(statements, statement_slicing_criteria),
+    )
+
+
+def select_statement_slicing_criteria(
+    statements: list[Statement],
+    statement_slicing_criteria: dict[int, SlicingCriterion],
+) -> list[SlicingCriterion]:
+    """Selects the slicing criteria of the statements that shall be sliced.
+
+    Args:
+        statements: The executed statements
+        statement_slicing_criteria: a dictionary of statement positions
+            and its slicing criteria
+
+    Returns:
+        The slicing criteria, in the order of the statements
+    """
+    slicing_criteria = []
     for statement in statements:
         if statement.get_position() not in statement_slicing_criteria:
             # if there is no slicing criterion there was an exception during
@@ -956,10 +1105,31 @@ def compute_statement_checked_lines(
             # with an exception will never be executed,
             # thus having no slicing criterion
             break
-        statement_slice = dynamic_slicer.slice(
-            trace,
-            statement_slicing_criteria[statement.get_position()],
-        )
+        slicing_criteria.append(statement_slicing_criteria[statement.get_position()])
+    return slicing_criteria
+
+
+def compute_criteria_checked_lines(
+    trace: ExecutionTrace,
+    subject_properties: SubjectProperties,
+    slicing_criteria: list[SlicingCriterion],
+) -> set[int]:
+    """Computes the lines checked by the given slicing criteria of statements.
+
+    All criteria are sliced in a single backward traversal of the trace.
+
+    Args:
+        trace: The execution trace
+        subject_properties: All known data
+        slicing_criteria: The slicing criteria of the statements
+
+    Returns:
+        The checked line ids of lines checked by the statements
+    """
+    known_code_objects = subject_properties.existing_code_objects
+    dynamic_slicer = DynamicSlicer(known_code_objects)
+    checked_lines_ids = set()
+    for statement_slice in dynamic_slicer.slice_all(trace, slicing_criteria):
         statement_checked_lines = DynamicSlicer.map_instructions_to_lines(
             statement_slice, subject_properties
         )
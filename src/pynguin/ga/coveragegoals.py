@@ -407,6 +407,15 @@ class LineCoverageTestFitness(ff.TestCaseFitnessFunction):
     def is_maximisation_function(self) -> bool:  # noqa: D102
         return False
 
+    @property
+    def goal(self) -> LineCoverageGoal:
+        """Provides the line-coverage goal of this fitness function.
+
+        Returns:
+            The attached line-coverage goal
+        """
+        return self._goal
+
     def __str__(self) -> str:
         return f"LineCoverageTestFitness for {self._goal}"
 
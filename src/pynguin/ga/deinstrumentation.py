@@ -0,0 +1,164 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019-2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides an observer that removes the instrumentation of covered code.
+
+Once all coverage goals of a code object are covered, its instrumentation only
+reports data that no fitness function needs anymore.  The observer therefore
+swaps the code of the functions using such a code object with its original code
+between the iterations of the search, and restores the instrumentation once the
+search has finished, such that the final coverage is computed on the
+instrumented code.
+
+Only code objects without loops are de-instrumented, because the instrumentation
+of a loop also stops threads of timed-out executions that still run it.
+"""
+from __future__ import annotations
+
+import logging
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import networkx as nx
+
+from bytecode import Instr
+
+import pynguin.ga.coveragegoals as bg
+import pynguin.ga.searchobserver as so
+import pynguin.utils.statistics.statistics as stat
+
+from pynguin.instrumentation.machinery import InstrumentationRemover
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pynguin.ga.algorithms.archive as arch
+    import pynguin.ga.computations as ff
+    import pynguin.ga.testsuitechromosome as tsc
+
+    from pynguin.testcase.execution import ExecutionTracer
+    from pynguin.testcase.execution import SubjectProperties
+
+
+class DeinstrumentationObserver(so.SearchObserver):
+    """Removes the instrumentation of code objects whose goals are all covered."""
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        archive: arch.Archive,
+        fitness_functions: Iterable[ff.TestCaseFitnessFunction],
+        tracer: ExecutionTracer,
+    ) -> None:
+        """Initializes the observer.
+
+        Args:
+            archive: The archive that reports covered goals
+            fitness_functions: The fitness functions of all goals of the search
+            tracer: The tracer the instrumented code reports to
+        """
+        self._remover = InstrumentationRemover(tracer)
+        subject_properties = tracer.get_subject_properties()
+        self._uncovered: dict[int, set[ff.TestCaseFitnessFunction]] = defaultdict(set)
+        self._code_objects_of_goal: dict[ff.TestCaseFitnessFunction, list[int]] = {}
+        pinned: set[int] = set()
+        lines = _code_objects_of_lines(subject_properties)
+        for fitness_function in fitness_functions:
+            if isinstance(fitness_function, bg.BranchCoverageTestFitness):
+                code_object_ids = [fitness_function.code_object_id]
+            elif isinstance(fitness_function, bg.LineCoverageTestFitness):
+                # A line may be spread over several code objects, e.g., the head of
+                # a nested function, each of them reports it.
+                code_object_ids = lines[fitness_function.goal.line_id]
+            else:
+                # We do not know which code objects report data for the goal.
+                pinned.add(fitness_function.code_object_id)
+                continue
+            self._code_objects_of_goal[fitness_function] = code_object_ids
+            for code_object_id in code_object_ids:
+                self._uncovered[code_object_id].add(fitness_function)
+        for code_object_id, meta in subject_properties.existing_code_objects.items():
+            if not nx.is_directed_acyclic_graph(meta.original_cfg.graph):
+                pinned.add(code_object_id)
+        for code_object_id in pinned:
+            self._uncovered.pop(code_object_id, None)
+        self._pending: set[int] = set()
+        self._deinstrumented: set[int] = set()
+        archive.add_on_target_covered(self._on_target_covered)
+
+    @property
+    def deinstrumented_code_objects(self) -> set[int]:
+        """Provides the ids of the code objects whose instrumentation was removed.
+
+        Returns:
+            The ids of the de-instrumented code objects
+        """
+        return self._deinstrumented
+
+    def _on_target_covered(self, target: ff.TestCaseFitnessFunction) -> None:
+        for code_object_id in self._code_objects_of_goal.get(target, []):
+            if (uncovered := self._uncovered.get(code_object_id)) is None:
+                continue
+            uncovered.discard(target)
+            if not uncovered:
+                del self._uncovered[code_object_id]
+                self._pending.add(code_object_id)
+
+    def _remove_pending(self) -> None:
+        if not self._pending:
+            return
+        self._remover.remove(self._pending)
+        self._deinstrumented.update(self._pending)
+        self._pending.clear()
+
+    def before_search_start(self, start_time_ns: int) -> None:  # noqa: D102
+        self._remove_pending()
+
+    def before_first_search_iteration(  # noqa: D102
+        self, initial: tsc.TestSuiteChromosome
+    ) -> None:
+        self._remove_pending()
+
+    def after_search_iteration(  # noqa: D102
+        self, best: tsc.TestSuiteChromosome
+    ) -> None:
+        self._remove_pending()
+
+    def after_search_finish(self) -> None:  # noqa: D102
+        self._remover.restore()
+        self._logger.info(
+            "Removed the instrumentation of %d code objects during the search",
+            len(self._deinstrumented),
+        )
+        stat.track_output_variable(
+            RuntimeVariable.DeinstrumentedCodeObjects, len(self._deinstrumented)
+        )
+
+
+def _code_objects_of_lines(
+    subject_properties: SubjectProperties,
+) -> dict[int, list[int]]:
+    line_ids: dict[tuple[str, int | None], int] = {
+        (meta.file_name, meta.line_number): line_id
+        for line_id, meta in subject_properties.existing_lines.items()
+    }
+    code_objects: dict[int, list[int]] = defaultdict(list)
+    for code_object_id, meta in subject_properties.existing_code_objects.items():
+        file_name = meta.original_cfg.bytecode_cfg().filename
+        for line_id in {
+            line_ids.get((file_name, instruction.lineno))
+            for node in meta.original_cfg.nodes
+            if node.basic_block is not None
+            for instruction in node.basic_block
+            if isinstance(instruction, Instr)
+        }:
+            if line_id is not None:
+                code_objects[line_id].append(code_object_id)
+    return code_objects
@@ -45,6 +45,7 @@ from pynguin.ga.algorithms.randomalgorithm import RandomAlgorithm
 from pynguin.ga.algorithms.randomsearchalgorithm import RandomTestCaseSearchAlgorithm
 from pynguin.ga.algorithms.randomsearchalgorithm import RandomTestSuiteSearchAlgorithm
 from pynguin.ga.algorithms.wholesuitealgorithm import WholeSuiteAlgorithm
+from pynguin.ga.deinstrumentation import DeinstrumentationObserver
 from pynguin.ga.operators.crossover import SinglePointRelativeCrossOver
 from pynguin.ga.operators.ranking import RankBasedPreferenceSorting
 from pynguin.ga.operators.selection import RankSelection
@@ -58,6 +59,7 @@ from pynguin.ga.stoppingcondition import MaxStatementExecutionsStoppingCondition
 from pynguin.ga.stoppingcondition import MaxTestExecutionsStoppingCondition
 from pynguin.ga.stoppingcondition import MinimumCoveragePlateauStoppingCondition
 from pynguin.ga.stoppingcondition import StoppingCondition
+from pynguin.ga.tracebudget import ExecutionTraceBudget
 from pynguin.testcase.execution import AbstractTestCaseExecutor
 from pynguin.testcase.execution import TypeTracingTestCaseExecutor
 from pynguin.utils.exceptions import ConfigurationException
@@ -277,6 +279,8 @@ class TestSuiteGenerationAlgorithmFactory(
         strategy.add_search_observer(sso.SequenceStartTimeObserver())
         strategy.add_search_observer(sso.IterationObserver())
         strategy.add_search_observer(sso.BestIndividualObserver())
+        if (deinstrumentation := self._get_deinstrumentation(strategy)) is not None:
+            strategy.add_search_observer(deinstrumentation)
 
         crossover_function = self._get_crossover_function()
         strategy.crossover_function = crossover_function
@@ -284,8 +288,46 @@ class TestSuiteGenerationAlgorithmFactory(
         ranking_function = self._get_ranking_function()
         strategy.ranking_function = ranking_function
 
+        strategy.execution_trace_budget = self._get_execution_trace_budget()
+
         return strategy
 
+    def _get_deinstrumentation(
+        self, strategy: GenerationAlgorithm
+    ) -> DeinstrumentationObserver | None:
+        """Provides the observer that removes the instrumentation of covered code.
+
+        Args:
+            strategy: The strategy whose archive reports covered goals
+
+        Returns:
+            A de-instrumentation observer, or None if the instrumentation shall be
+            kept during the search
+        """
+        if (
+            not config.configuration.search_algorithm.deinstrument_covered_code
+            or config.CoverageMetric.CHECKED
+            in config.configuration.statistics_output.coverage_metrics
+        ):
+            return None
+        return DeinstrumentationObserver(
+            strategy.archive,
+            strategy.test_case_fitness_functions,
+            self._executor.tracer,
+        )
+
+    @staticmethod
+    def _get_execution_trace_budget() -> ExecutionTraceBudget | None:
+        """Provides the memory budget for the execution traces, if one is set.
+
+        Returns:
+            An execution trace budget, or None if all traces shall be kept
+        """
+        budget = config.configuration.search_algorithm.execution_trace_memory_budget
+        if budget <= 0:
+            return None
+        return ExecutionTraceBudget(budget * 1024 * 1024)
+
     @classmethod
     def _get_generation_strategy(cls) -> GenerationAlgorithm:
         """Provides a generation strategy.
@@ -8,11 +8,12 @@
 from __future__ import annotations
 
 import logging
-import sys
+import operator
 
 from abc import ABCMeta
 from abc import abstractmethod
 from dataclasses import dataclass
+from dataclasses import field
 from typing import TYPE_CHECKING
 from typing import Generic
 from typing import TypeVar
@@ -20,24 +21,190 @@ from typing import TypeVar
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
 
-from pynguin.ga.operators.comparator import DominanceComparator
-from pynguin.ga.operators.comparator import PreferenceSortingComparator
 from pynguin.utils import randomness
 from pynguin.utils.orderedset import OrderedSet
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
     import pynguin.ga.computations as ff
 
 C = TypeVar("C", bound=chrom.Chromosome)
 
 
+def dominance(fitness_values_1: list[float], fitness_values_2: list[float]) -> int:
+    """Compares two lists of fitness values regarding their dominance.
+
+    Args:
+        fitness_values_1: The fitness values of the first solution
+        fitness_values_2: The fitness values of the second solution, for the same
+            goals
+
+    Returns:
+        -1 if the first values dominate the second values; 1 if the first values
+        are dominated by the second values; 0 otherwise
+    """
+    dominates_1 = any(map(operator.lt, fitness_values_1, fitness_values_2))
+    dominates_2 = any(map(operator.gt, fitness_values_1, fitness_values_2))
+    if dominates_1 == dominates_2:
+        return 0
+    return -1 if dominates_1 else 1
+
+
+class FitnessMatrix(Generic[C]):
+    """The fitness values of a population of solutions for a list of goals.
+
+    Retrieving a fitness value from a chromosome requires checking its computation
+    cache.  Ranking and crowding a population compare the fitness values of the
+    same solutions many times, thus the matrix retrieves every value only once and
+    stores it in a row per solution and a column per goal.
+    """
+
+    def __init__(
+        self, solutions: list[C], goals: OrderedSet[ff.FitnessFunction]
+    ) -> None:
+        """Retrieves the fitness values of the solutions.
+
+        Args:
+            solutions: The solutions, i.e., the rows of the matrix
+            goals: The goals, i.e., the columns of the matrix
+        """
+        self._solutions = solutions
+        self._indices = {
+            id(solution): index for index, solution in enumerate(solutions)
+        }
+        self._rows: list[list[float]] = [
+            solution.get_fitness_values(goals) for solution in solutions
+        ]
+        self._columns: list[tuple[float, ...]] = (
+            list(zip(*self._rows, strict=True)) if goals and solutions else []
+        )
+        self._goals = list(goals)
+        self._lengths: list[int] | None = None
+
+    @property
+    def goals(self) -> list[ff.FitnessFunction]:
+        """Provides the goals, i.e., the columns of the matrix.
+
+        Returns:
+            The goals
+        """
+        return self._goals
+
+    @property
+    def number_of_goals(self) -> int:
+        """Provides the number of goals, i.e., columns of the matrix.
+
+        Returns:
+            The number of goals
+        """
+        return len(self._goals)
+
+    def row(self, solution: C) -> list[float]:
+        """Provides the fitness values of a solution for all goals.
+
+        Args:
+            solution: A solution of the matrix
+
+        Returns:
+            The fitness values of the solution, in the order of the goals
+        """
+        return self._rows[self._indices[id(solution)]]
+
+    def index_of(self, solution: C) -> int | None:
+        """Provides the index of the row of a solution.
+
+        Args:
+            solution: A solution
+
+        Returns:
+            The index of the row of the solution, None, if it is not in the matrix
+        """
+        return self._indices.get(id(solution))
+
+    def best_for_goal(
+        self,
+        goal_index: int,
+        candidates: Iterable[int] | None = None,
+        incumbent: int | None = None,
+    ) -> C:
+        """Selects the solution with the best fitness value for the given goal.
+
+        Ties are broken by preferring the shorter solution and, if the lengths
+        are equal, randomly, exactly like the PreferenceSortingComparator.
+
+        Args:
+            goal_index: The index of the goal
+            candidates: The indices of the solutions to consider, all solutions
+                if None
+            incumbent: The index of a solution that is known to be at least as good
+                as all solutions that are not candidates
+
+        Returns:
+            The best solution for the goal
+        """
+        if self._lengths is None:
+            self._lengths = [solution.length() for solution in self._solutions]
+        lengths = self._lengths
+        column = self._columns[goal_index]
+        if candidates is None:
+            candidates = range(len(column))
+        best = incumbent
+        for index in candidates:
+            if best is None:
+                best = index
+                continue
+            value = column[index]
+            best_value = column[best]
+            if value < best_value or (
+                value == best_value
+                and (
+                    lengths[index] < lengths[best]
+                    or (lengths[index] == lengths[best] and randomness.next_bool())
+                )
+            ):
+                best = index
+        assert best is not None, "No solution to select from"
+        return self._solutions[best]
+
+    def dominance(self, solution_1: C, solution_2: C) -> int:
+        """Compares two solutions regarding their dominance on all goals.
+
+        Args:
+            solution_1: The first solution
+            solution_2: The second solution
+
+        Returns:
+            -1 if solution_1 dominates solution_2; 1 if solution_1 is dominated by
+            solution_2; 0 otherwise
+        """
+        return dominance(self.row(solution_1), self.row(solution_2))
+
+    def columns_for(self, solutions: list[C]) -> list[tuple[float, ...]]:
+        """Provides the columns of the matrix restricted to the given solutions.
+
+        Args:
+            solutions: Solutions of the matrix
+
+        Returns:
+            A column per goal, holding the values of the solutions in their order
+        """
+        if not solutions or not self._goals:
+            return []
+        return list(zip(*(self.row(solution) for solution in solutions), strict=True))
+
+
 @dataclass
 class RankedFronts(Generic[C]):
     """Contains the ranked fronts."""
 
     fronts: list[list[C]] | None = None
 
+    # The fitness values the fronts were ranked by, for reuse by crowding.
+    fitness_matrix: FitnessMatrix[C] | None = field(default=None, compare=False)
+
     def get_sub_front(self, rank: int) -> list[C]:
         """Returns the sub-front of chromosome objects of the given rank.
 
@@ -90,11 +257,23 @@ class RankingFunction(Generic[C], metaclass=ABCMeta):
 
 
 class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
-    """Ranks the test cases according to the preference criterion defined for MOSA."""
+    """Ranks the test cases according to the preference criterion defined for MOSA.
+
+    The best solution for every goal is remembered between rankings.  The solutions
+    ranked by MOSA and DynaMOSA are the previous population, which was ranked
+    before, and the offspring, thus the best solution for a goal only needs to be
+    compared with the offspring, as long as it survived.
+    """
 
     _logger = logging.getLogger(__name__)
 
-    def compute_ranking_assignment(  # noqa: C901,D102
+    def __init__(self) -> None:  # noqa: D107
+        self._best_for_goal: dict[ff.FitnessFunction, C] = {}
+        # The solutions of the previous ranking by their id.  The solutions are
+        # referenced to keep their ids from being reused by new solutions.
+        self._ranked_solutions: dict[int, C] = {}
+
+    def compute_ranking_assignment(  # noqa: D102
         self, solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
     ) -> RankedFronts:
         if not solutions:
@@ -102,99 +281,123 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
             return RankedFronts()
 
         fronts = []
+        fitness_matrix: FitnessMatrix[C] = FitnessMatrix(solutions, uncovered_goals)
 
         # First apply the "preference sorting" to the first front only then compute
         # the ranks according to the non-dominate sorting algorithm
-        zero_front: list[C] = self._get_zero_front(solutions, uncovered_goals)
+        zero_front: list[C] = self._get_zero_front(solutions, fitness_matrix)
         fronts.append(zero_front)
         front_index = 1
 
+        zero_front_ids = {id(element) for element in zero_front}
+        remaining = [
+            solution for solution in solutions if id(solution) not in zero_front_ids
+        ]
         if len(zero_front) < config.configuration.search_algorithm.population:
             ranked_solutions = len(zero_front)
-            comparator: DominanceComparator[C] = DominanceComparator(
-                goals=uncovered_goals
-            )
-
-            remaining: list[C] = []
-            remaining.extend(solutions)
-            for element in zero_front:
-                if element in remaining:
-                    remaining.remove(element)
-
-            while (
-                ranked_solutions < config.configuration.search_algorithm.population
-                and len(remaining) > 0
-            ):
-                new_front: list[C] = self._get_non_dominated_solutions(
-                    remaining, comparator, front_index
-                )
-                fronts.append(new_front)
+            for new_front in self._get_non_dominated_fronts(remaining, fitness_matrix):
+                if ranked_solutions >= config.configuration.search_algorithm.population:
+                    break
                 for element in new_front:
-                    if element in remaining:
-                        remaining.remove(element)
+                    element.rank = front_index
+                fronts.append(new_front)
                 ranked_solutions += len(new_front)
                 front_index += 1
 
         else:
-            remaining = []
-            remaining.extend(solutions)
-            for element in zero_front:
-                if element in remaining:
-                    remaining.remove(element)
             for element in remaining:
                 element.rank = front_index
             fronts.append(remaining)
 
-        return RankedFronts(fronts)
+        return RankedFronts(fronts, fitness_matrix)
 
-    @staticmethod
     def _get_zero_front(
-        solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
+        self, solutions: list[C], fitness_matrix: FitnessMatrix[C]
     ) -> list[C]:
+        new_solutions = [
+            index
+            for index, solution in enumerate(solutions)
+            if id(solution) not in self._ranked_solutions
+        ]
+        best_for_goal: dict[ff.FitnessFunction, C] = {}
         zero_front: OrderedSet[C] = OrderedSet()
-        for goal in uncovered_goals:
-            comparator: PreferenceSortingComparator[C] = PreferenceSortingComparator(
-                goal
+        for goal_index, goal in enumerate(fitness_matrix.goals):
+            incumbent = self._best_for_goal.get(goal)
+            incumbent_index = (
+                None if incumbent is None else fitness_matrix.index_of(incumbent)
             )
-            best: C | None = None
-            for solution in solutions:
-                flag = comparator.compare(solution, best)
-                if flag < 0 or (flag == 0 and randomness.next_bool()):
-                    best = solution
-            assert best is not None
-
+            if incumbent_index is None:
+                best = fitness_matrix.best_for_goal(goal_index)
+            else:
+                best = fitness_matrix.best_for_goal(
+                    goal_index, new_solutions, incumbent_index
+                )
+            best_for_goal[goal] = best
             best.rank = 0
             zero_front.add(best)
+        # Only keep the goals of this ranking, which drops the covered goals.
+        self._best_for_goal = best_for_goal
+        self._ranked_solutions = {id(solution): solution for solution in solutions}
         return list(zero_front)
 
     @staticmethod
-    def _get_non_dominated_solutions(
-        solutions: list[C], comparator: DominanceComparator[C], front_index: int
-    ) -> list[C]:
-        front: list[C] = []
-        for solution in solutions:
-            is_dominated = False
-            dominated_solutions: list[C] = []
-            for best in front:
-                flag = comparator.compare(solution, best)
-                if flag < 0:
-                    dominated_solutions.append(best)
-                if flag > 0:
-                    is_dominated = True
-                    break
-            if is_dominated:
-                continue
+    def _get_non_dominated_fronts(
+        solutions: list[C], fitness_matrix: FitnessMatrix[C]
+    ) -> Iterator[list[C]]:
+        """Sorts the solutions into fronts of non-dominated solutions.
+
+        Implements the fast non-dominated sorting of Deb et al. in
+        K. Deb, A. Pratap, S. Agarwal, and T. Meyarivan, “A Fast and Elitist
+        Multiobjective Genetic Algorithm: NSGA-II”, IEEE Transactions on Evolutionary
+        Computation, vol. 6, no. 2, 2002, pp. 182-197.
+        Every pair of solutions is compared once to count by how many solutions
+        each solution is dominated; the fronts are then peeled off by decrementing
+        these counts.  The solutions of every front keep their relative order.
 
-            solution.rank = front_index
-            front.append(solution)
-            for dominated_solution in dominated_solutions:
-                if dominated_solution in front:
-                    front.remove(dominated_solution)
-        return front
+        Args:
+            solutions: The solutions to sort
+            fitness_matrix: The fitness values of the solutions
+
+        Yields:
+            The fronts, starting with the non-dominated front
+        """
+        rows = [fitness_matrix.row(solution) for solution in solutions]
+        sums = [sum(row) for row in rows]
+        domination_counts = [0] * len(solutions)
+        dominated: list[list[int]] = [[] for _ in solutions]
+        # A solution can only dominate solutions with a larger or equal sum of
+        # fitness values, thus pairs are visited in the order of these sums, and
+        # only pairs with equal sums need to be checked in both directions.
+        order = sorted(range(len(solutions)), key=sums.__getitem__)
+        for position, index_1 in enumerate(order):
+            row_1 = rows[index_1]
+            sum_1 = sums[index_1]
+            for index_2 in order[position + 1 :]:
+                row_2 = rows[index_2]
+                if not any(map(operator.gt, row_1, row_2)):
+                    if sum_1 < sums[index_2] or any(map(operator.lt, row_1, row_2)):
+                        dominated[index_1].append(index_2)
+                        domination_counts[index_2] += 1
+                elif sum_1 == sums[index_2] and not any(map(operator.lt, row_1, row_2)):
+                    dominated[index_2].append(index_1)
+                    domination_counts[index_1] += 1
+
+        front = [index for index, count in enumerate(domination_counts) if count == 0]
+        while front:
+            yield [solutions[index] for index in front]
+            next_front = []
+            for index_1 in front:
+                for index_2 in dominated[index_1]:
+                    domination_counts[index_2] -= 1
+                    if domination_counts[index_2] == 0:
+                        next_front.append(index_2)
+            front = sorted(next_front)
 
 
 def fast_epsilon_dominance_assignment(
-    front: list[C], goals: OrderedSet[ff.FitnessFunction]
+    front: list[C],
+    goals: OrderedSet[ff.FitnessFunction],
+    fitness_matrix: FitnessMatrix[C] | None = None,
 ) -> None:
     """Implements a “fast” version of the variant of the crowding distance.
 
@@ -206,30 +409,21 @@ def fast_epsilon_dominance_assignment(
     Args:
         front: Front of non-dominated solutions/tests
         goals: Set of goals/targets (e.g., branches) to consider
+        fitness_matrix: The fitness values of the front for the goals, if they were
+            already retrieved, e.g., when ranking the front
     """
-    for test in front:
-        test.distance = 0
-
-    for goal in goals:
-        minimum = sys.float_info.max
-        min_set: list[C] = []
-        maximum = 0.0
-        for test in front:
-            value = test.get_fitness_for(goal)
-            if value < minimum:
-                minimum = value
-                min_set.clear()
-                min_set.append(test)
-            elif value == minimum:
-                min_set.append(test)
-
-            if value > maximum:
-                maximum = value
-
-        if maximum == minimum:
+    if fitness_matrix is None:
+        fitness_matrix = FitnessMatrix(front, goals)
+    distances = [0.0] * len(front)
+    for values in fitness_matrix.columns_for(front):
+        minimum = min(values)
+        if minimum == max(values):
             continue
-
-        for test in min_set:
-            numerator = len(front) - len(min_set)
-            denominator = len(front)
-            test.distance = max(test.distance, numerator / denominator)
+        min_set_size = values.count(minimum)
+        share = (len(front) - min_set_size) / len(front)
+        for index, value in enumerate(values):
+            if value == minimum:
+                distances[index] = max(distances[index], share)
+
+    for test, distance in zip(front, distances, strict=True):
+        test.distance = distance
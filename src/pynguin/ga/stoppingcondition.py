@@ -90,6 +90,15 @@ class StoppingCondition(so.SearchObserver, ExecutionObserver, metaclass=ABCMeta)
         """
         return self._observes_execution
 
+    @property
+    def rewrites_statements(self) -> bool:  # noqa: D102
+        return False
+
+    @property
+    def supports_prefix_snapshots(self) -> bool:  # noqa: D102
+        # Executions in snapshot processes cannot be counted.
+        return not self._observes_execution
+
     def before_test_case_execution(self, test_case: tc.TestCase):
         """Not used.
 
@@ -394,6 +403,11 @@ class MaxTestExecutionsStoppingCondition(StoppingCondition):
     def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
         self._num_executed_tests += 1
 
+    def after_remote_test_case_execution(  # noqa: D102
+        self, test_case: tc.TestCase, executed_statements: int
+    ) -> None:
+        self._num_executed_tests += 1
+
     def __str__(self):
         return f"Executed test cases: {self.current_value()}/{self.limit()}"
 
@@ -436,6 +450,11 @@ class MaxStatementExecutionsStoppingCondition(StoppingCondition):
         self._num_executed_statements += 1
         return node
 
+    def after_remote_test_case_execution(  # noqa: D102
+        self, test_case: tc.TestCase, executed_statements: int
+    ) -> None:
+        self._num_executed_statements += executed_statements
+
     def __str__(self):
         return f"Executed statements: {self.current_value()}/{self.limit()}"
 
@@ -7,10 +7,14 @@
 """Provides a chromosome for a single test case."""
 from __future__ import annotations
 
+import copy
+
 from typing import TYPE_CHECKING
+from typing import Any
 
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
+import pynguin.testcase.execution as ex
 import pynguin.testcase.statement as stmt
 
 from pynguin.utils import randomness
@@ -24,8 +28,53 @@ if TYPE_CHECKING:
     from pynguin.testcase.execution import ExecutionResult
 
 
+class _TestCaseOwners:
+    """Counts the chromosomes that share a test case.
+
+    Cloning a chromosome does not clone its test case; instead, both chromosomes
+    share the test case until one of them modifies it.  Only then, the modifying
+    chromosome clones the test case and becomes its sole owner.
+    """
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 1
+
+
+class _ShedExecutionTrace(ex.ExecutionTrace):
+    """Stands in for an execution trace that was shed to save memory.
+
+    Reading it raises an error, such that a shed trace is not mistaken for a trace
+    without any coverage.
+    """
+
+    _ERROR = "The execution trace was shed, the test case has to be executed again"
+
+    def __init__(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        raise RuntimeError(self._ERROR)
+
+    def __eq__(self, other: Any) -> bool:
+        raise RuntimeError(self._ERROR)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return "_ShedExecutionTrace()"
+
+
 class TestCaseChromosome(chrom.Chromosome):
-    """A chromosome that encodes a single test case."""
+    """A chromosome that encodes a single test case.
+
+    The test case is shared copy-on-write between a chromosome and its clones, see
+    _TestCaseOwners.  It is only cloned when it is modified, which is done through
+    _own_test_case() internally and the test_case property from outside.  Code that
+    only reads the test case, e.g., to execute it, uses the read_only_test_case
+    property instead, which never clones it.
+    """
 
     def __init__(
         self,
@@ -48,26 +97,69 @@ class TestCaseChromosome(chrom.Chromosome):
                 test_case is not None
             ), "Cannot create test case chromosome without test case"
             self._test_case: tc.TestCase = test_case
+            self._test_case_owners = _TestCaseOwners()
             self._test_factory: tf.TestFactory | None = test_factory
             self.changed = True
             self._last_execution_result: ExecutionResult | None = None
+            self._execution_trace_shed = False
             self._num_mutations = 0
         else:
-            self._test_case = orig._test_case.clone()
+            self._test_case = orig._test_case
+            self._test_case_owners = orig._test_case_owners
+            self._test_case_owners.count += 1
             self._test_factory = orig._test_factory
             self.changed = orig.changed
             self._last_execution_result = orig._last_execution_result
+            self._execution_trace_shed = orig._execution_trace_shed
             self._num_mutations = orig._num_mutations
 
     @property
     def test_case(self) -> tc.TestCase:
         """The test case that is wrapped by this chromosome.
 
+        The caller might modify the test case, thus a test case that is shared with
+        other chromosomes is cloned first.
+
+        Returns:
+            the wrapped test case.
+        """
+        return self._own_test_case()
+
+    @property
+    def read_only_test_case(self) -> tc.TestCase:
+        """The test case that is wrapped by this chromosome, for reading only.
+
+        The test case might be shared with other chromosomes, thus the caller must
+        not modify it.
+
         Returns:
             the wrapped test case.
         """
         return self._test_case
 
+    def _own_test_case(self) -> tc.TestCase:
+        """Provides the test case, after cloning it if it is shared.
+
+        Returns:
+            The test case, which is not shared with another chromosome.
+        """
+        if self._test_case_owners.count > 1:
+            self._replace_test_case(self._test_case.clone(), _TestCaseOwners())
+        return self._test_case
+
+    def _replace_test_case(
+        self, test_case: tc.TestCase, owners: _TestCaseOwners
+    ) -> None:
+        """Replaces the test case, giving up the ownership of the current one.
+
+        Args:
+            test_case: The new test case
+            owners: The owners of the new test case, which include this chromosome
+        """
+        self._test_case_owners.count -= 1
+        self._test_case = test_case
+        self._test_case_owners = owners
+
     def num_mutations(self) -> int:
         """The number of mutations.
 
@@ -91,18 +183,18 @@ class TestCaseChromosome(chrom.Chromosome):
         ), "Cannot perform crossover with " + str(type(other))
         assert self._test_factory is not None, "Crossover requires a test factory."
 
-        offspring_test_case = self.test_case.clone(position1)
+        offspring_test_case = self._test_case.clone(position1)
 
-        for j in range(position2, other.test_case.size()):
+        for j in range(position2, other._test_case.size()):
             self._test_factory.append_statement(
-                offspring_test_case, other.test_case.get_statement(j)
+                offspring_test_case, other._test_case.get_statement(j)
             )
 
         if (
             offspring_test_case.size()
             < config.configuration.search_algorithm.chromosome_length
         ):
-            self._test_case = offspring_test_case
+            self._replace_test_case(offspring_test_case, _TestCaseOwners())
             self.changed = True
 
     def mutate(self) -> None:  # noqa: D102
@@ -114,11 +206,14 @@ class TestCaseChromosome(chrom.Chromosome):
         ):
             last_mutatable_position = self.get_last_mutatable_statement()
             if last_mutatable_position is not None:
-                self._test_case.chop(last_mutatable_position)
+                self._own_test_case().chop(last_mutatable_position)
                 changed = True
 
-        # In case mutation removes all calls on the SUT.
-        backup = self.test_case.clone()
+        # In case mutation removes all calls on the SUT.  The backup shares the test
+        # case, which is thus only cloned if a mutation operator modifies it.
+        backup = self._test_case
+        backup_owners = self._test_case_owners
+        backup_owners.count += 1
 
         if (
             randomness.next_float()
@@ -143,8 +238,10 @@ class TestCaseChromosome(chrom.Chromosome):
 
         assert self._test_factory, "Required for mutation"
         if not self._test_factory.has_call_on_sut(self._test_case):
-            self._test_case = backup
+            self._replace_test_case(backup, backup_owners)
             self._mutation_insert()
+        else:
+            backup_owners.count -= 1
 
         if changed:
             self.changed = True
@@ -166,7 +263,9 @@ class TestCaseChromosome(chrom.Chromosome):
 
     def _delete_statement(self, idx: int) -> bool:
         assert self._test_factory, "Mutation requires a test factory."
-        return self._test_factory.delete_statement_gracefully(self._test_case, idx)
+        return self._test_factory.delete_statement_gracefully(
+            self._own_test_case(), idx
+        )
 
     def _mutation_change(self) -> bool:
         last_mutatable_statement = self.get_last_mutatable_statement()
@@ -178,7 +277,7 @@ class TestCaseChromosome(chrom.Chromosome):
         position = 0
         while position <= last_mutatable_statement:
             if randomness.next_float() < p_per_statement:
-                statement = self._test_case.get_statement(position)
+                statement = self._own_test_case().get_statement(position)
                 if not isinstance(statement, stmt.VariableCreatingStatement):
                     continue
                 old_distance = statement.ret_val.distance
@@ -224,7 +323,7 @@ class TestCaseChromosome(chrom.Chromosome):
                 max_position += 1
 
             position = self._test_factory.insert_random_statement(
-                self._test_case, max_position
+                self._own_test_case(), max_position
             )
             exponent += 1
             if 0 <= position < self.size():
@@ -269,10 +368,35 @@ class TestCaseChromosome(chrom.Chromosome):
             result: The last execution result
         """
         self._last_execution_result = result
+        self._execution_trace_shed = False
 
     def remove_last_execution_result(self) -> None:
         """Removes the last execution result."""
         self._last_execution_result = None
+        self._execution_trace_shed = False
+
+    @property
+    def execution_trace_shed(self) -> bool:
+        """Whether the execution trace of the last execution result was shed.
+
+        Returns:
+            Whether the test case has to be executed again to obtain its trace.
+        """
+        return self._execution_trace_shed
+
+    def shed_execution_trace(self) -> None:
+        """Drops the execution trace of the last execution result to save memory.
+
+        The remaining parts of the result, e.g., the raised exceptions, are kept, as
+        are the cached fitness values.  The trace is recomputed by executing the
+        test case again, once it is needed; reading it before raises an error.
+        """
+        if self._last_execution_result is None or self._execution_trace_shed:
+            return
+        result = copy.copy(self._last_execution_result)
+        result.execution_trace = _ShedExecutionTrace()
+        self._last_execution_result = result
+        self._execution_trace_shed = True
 
     def is_failing(self) -> bool:
         """Returns whether or not the encapsulated test case is a failing test.
@@ -304,7 +428,12 @@ class TestCaseChromosome(chrom.Chromosome):
         if (left := self._last_execution_result) is not None and (  # noqa: SIM102
             right := other._last_execution_result
         ) is not None:
-            if left.execution_trace != right.execution_trace:
+            # A shed trace is unknown, so it might differ from the other one.
+            if (
+                self._execution_trace_shed
+                or other._execution_trace_shed
+                or left.execution_trace != right.execution_trace
+            ):
                 return False
         return self._test_case == other._test_case
 
@@ -12,6 +12,7 @@ from typing import Any
 
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
+import pynguin.testcase.execution as ex
 
 from pynguin.utils import randomness
 
@@ -46,11 +47,13 @@ class TestSuiteChromosome(chrom.Chromosome):
                 cf.ChromosomeFactory[tcc.TestCaseChromosome]
             ) = test_case_chromosome_factory
             self._test_case_chromosomes: list[tcc.TestCaseChromosome] = []
+            self._aggregated_trace = ex.AggregatedExecutionTrace()
         else:
             self._test_case_chromosomes = [
                 chromosome.clone() for chromosome in orig._test_case_chromosomes
             ]
             self._test_case_chromosome_factory = orig._test_case_chromosome_factory
+            self._aggregated_trace = orig._aggregated_trace.clone()
 
     def add_test_case_chromosome(self, test: tcc.TestCaseChromosome) -> None:
         """Adds a test case chromosome to the test suite.
@@ -111,6 +114,22 @@ class TestSuiteChromosome(chrom.Chromosome):
         """
         return self._test_case_chromosomes
 
+    @property
+    def aggregated_trace(self) -> ex.AggregatedExecutionTrace:
+        """Provides the merged trace of the results of the test cases.
+
+        Returns:
+            The aggregated trace, which is updated incrementally
+        """
+        return self._aggregated_trace
+
+    def shed_aggregated_trace(self) -> None:
+        """Drops the aggregated trace to save memory.
+
+        It is merged again from the results of the test cases, once it is needed.
+        """
+        self._aggregated_trace = ex.AggregatedExecutionTrace()
+
     def set_test_case_chromosome(
         self, index: int, test: tcc.TestCaseChromosome
     ) -> None:
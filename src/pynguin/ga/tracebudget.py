@@ -0,0 +1,169 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019-2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a memory budget for the execution traces kept by chromosomes.
+
+Every chromosome keeps the execution result of its last execution, including the
+full execution trace.  The fitness values of a chromosome are cached per goal,
+though, so the trace of an unchanged chromosome is only needed again when the
+fitness for a new goal is computed, or when the chromosome becomes part of a
+result.  Once the traces of the chromosomes the search retains exceed the budget,
+the traces of chromosomes that are not elite are dropped, largest first, and are
+recomputed by executing the test case again, once they are needed.
+"""
+from __future__ import annotations
+
+import dataclasses
+
+from typing import TYPE_CHECKING
+
+import pynguin.ga.testcasechromosome as tcc
+import pynguin.ga.testsuitechromosome as tsc
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pynguin.ga.chromosome as chrom
+
+    from pynguin.testcase.execution import ExecutionTrace
+
+
+@dataclasses.dataclass
+class _RetainedTrace:
+    size: int
+    holders: list[chrom.Chromosome] = dataclasses.field(default_factory=list)
+    elite: bool = False
+
+
+class ExecutionTraceBudget:
+    """Sheds the execution traces of non-elite chromosomes to stay within a budget.
+
+    A trace is only freed once every chromosome that holds it has shed it.  Test
+    case chromosomes hold the trace of their last execution result, test suite
+    chromosomes additionally hold the traces merged into their aggregated trace.
+    """
+
+    def __init__(self, budget: int) -> None:
+        """Initializes the budget.
+
+        Args:
+            budget: The number of bytes the retained traces may occupy
+        """
+        self._budget = budget
+        self._saved_memory = 0
+
+    @property
+    def budget(self) -> int:
+        """Provides the number of bytes the retained traces may occupy.
+
+        Returns:
+            The budget in bytes
+        """
+        return self._budget
+
+    @property
+    def saved_memory(self) -> int:
+        """Provides the approximate number of bytes of all traces shed so far.
+
+        Returns:
+            The shed bytes
+        """
+        return self._saved_memory
+
+    def enforce(
+        self,
+        retained: Iterable[chrom.Chromosome],
+        elite: Iterable[chrom.Chromosome],
+    ) -> int:
+        """Sheds traces of retained chromosomes until the budget is met.
+
+        Traces that are also held by an elite chromosome are never shed.
+
+        Args:
+            retained: The chromosomes the search keeps, e.g., its population
+            elite: The chromosomes whose traces must be kept, e.g., the archive
+
+        Returns:
+            The approximate number of bytes that were shed
+        """
+        traces: dict[int, _RetainedTrace] = {}
+        held: dict[int, list[int]] = {}
+        for chromosome in elite:
+            self._register(chromosome, traces, held, elite=True)
+        for chromosome in retained:
+            self._register(chromosome, traces, held, elite=False)
+
+        total = sum(trace.size for trace in traces.values())
+        if total <= self._budget:
+            return 0
+        remaining_holders = {
+            trace_id: len(trace.holders) for trace_id, trace in traces.items()
+        }
+        shed: set[int] = set()
+        saved = 0
+        for trace in sorted(
+            (trace for trace in traces.values() if not trace.elite),
+            key=lambda trace: trace.size,
+            reverse=True,
+        ):
+            if total - saved <= self._budget:
+                break
+            for holder in trace.holders:
+                if id(holder) in shed:
+                    continue
+                shed.add(id(holder))
+                _shed(holder)
+                for trace_id in held[id(holder)]:
+                    remaining_holders[trace_id] -= 1
+                    if remaining_holders[trace_id] == 0:
+                        saved += traces[trace_id].size
+        self._saved_memory += saved
+        return saved
+
+    @staticmethod
+    def _register(
+        chromosome: chrom.Chromosome,
+        traces: dict[int, _RetainedTrace],
+        held: dict[int, list[int]],
+        *,
+        elite: bool,
+    ) -> None:
+        if id(chromosome) in held:
+            return
+        held_traces: list[ExecutionTrace] = []
+        if isinstance(chromosome, tsc.TestSuiteChromosome):
+            aggregated_trace = chromosome.aggregated_trace
+            held_traces.append(aggregated_trace.trace)
+            held_traces.extend(
+                result.execution_trace for result in aggregated_trace.results
+            )
+            for test in chromosome.test_case_chromosomes:
+                ExecutionTraceBudget._register(test, traces, held, elite=elite)
+        elif (
+            isinstance(chromosome, tcc.TestCaseChromosome)
+            and not chromosome.execution_trace_shed
+            and (result := chromosome.get_last_execution_result()) is not None
+        ):
+            held_traces.append(result.execution_trace)
+
+        unique_traces = {id(trace): trace for trace in held_traces}
+        for trace_id, execution_trace in unique_traces.items():
+            if (trace := traces.get(trace_id)) is None:
+                trace = traces[trace_id] = _RetainedTrace(
+                    execution_trace.approximate_size()
+                )
+            trace.holders.append(chromosome)
+            trace.elite |= elite
+        held[id(chromosome)] = list(unique_traces)
+
+
+def _shed(chromosome: chrom.Chromosome) -> None:
+    if isinstance(chromosome, tsc.TestSuiteChromosome):
+        chromosome.shed_aggregated_trace()
+    else:
+        assert isinstance(chromosome, tcc.TestCaseChromosome)
+        chromosome.shed_execution_trace()
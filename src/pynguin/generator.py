@@ -47,12 +47,15 @@ from pynguin.analyses.constants import EmptyConstantProvider
 from pynguin.analyses.constants import RestrictedConstantPool
 from pynguin.analyses.constants import collect_static_constants
 from pynguin.analyses.module import generate_test_cluster
-from pynguin.instrumentation.machinery import InstrumentationFinder
 from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.instrumentation.machinery import reinstrument
 from pynguin.slicer.statementslicingobserver import StatementSlicingObserver
 from pynguin.testcase import export
 from pynguin.testcase.execution import AssertionExecutionObserver
+from pynguin.testcase.execution import ExecutionResultCache
 from pynguin.testcase.execution import ExecutionTracer
+from pynguin.testcase.execution import ParallelTestCaseExecutor
+from pynguin.testcase.execution import PrefixSnapshotTestCaseExecutor
 from pynguin.testcase.execution import TestCaseExecutor
 from pynguin.utils import randomness
 from pynguin.utils.report import get_coverage_report
@@ -64,6 +67,7 @@ from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 if TYPE_CHECKING:
     from pynguin.analyses.module import ModuleTestCluster
     from pynguin.ga.algorithms.generationalgorithm import GenerationAlgorithm
+    from pynguin.testcase.execution import InstrumentationProfile
 
 
 @enum.unique
@@ -157,6 +161,52 @@ def _setup_import_hook(
     return tracer
 
 
+def _get_instrumented_coverage_metrics() -> set[config.CoverageMetric]:
+    """Provides the coverage metrics to instrument the module under test for.
+
+    Besides the metrics that guide the search, these are the metrics that are only
+    computed on the final test suite.  Their probes are not traced during the
+    search, but switched on afterwards, such that the module is not reloaded.
+
+    Returns:
+        The coverage metrics to instrument the module under test for
+    """
+    coverage_metrics = set(config.configuration.statistics_output.coverage_metrics)
+    output_variables = config.configuration.statistics_output.output_variables
+    if RuntimeVariable.FinalLineCoverage in output_variables:
+        coverage_metrics.add(config.CoverageMetric.LINE)
+    if RuntimeVariable.FinalBranchCoverage in output_variables:
+        coverage_metrics.add(config.CoverageMetric.BRANCH)
+    if RuntimeVariable.AssertionCheckedCoverage in output_variables:
+        coverage_metrics.add(config.CoverageMetric.CHECKED)
+    return coverage_metrics
+
+
+def _get_search_instrumented_coverage_metrics() -> set[config.CoverageMetric]:
+    """Provides the coverage metrics the module under test runs with during search.
+
+    Checked coverage is only instrumented during the search if it guides the
+    search.  Its probes surround every memory access and every call, and each one
+    is still a call when it is not traced, which made a loop-heavy function run
+    about twice as long as with the branch coverage probes alone.  If only the
+    assertion checked coverage of the final test suite needs these probes, the
+    module is imported with them, such that the import is traced, and its
+    functions are switched to code without them for the search, see
+    _setup_and_check and _track_final_metrics.
+
+    Returns:
+        The coverage metrics to instrument the functions of the module under test
+        for during the search
+    """
+    coverage_metrics = _get_instrumented_coverage_metrics()
+    if (
+        config.CoverageMetric.CHECKED
+        not in config.configuration.statistics_output.coverage_metrics
+    ):
+        coverage_metrics.discard(config.CoverageMetric.CHECKED)
+    return coverage_metrics
+
+
 def _load_sut(tracer: ExecutionTracer) -> bool:
     try:
         # We need to set the current thread ident so the import trace is recorded.
@@ -244,12 +294,19 @@ def _setup_and_check() -> (
     if not _setup_path():
         return None
     wrapped_constant_provider, dynamic_constant_provider = _setup_constant_seeding()
-    tracer = _setup_import_hook(
-        set(config.configuration.statistics_output.coverage_metrics),
-        dynamic_constant_provider,
-    )
+    instrumented_metrics = _get_instrumented_coverage_metrics()
+    tracer = _setup_import_hook(instrumented_metrics, dynamic_constant_provider)
     if not _load_sut(tracer):
         return None
+    if (search_metrics := _get_search_instrumented_coverage_metrics()) != (
+        instrumented_metrics
+    ):
+        reinstrument(tracer, search_metrics, dynamic_constant_provider)
+    tracer.set_traced_coverage_metrics(
+        config.configuration.statistics_output.coverage_metrics
+    )
+    if config.configuration.statistics_output.profile_instrumentation:
+        tracer.enable_profiling()
     if not _setup_report_dir():
         return None
 
@@ -261,11 +318,31 @@ def _setup_and_check() -> (
 
     # Make alias to make the following lines shorter...
     stop = config.configuration.stopping
-    executor = TestCaseExecutor(
-        tracer,
-        maximum_test_execution_timeout=stop.maximum_test_execution_timeout,
-        test_execution_time_per_statement=stop.test_execution_time_per_statement,
-    )
+    execution = config.configuration.test_execution
+    executor: TestCaseExecutor
+    if execution.number_of_execution_processes > 1:
+        executor = ParallelTestCaseExecutor(
+            tracer,
+            maximum_test_execution_timeout=stop.maximum_test_execution_timeout,
+            test_execution_time_per_statement=stop.test_execution_time_per_statement,
+            number_of_processes=execution.number_of_execution_processes,
+        )
+    elif execution.number_of_prefix_snapshots > 0:
+        executor = PrefixSnapshotTestCaseExecutor(
+            tracer,
+            maximum_test_execution_timeout=stop.maximum_test_execution_timeout,
+            test_execution_time_per_statement=stop.test_execution_time_per_statement,
+            number_of_snapshots=execution.number_of_prefix_snapshots,
+            snapshot_interval=execution.prefix_snapshot_interval,
+        )
+    else:
+        executor = TestCaseExecutor(
+            tracer,
+            maximum_test_execution_timeout=stop.maximum_test_execution_timeout,
+            test_execution_time_per_statement=stop.test_execution_time_per_statement,
+        )
+    if (cache_budget := execution.execution_result_cache_memory_budget) > 0:
+        executor.set_result_cache(ExecutionResultCache(cache_budget * 1024 * 1024))
     _track_sut_data(tracer, test_cluster)
     _setup_random_number_generator()
     return executor, test_cluster, wrapped_constant_provider
@@ -342,28 +419,6 @@ def _get_coverage_ff_from_algorithm(
     return test_suite_coverage_func
 
 
-def _reload_instrumentation_loader(
-    coverage_metrics: set[config.CoverageMetric],
-    dynamic_constant_provider: DynamicConstantProvider | None,
-    tracer: ExecutionTracer,
-):
-    module_name = config.configuration.module_name
-    module = importlib.import_module(module_name)
-    tracer.current_thread_identifier = threading.current_thread().ident
-    first_finder: InstrumentationFinder | None = None
-    for finder in sys.meta_path:
-        if isinstance(finder, InstrumentationFinder):
-            first_finder = finder
-            break
-    assert first_finder is not None
-    first_finder.update_instrumentation_metrics(
-        tracer=tracer,
-        coverage_metrics=coverage_metrics,
-        dynamic_constant_provider=dynamic_constant_provider,
-    )
-    importlib.reload(module)
-
-
 def _reset_cache_for_result(generation_result):
     generation_result.invalidate_cache()
     for test_case in generation_result.test_case_chromosomes:
@@ -379,17 +434,20 @@ def _track_final_metrics(
 ) -> set[config.CoverageMetric]:
     """Track the final coverage metrics.
 
-    Re-loads all required instrumentations for metrics that were not already
-    calculated and tracked during the result generation.
-    These metrics are then also calculated on the result, which is executed
-    once again with the new instrumentation.
+    Switches on the tracing of all metrics that were not already calculated and
+    tracked during the result generation.  The module under test is already
+    instrumented for them, see _get_instrumented_coverage_metrics, and its
+    functions are switched back to the code with the probes of checked coverage, if
+    they ran without them during the search.  These metrics are then also
+    calculated on the result, which is executed once again if additional data has
+    to be traced.
 
     Args:
         algorithm: the used test-generation algorithm
         executor: the testcase executor of the run
         generation_result: the generated testsuite containing assertions
         constant_provider: the constant provider required for the
-            reloading of the module
+            re-instrumentation of the module
 
     Returns:
         The set of tracked coverage metrics, including the ones that we optimised for.
@@ -397,7 +455,7 @@ def _track_final_metrics(
     output_variables = config.configuration.statistics_output.output_variables
     # Alias for shorter lines
     cov_metrics = config.configuration.statistics_output.coverage_metrics
-    metrics_for_reinstrumenation: set[config.CoverageMetric] = set(cov_metrics)
+    traced_metrics: set[config.CoverageMetric] = set(cov_metrics)
 
     to_calculate: list[tuple[RuntimeVariable, ff.TestSuiteCoverageFunction]] = []
 
@@ -405,14 +463,14 @@ def _track_final_metrics(
         algorithm,
         cov_metrics,
         executor,
-        metrics_for_reinstrumenation,
+        traced_metrics,
         output_variables,
         to_calculate,
     )
 
     # Assertion Checked Coverage is special...
     if RuntimeVariable.AssertionCheckedCoverage in output_variables:
-        metrics_for_reinstrumenation.add(config.CoverageMetric.CHECKED)
+        traced_metrics.add(config.CoverageMetric.CHECKED)
         executor.set_instrument(True)
         executor.add_observer(AssertionExecutionObserver(executor.tracer))
         assertion_checked_coverage_ff = ff.TestSuiteAssertionCheckedCoverageFunction(
@@ -422,16 +480,21 @@ def _track_final_metrics(
             (RuntimeVariable.AssertionCheckedCoverage, assertion_checked_coverage_ff)
         )
 
-    # re-instrument the files
-    dynamic_constant_provider = None
-    if isinstance(constant_provider, DynamicConstantProvider):
-        dynamic_constant_provider = constant_provider
-    _reload_instrumentation_loader(
-        metrics_for_reinstrumenation, dynamic_constant_provider, executor.tracer
-    )
-
-    # force new execution of the test cases after new instrumentation
-    _reset_cache_for_result(generation_result)
+    # trace the additional metrics, and force a new execution of the test cases if
+    # they were not traced before
+    newly_traced = traced_metrics - executor.tracer.traced_coverage_metrics
+    executor.tracer.set_traced_coverage_metrics(traced_metrics)
+    instrumented_metrics = _get_instrumented_coverage_metrics()
+    if _get_search_instrumented_coverage_metrics() != instrumented_metrics:
+        # The functions of the module under test ran without the probes of
+        # checked coverage during the search, see
+        # _get_search_instrumented_coverage_metrics.
+        dynamic_constant_provider = None
+        if isinstance(constant_provider, DynamicConstantProvider):
+            dynamic_constant_provider = constant_provider
+        reinstrument(executor.tracer, instrumented_metrics, dynamic_constant_provider)
+    if newly_traced or RuntimeVariable.AssertionCheckedCoverage in output_variables:
+        _reset_cache_for_result(generation_result)
 
     # set value for each newly calculated variable
     for runtime_variable, coverage_ff in to_calculate:
@@ -455,14 +518,14 @@ def _track_final_metrics(
     # reset whether to instrument tests and assertions as well as the SUT
     instrument_test = config.CoverageMetric.CHECKED in cov_metrics
     executor.set_instrument(instrument_test)
-    return metrics_for_reinstrumenation
+    return traced_metrics
 
 
 def _add_additional_metrics(
     algortihm,
     cov_metrics,
     executor,
-    metrics_for_reinstrumenation,
+    traced_metrics,
     output_variables,
     to_calculate,
 ):
@@ -470,7 +533,7 @@ def _add_additional_metrics(
         RuntimeVariable.FinalLineCoverage in output_variables
         and config.CoverageMetric.LINE not in cov_metrics
     ):
-        metrics_for_reinstrumenation.add(config.CoverageMetric.LINE)
+        traced_metrics.add(config.CoverageMetric.LINE)
         line_cov_ff = ff.TestSuiteLineCoverageFunction(executor)
         to_calculate.append((RuntimeVariable.FinalLineCoverage, line_cov_ff))
     elif config.CoverageMetric.LINE in cov_metrics:
@@ -487,7 +550,7 @@ def _add_additional_metrics(
         RuntimeVariable.FinalBranchCoverage in output_variables
         and config.CoverageMetric.BRANCH not in cov_metrics
     ):
-        metrics_for_reinstrumenation.add(config.CoverageMetric.BRANCH)
+        traced_metrics.add(config.CoverageMetric.BRANCH)
         branch_cov_ff = ff.TestSuiteBranchCoverageFunction(executor)
         to_calculate.append((RuntimeVariable.FinalBranchCoverage, branch_cov_ff))
     elif config.CoverageMetric.BRANCH in cov_metrics:
@@ -527,7 +590,14 @@ def _run() -> ReturnCode:
     # Executions that happen after this point should not influence the
     # search statistics
     executor.clear_observers()
-
+    # Subsequent executions, e.g., for filtering flaky assertions, have to actually
+    # execute the test cases.
+    executor.set_result_cache(None)
+    if isinstance(executor, PrefixSnapshotTestCaseExecutor):
+        # Snapshots are only resumed from during the search.
+        executor.set_number_of_snapshots(0)
+
+    _restore_shed_execution_traces(executor, generation_result)
     _track_search_metrics(algorithm, generation_result, coverage_metrics)
     _remove_statements_after_exceptions(generation_result)
     _generate_assertions(executor, generation_result)
@@ -558,6 +628,7 @@ def _run() -> ReturnCode:
             Path(config.configuration.statistics_output.report_dir) / "cov_report.xml",
             datetime.datetime.now(),
         )
+    _track_execution_statistics(executor)
     _collect_miscellaneous_statistics(test_cluster)
     if not stat.write_statistics():
         _LOGGER.error("Failed to write statistics data")
@@ -567,6 +638,22 @@ def _run() -> ReturnCode:
     return ReturnCode.OK
 
 
+def _restore_shed_execution_traces(
+    executor: TestCaseExecutor, generation_result: tsc.TestSuiteChromosome
+) -> None:
+    # The execution traces of the result are read directly, e.g., for the coverage
+    # report, so those that were shed to stay within the memory budget have to be
+    # recomputed.
+    ff.run_test_case_chromosomes(
+        executor,
+        [
+            test_case_chromosome
+            for test_case_chromosome in generation_result.test_case_chromosomes
+            if test_case_chromosome.execution_trace_shed
+        ],
+    )
+
+
 def _remove_statements_after_exceptions(generation_result):
     truncation = pp.ExceptionTruncation()
     generation_result.accept(truncation)
@@ -659,6 +746,41 @@ def _instantiate_test_generation_strategy(
     return factory.get_search_algorithm()
 
 
+def _track_execution_statistics(executor: TestCaseExecutor) -> None:
+    stat.track_output_variable(
+        RuntimeVariable.CompiledCodeCacheHits, executor.code_cache.hits
+    )
+    stat.track_output_variable(
+        RuntimeVariable.CompiledCodeCacheMisses, executor.code_cache.misses
+    )
+    if (profile := executor.tracer.profile) is not None:
+        _track_instrumentation_profile(executor.tracer, profile)
+
+
+def _track_instrumentation_profile(
+    tracer: ExecutionTracer, profile: InstrumentationProfile
+) -> None:
+    code_objects = tracer.get_subject_properties().existing_code_objects
+    for hook, code_object_id, calls, time_ns in profile.probes()[:10]:
+        _LOGGER.info(
+            "Hook %s of code object %d (%s): %d calls, %.3f ms",
+            hook,
+            code_object_id,
+            code_objects[code_object_id].code_object.co_name,
+            calls,
+            time_ns / 1_000_000,
+        )
+    stat.track_output_variable(
+        RuntimeVariable.InstrumentationHookCalls, profile.total_calls
+    )
+    stat.track_output_variable(
+        RuntimeVariable.InstrumentationHookTime, profile.total_time_ns
+    )
+    stat.track_output_variable(
+        RuntimeVariable.InstrumentationProfile, json.dumps(profile.to_dict())
+    )
+
+
 def _collect_miscellaneous_statistics(test_cluster: ModuleTestCluster) -> None:
     test_cluster.log_cluster_statistics()
     stat.track_output_variable(
@@ -8,11 +8,13 @@
 from __future__ import annotations
 
 import builtins
+import dis
 import enum
 import json
 import logging
 
 from dataclasses import dataclass
+from dataclasses import field
 from types import CodeType
 from typing import TYPE_CHECKING
 
@@ -27,6 +29,7 @@ import pynguin.utils.opcodes as op
 from pynguin.analyses.constants import DynamicConstantProvider
 from pynguin.analyses.controlflow import CFG
 from pynguin.analyses.controlflow import ControlDependenceGraph
+from pynguin.utils.exceptions import InstructionNotFoundException
 
 
 if TYPE_CHECKING:
@@ -78,6 +81,118 @@ class CodeObjectMetaData:
     # CDG of this Code Object
     cdg: ControlDependenceGraph
 
+    # Index of the original instructions, built from the other meta data
+    bytecode_index: BytecodeIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.bytecode_index = BytecodeIndex(
+            self.code_object, self.original_cfg, self.cdg
+        )
+
+
+class BytecodeIndex:
+    """Locates the original instructions of a code object in constant time.
+
+    Instructions are addressed by the id of the node of their basic block and by
+    their offset, i.e., twice their position in the original bytecode without
+    EXTENDED_ARG instructions, as traced by the instrumentation.
+    """
+
+    def __init__(
+        self, code_object: CodeType, original_cfg: CFG, cdg: ControlDependenceGraph
+    ) -> None:
+        """Builds the index.
+
+        Args:
+            code_object: The raw code object
+            original_cfg: The CFG of the code object before the instrumentation
+            cdg: The CDG of the code object
+        """
+        self._basic_blocks: dict[int, tuple[list[Instr], int]] = {
+            node.index: (node.basic_block, node.offset)  # type: ignore[misc]
+            for node in original_cfg.nodes
+            if node.basic_block
+        }
+        self._cdg_nodes: dict[int, ProgramGraphNode] = {
+            node.index: node for node in cdg.nodes
+        }
+        # EXTENDED_ARG instructions are not counted for instrumented offsets,
+        # which has to be compensated here
+        self._disassembly: dict[int, dis.Instruction] = {}
+        offset_offset = 0
+        for dis_instr in dis.get_instructions(code_object):
+            if dis_instr.opcode == op.EXTENDED_ARG:
+                offset_offset += 2
+            else:
+                self._disassembly[dis_instr.offset - offset_offset] = dis_instr
+
+    def basic_block(self, node_id: int) -> tuple[list[Instr], int]:
+        """Provides the basic block of a node of the original CFG.
+
+        Args:
+            node_id: The id of the node
+
+        Returns:
+            Tuple of the basic block and the offset of its first instruction
+
+        Raises:
+            InstructionNotFoundException: If the node does not exist or has no
+                instructions
+        """
+        if (basic_block := self._basic_blocks.get(node_id)) is None:
+            raise InstructionNotFoundException
+        return basic_block
+
+    def instruction_index(self, node_id: int, offset: int) -> int:
+        """Provides the position of an instruction in the basic block of a node.
+
+        Args:
+            node_id: The id of the node
+            offset: The offset of the instruction
+
+        Returns:
+            The index of the instruction in the basic block of the node
+
+        Raises:
+            InstructionNotFoundException: If the basic block of the node does not
+                contain an instruction at the offset
+        """
+        basic_block, bb_offset = self.basic_block(node_id)
+        index, remainder = divmod(offset - bb_offset, 2)
+        if remainder or not 0 <= index < len(basic_block):
+            raise InstructionNotFoundException
+        return index
+
+    def disassembled_instruction(self, opcode: int, offset: int) -> dis.Instruction:
+        """Provides the instruction at an offset in the disassembled code object.
+
+        Args:
+            opcode: The opcode of the instruction
+            offset: The offset of the instruction
+
+        Returns:
+            The disassembled instruction
+
+        Raises:
+            InstructionNotFoundException: If there is no instruction with the
+                opcode at the offset
+        """
+        dis_instr = self._disassembly.get(offset)
+        if dis_instr is None or dis_instr.opcode != opcode:
+            raise InstructionNotFoundException
+        return dis_instr
+
+    def cdg_node(self, node_id: int) -> ProgramGraphNode | None:
+        """Provides the node of the CDG with the given id.
+
+        Args:
+            node_id: The id of the node
+
+        Returns:
+            The node, or None if the CDG does not contain a node with the id
+        """
+        return self._cdg_nodes.get(node_id)
+
 
 @dataclass
 class PredicateMetaData:
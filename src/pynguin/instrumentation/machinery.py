@@ -11,35 +11,237 @@ Inspired by https://github.com/agronholm/typeguard/blob/master/typeguard/importh
 from __future__ import annotations
 
 import contextlib
+import copyreg
+import gc
+import hashlib
+import json
 import logging
+import marshal
+import pickle
 import sys
+import tempfile
+import weakref
 
 from importlib.abc import FileLoader
 from importlib.abc import MetaPathFinder
 from importlib.machinery import ModuleSpec
 from importlib.machinery import SourceFileLoader
 from inspect import isclass
+from pathlib import Path
 from types import CodeType
+from types import FunctionType
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import cast
 
+import bytecode
+
+from bytecode.instr import PLACEHOLDER_LABEL
+from bytecode.instr import InstrLocation
+
+import pynguin.__version__ as ver
 import pynguin.configuration as config
 
 from pynguin.analyses.constants import ConstantPool
 from pynguin.analyses.constants import DynamicConstantProvider
 from pynguin.analyses.constants import EmptyConstantProvider
+from pynguin.instrumentation.instrumentation import CODE_OBJECT_ID_KEY
 from pynguin.instrumentation.instrumentation import BranchCoverageInstrumentation
 from pynguin.instrumentation.instrumentation import CheckedCoverageInstrumentation
 from pynguin.instrumentation.instrumentation import DynamicSeedingInstrumentation
 from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.instrumentation.instrumentation import LineCoverageInstrumentation
+from pynguin.testcase.execution import SubjectProperties
 
 
 if TYPE_CHECKING:
+    import os
+
+    from collections.abc import Callable
+    from collections.abc import Collection
+    from collections.abc import Iterator
+
     from pynguin.instrumentation.instrumentation import InstrumentationAdapter
     from pynguin.testcase.execution import ExecutionTracer
 
 
+def _load_code(data: bytes, consts: tuple[Any, ...]) -> CodeType:
+    return marshal.loads(data).replace(co_consts=consts)  # noqa: S302
+
+
+def _reduce_code(code: CodeType) -> tuple[Callable[..., Any], tuple[Any, ...]]:
+    # Instrumented code loads objects like the tracer as constants, which cannot be
+    # marshalled, thus the constants are pickled on their own.
+    return _load_code, (marshal.dumps(code.replace(co_consts=())), code.co_consts)
+
+
+def _reduce_instr_location(
+    location: InstrLocation,
+) -> tuple[Callable[..., Any], tuple[Any, ...]]:
+    return InstrLocation, (
+        location.lineno,
+        location.end_lineno,
+        location.col_offset,
+        location.end_col_offset,
+    )
+
+
+class _CachePickler(pickle.Pickler):
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[CodeType] = _reduce_code
+    dispatch_table[InstrLocation] = _reduce_instr_location
+
+    def __init__(self, file, shared_objects: tuple[Any, ...]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared_ids = {
+            id(obj): index
+            for index, obj in enumerate(shared_objects)
+            if obj is not None
+        }
+
+    def persistent_id(self, obj: Any) -> int | None:
+        return self._shared_ids.get(id(obj))
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    def __init__(self, file, shared_objects: tuple[Any, ...]) -> None:
+        super().__init__(file)
+        self._shared_objects = shared_objects
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self._shared_objects[pid]
+
+
+class InstrumentationCache:
+    """A persistent cache of the instrumented code of modules.
+
+    Similar to ``__pycache__``, the cache directory holds a file per module and
+    instrumentation.  A file is keyed by a hash of the module's source code, its
+    path, the Python, Pynguin and bytecode versions, and the applied
+    instrumentation.  It stores the instrumented code together with the subject
+    properties that were registered at the tracer during the instrumentation.
+
+    Objects that the instrumented code uses, e.g., the tracer, are not stored, but
+    are replaced by the objects of the current run when an entry is loaded.
+    """
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        tracer: ExecutionTracer,
+        coverage_metrics: set[config.CoverageMetric],
+        dynamic_constant_provider: DynamicConstantProvider | None = None,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            directory: The cache directory, which is created on demand
+            tracer: The tracer the instrumented code reports to
+            coverage_metrics: The coverage metrics the code is instrumented for
+            dynamic_constant_provider: The provider of the dynamic constant seeding
+                the code is instrumented for, if any
+        """
+        self._directory = Path(directory)
+        self._instrumentation = ",".join(
+            sorted(metric.name for metric in coverage_metrics)
+            + (["DYNAMIC_SEEDING"] if dynamic_constant_provider is not None else [])
+        )
+        # Singletons of the bytecode library are compared by identity.
+        self._shared_objects = (
+            tracer,
+            dynamic_constant_provider,
+            bytecode.UNSET,
+            PLACEHOLDER_LABEL,
+        )
+
+    def _entry(self, fullname: str, path: str, source: bytes) -> Path:
+        digest = hashlib.sha256()
+        for part in (
+            path,
+            sys.version,
+            ver.__version__,
+            str(bytecode.__version__),
+            self._instrumentation,
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(source)
+        return self._directory / f"{fullname}.{digest.hexdigest()}.pickle"
+
+    def load(
+        self, fullname: str, path: str, source: bytes
+    ) -> tuple[CodeType, SubjectProperties] | None:
+        """Loads the instrumented code of a module, if it is cached.
+
+        Args:
+            fullname: The name of the module
+            path: The path of the module's source file
+            source: The source code of the module
+
+        Returns:
+            The instrumented code of the module and the subject properties
+            registered during its instrumentation, or None, if it is not cached
+        """
+        entry = self._entry(fullname, path, source)
+        try:
+            with entry.open("rb") as file:
+                code, subject_properties = _CacheUnpickler(
+                    file, self._shared_objects
+                ).load()
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            self._logger.warning(
+                "Failed to load instrumented code from %s", entry, exc_info=True
+            )
+            return None
+        self._logger.debug("Loaded instrumented code from %s", entry)
+        return code, subject_properties
+
+    def store(
+        self,
+        fullname: str,
+        path: str,
+        source: bytes,
+        code: CodeType,
+        subject_properties: SubjectProperties,
+    ) -> None:
+        """Stores the instrumented code of a module.
+
+        Args:
+            fullname: The name of the module
+            path: The path of the module's source file
+            source: The source code of the module
+            code: The instrumented code of the module
+            subject_properties: The subject properties registered during the
+                instrumentation of the module
+        """
+        entry = self._entry(fullname, path, source)
+        temporary_path: Path | None = None
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, such that concurrent runs never read
+            # an incomplete entry.
+            with tempfile.NamedTemporaryFile(
+                dir=self._directory, prefix=f"{fullname}.", delete=False
+            ) as file:
+                temporary_path = Path(file.name)
+                _CachePickler(file, self._shared_objects).dump(
+                    (code, subject_properties)
+                )
+            temporary_path.replace(entry)
+        except Exception:  # noqa: BLE001
+            self._logger.warning(
+                "Failed to store instrumented code in %s", entry, exc_info=True
+            )
+            if temporary_path is not None:
+                temporary_path.unlink(missing_ok=True)
+            return
+        self._logger.debug("Stored instrumented code in %s", entry)
+
+
 class InstrumentationLoader(SourceFileLoader):
     """A loader that instruments the module after execution."""
 
@@ -49,10 +251,12 @@ class InstrumentationLoader(SourceFileLoader):
         path,
         tracer: ExecutionTracer,
         transformer: InstrumentationTransformer,
+        cache: InstrumentationCache | None = None,
     ):
         super().__init__(fullname, path)
         self._tracer = tracer
         self._transformer = transformer
+        self._cache = cache
 
     def exec_module(self, module):  # noqa: D102
         self._tracer.reset()
@@ -70,11 +274,210 @@ class InstrumentationLoader(SourceFileLoader):
         Returns:
             The modules code blocks
         """
+        if self._cache is None:
+            return self._instrument(fullname)
+        source = self.get_data(self.path)
+        if (cached := self._cache.load(fullname, self.path, source)) is not None:
+            code, self._tracer.subject_properties = cached
+            return code
+        code = self._instrument(fullname)
+        self._cache.store(
+            fullname, self.path, source, code, self._tracer.get_subject_properties()
+        )
+        return code
+
+    def _instrument(self, fullname) -> CodeType:
         to_instrument = cast(CodeType, super().get_code(fullname))
         assert to_instrument is not None, "Failed to get code object of module."
         return self._transformer.instrument_module(to_instrument)
 
 
+class InstrumentationRemover:
+    """Removes the instrumentation of code objects from the functions using them.
+
+    The code of a function is swapped with the original code of its code object,
+    such that executing the function does not report to the tracer anymore.  Code
+    objects nested in the original code are replaced by their instrumented versions,
+    i.e., functions defined by a de-instrumented function remain instrumented.
+    """
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self, tracer: ExecutionTracer) -> None:
+        """Initializes the remover.
+
+        Args:
+            tracer: The tracer the instrumented code of the module under test
+                reports to
+        """
+        self._tracer = tracer
+        self._existing_code_objects = (
+            tracer.get_subject_properties().existing_code_objects
+        )
+        self._code_object_ids = {
+            id(meta.code_object): code_object_id
+            for code_object_id, meta in self._existing_code_objects.items()
+        }
+        self._original_code: dict[int, CodeType | None] = {}
+        self._instrumented_code: weakref.WeakKeyDictionary[
+            FunctionType, CodeType
+        ] = weakref.WeakKeyDictionary()
+
+    def remove(self, code_object_ids: Collection[int]) -> int:
+        """Removes the instrumentation of the given code objects.
+
+        Args:
+            code_object_ids: The ids of the code objects whose instrumentation
+                shall be removed
+
+        Returns:
+            The number of functions whose instrumentation was removed
+        """
+        if not code_object_ids:
+            return 0
+        removed = 0
+        for function, code_object_id in _instrumented_functions(self._tracer):
+            code = function.__code__
+            if (
+                code_object_id not in code_object_ids
+                or (original := self._get_original_code(code_object_id, code)) is None
+            ):
+                continue
+            self._instrumented_code[function] = code
+            function.__code__ = original
+            removed += 1
+        self._logger.debug(
+            "Removed the instrumentation of %d functions of code objects %s",
+            removed,
+            sorted(code_object_ids),
+        )
+        return removed
+
+    def restore(self) -> None:
+        """Restores the instrumentation of all functions it was removed from."""
+        for function, code in list(self._instrumented_code.items()):
+            function.__code__ = code
+        self._instrumented_code.clear()
+
+    def _get_original_code(
+        self, code_object_id: int, instrumented: CodeType
+    ) -> CodeType | None:
+        if code_object_id not in self._original_code:
+            self._original_code[code_object_id] = self._build_original_code(
+                code_object_id, instrumented
+            )
+        return self._original_code[code_object_id]
+
+    def _build_original_code(
+        self, code_object_id: int, instrumented: CodeType
+    ) -> CodeType | None:
+        instrumented_inner = {
+            _get_code_object_id(const): const
+            for const in instrumented.co_consts
+            if isinstance(const, CodeType)
+        }
+        original = self._existing_code_objects[code_object_id].code_object
+        consts = []
+        for const in original.co_consts:
+            if not isinstance(const, CodeType):
+                consts.append(const)
+            elif (
+                inner := instrumented_inner.get(self._code_object_ids.get(id(const)))
+            ) is not None:
+                consts.append(inner)
+            else:
+                return None
+        return original.replace(co_consts=tuple(consts))
+
+
+def reinstrument(
+    tracer: ExecutionTracer,
+    coverage_metrics: set[config.CoverageMetric],
+    dynamic_constant_provider: DynamicConstantProvider | None = None,
+) -> int:
+    """Replaces the instrumentation of the functions of the module under test.
+
+    The original code of the module is instrumented anew for the given coverage
+    metrics, and the code of the functions using the previous instrumentation is
+    swapped with the new one.  Unlike a reload, the module is not executed again,
+    i.e., its objects and the import trace of the tracer are kept.  The
+    instrumentation registers the code objects and predicates in the same order for
+    all coverage metrics, such that their ids in the import trace remain valid.
+
+    Args:
+        tracer: The tracer the instrumented code of the module under test
+            reports to
+        coverage_metrics: The coverage metrics to instrument the module for
+        dynamic_constant_provider: The dynamic constant provider, if any.
+
+    Returns:
+        The number of functions whose code was swapped
+    """
+    previous = tracer.get_subject_properties()
+    tracer.subject_properties = SubjectProperties()
+    transformer = build_transformer(tracer, coverage_metrics, dynamic_constant_provider)
+    instrumented: dict[int, CodeType] = {}
+    for meta in previous.existing_code_objects.values():
+        if meta.parent_code_object_id is None:
+            _collect_code_objects(
+                transformer.instrument_module(meta.code_object), instrumented
+            )
+    current = tracer.get_subject_properties()
+    assert current.existing_code_objects.keys() == (
+        previous.existing_code_objects.keys()
+    ), "Instrumentation registered different code objects"
+    assert current.existing_predicates.keys() == (
+        previous.existing_predicates.keys()
+    ), "Instrumentation registered different predicates"
+    assert all(
+        current.existing_lines.get(line_id) == previous.existing_lines[line_id]
+        for line_id in tracer.import_trace.covered_line_ids
+    ), "Instrumentation registered different lines"
+    current.object_addresses.update(previous.object_addresses)
+
+    swapped = 0
+    for function, code_object_id in _instrumented_functions(tracer):
+        function.__code__ = instrumented[code_object_id]
+        swapped += 1
+    return swapped
+
+
+def _collect_code_objects(code: CodeType, collected: dict[int, CodeType]) -> None:
+    if (code_object_id := _get_code_object_id(code)) is not None:
+        collected[code_object_id] = code
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _collect_code_objects(const, collected)
+
+
+def _instrumented_functions(
+    tracer: ExecutionTracer,
+) -> Iterator[tuple[FunctionType, int]]:
+    for obj in gc.get_objects():
+        if type(obj) is not FunctionType:
+            continue
+        code = obj.__code__
+        if (code_object_id := _get_code_object_id(code)) is not None and any(
+            # Functions of modules that were instrumented for other tracers share
+            # the ids, but not the tracer.
+            const is tracer
+            for const in code.co_consts
+        ):
+            yield obj, code_object_id
+
+
+def _get_code_object_id(code: CodeType) -> int | None:
+    if not code.co_consts:
+        return None
+    tag = code.co_consts[0]
+    if not isinstance(tag, str) or CODE_OBJECT_ID_KEY not in tag:
+        return None
+    try:
+        return json.loads(tag)[CODE_OBJECT_ID_KEY]
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
 def build_transformer(
     tracer: ExecutionTracer,
     coverage_metrics: set[config.CoverageMetric],
@@ -97,12 +500,15 @@ def build_transformer(
         adapters.append(BranchCoverageInstrumentation(tracer))
     if config.CoverageMetric.LINE in coverage_metrics:
         adapters.append(LineCoverageInstrumentation(tracer))
-    if config.CoverageMetric.CHECKED in coverage_metrics:
-        adapters.append(CheckedCoverageInstrumentation(tracer))
-
+    # The dynamic seeding locates compare operations by their position in a basic
+    # block, so it has to see the blocks before the checked coverage instrumentation
+    # inserts its probes around every instruction.
     if dynamic_constant_provider is not None:
         adapters.append(DynamicSeedingInstrumentation(dynamic_constant_provider))
 
+    if config.CoverageMetric.CHECKED in coverage_metrics:
+        adapters.append(CheckedCoverageInstrumentation(tracer))
+
     return InstrumentationTransformer(tracer, adapters)
 
 
@@ -157,6 +563,18 @@ class InstrumentationFinder(MetaPathFinder):
         self._coverage_metrics = coverage_metrics
         self._dynamic_constant_provider = dynamic_constant_provider
 
+    def _build_cache(self) -> InstrumentationCache | None:
+        if not (
+            directory := config.configuration.test_execution.instrumentation_cache_path
+        ):
+            return None
+        return InstrumentationCache(
+            directory,
+            self._tracer,
+            self._coverage_metrics,
+            self._dynamic_constant_provider,
+        )
+
     def _should_instrument(self, module_name: str):
         return module_name == self._module_to_instrument
 
@@ -189,6 +607,7 @@ class InstrumentationFinder(MetaPathFinder):
                             self._coverage_metrics,
                             self._dynamic_constant_provider,
                         ),
+                        self._build_cache(),
                     )
                     return spec
                 self._logger.error(
@@ -10,6 +10,8 @@
 """Provides classes and logic for dynamic slicing."""
 from __future__ import annotations
 
+import copy
+import dataclasses
 import logging
 import operator
 import time
@@ -32,11 +34,11 @@ from pynguin.utils.exceptions import SlicingTimeoutException
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from bytecode import Instr
 
-    from pynguin.analyses.controlflow import CFG
     from pynguin.analyses.controlflow import ControlDependenceGraph
-    from pynguin.analyses.controlflow import ProgramGraphNode
     from pynguin.instrumentation.instrumentation import CodeObjectMetaData
     from pynguin.slicer.executedinstruction import ExecutedInstruction
     from pynguin.slicer.executionflowbuilder import LastInstrState
@@ -144,7 +146,7 @@ class DynamicSlicer:
         """
         self._known_code_objects = known_code_objects
 
-    def slice(  # noqa: A003, C901
+    def slice(  # noqa: A003
         self,
         trace: ExecutionTrace,
         slicing_criterion: SlicingCriterion,
@@ -158,115 +160,247 @@ class DynamicSlicer:
 
         Returns:
             A `DynamicSlice` object containing the included instructions.
+        """
+        slc = self._setup_slicing_configuration(slicing_criterion, trace)
+        return self._slice_from(slc, trace)
+
+    def slice_all(
+        self,
+        trace: ExecutionTrace,
+        slicing_criteria: Sequence[SlicingCriterion],
+    ) -> list[list[UniqueInstruction]]:
+        """Computes the slices of several slicing criteria in one backward traversal.
+
+        Reconstructing the execution flow from the trace does not depend on the
+        slicing criterion, only the slicing context and the stack do.  Thus, all
+        criteria share one traversal that starts at the latest criterion, and every
+        other criterion joins the traversal once it reaches the criterion's
+        instruction, with a context and a stack of its own.  A criterion that the
+        traversal does not reach, or whose frames diverge from the traversal, is
+        sliced on its own, such that the slices equal those of ``slice``.
+
+        Args:
+            trace: Execution trace object containing slicing information
+                with collected instructions.
+            slicing_criteria: The slicing criteria where slicing is started
+
+        Returns:
+            The slices of the slicing criteria, in the order of the criteria.
 
         Raises:
             SlicingTimeoutException: when the slicing takes longer than the
                 configured budget
         """
-        slc = self._setup_slicing_configuration(slicing_criterion, trace)
+        slices: dict[int, list[UniqueInstruction]] = {}
+        # The criterion that starts or joins the traversal next is the last one.
+        pending = sorted(
+            range(len(slicing_criteria)),
+            key=lambda index: slicing_criteria[index].trace_position,
+        )
+        active: list[tuple[int, SlicingState]] = []
+        while pending or active:
+            if not active:
+                index = pending.pop()
+                slc = self._setup_slicing_configuration(slicing_criteria[index], trace)
+                active.append((index, slc))
+            active = self._detach_diverged(active, trace, slices)
+            leader = active[0][1]
+
+            last_state = leader.update_state()
+            if not last_state.last_instr:  # type: ignore[truthy-bool]
+                for index, slc in active:
+                    slices[index] = self._collect_slice(slc)
+                active = []
+                continue
+            self._step_all(active, last_state, trace)
+
+            while pending:
+                criterion = slicing_criteria[pending[-1]]
+                if criterion.trace_position > leader.trace_position:
+                    # The traversal missed the instruction of this criterion.
+                    slices[pending.pop()] = self.slice(trace, criterion)
+                elif criterion.trace_position == leader.trace_position and (
+                    _is_at_instruction(leader, criterion.unique_instr)
+                ):
+                    slc = self._setup_slicing_configuration(criterion, trace)
+                    active.append((pending.pop(), slc))
+                else:
+                    break
+        return [slices[index] for index in range(len(slicing_criteria))]
 
-        while True:
-            criterion_in_slice = imp_data_dep = False
-            include_use = True
+    def _detach_diverged(
+        self,
+        active: list[tuple[int, SlicingState]],
+        trace: ExecutionTrace,
+        slices: dict[int, list[UniqueInstruction]],
+    ) -> list[tuple[int, SlicingState]]:
+        # The import back call of a state steers the execution flow builder, so
+        # states that disagree with the leader about it cannot follow the leader.
+        leader = active[0][1]
+        following = [active[0]]
+        for index, slc in active[1:]:
+            if _same_import_back_call(slc.import_back_call, leader.import_back_call):
+                following.append((index, slc))
+            else:
+                slices[index] = self._slice_from(slc, trace)
+        return following
+
+    def _step_all(
+        self,
+        active: list[tuple[int, SlicingState]],
+        last_state: LastInstrState,
+        trace: ExecutionTrace,
+    ) -> None:
+        leader = active[0][1]
+        last_unique_instr, last_traced_instr = self._advance(leader, last_state, trace)
+        for _, slc in active[1:]:
+            slc.file = leader.file
+            slc.offset = leader.offset
+            slc.code_object_id = leader.code_object_id
+            slc.basic_block_id = leader.basic_block_id
+            slc.trace_position = leader.trace_position
+            # Whether an instruction is in the slice is stored in the instruction,
+            # so every state needs its own copy.
+            self._slice_step(
+                slc,
+                _copy_last_state(last_state),
+                copy.copy(last_unique_instr),
+                last_traced_instr,
+            )
+        self._slice_step(leader, last_state, last_unique_instr, last_traced_instr)
 
+        now = time.time()
+        if any(now > slc.timeout for _, slc in active):
+            raise SlicingTimeoutException
+
+    def _slice_from(
+        self, slc: SlicingState, trace: ExecutionTrace
+    ) -> list[UniqueInstruction]:
+        while True:
             # Get last instruction
             last_state = slc.update_state()
 
-            if last_state.exception:
-                # Stack can not be reliably simulated when an exception occurred
-                slc.stack_simulation = False
-            if not last_state.last_instr:
-                # Reached end of executed instructions -> return slice (and keep order)
-                instructions = set()
-                slice_instructions = []
-                for i in reversed(slc.context.instr_in_slice):
-                    if i not in instructions:
-                        instructions.add(i)
-                        slice_instructions.append(i)
-                return slice_instructions
-
-            last_unique_instr = self.create_unique_instruction(
-                slc.file,
-                last_state.last_instr,
-                slc.code_object_id,
-                slc.basic_block_id,
-                slc.offset,
-            )
-            # Adjust trace position
-            last_traced_instr = None
-            if last_state.last_instr.opcode in op.TRACED_INSTRUCTIONS:
-                last_traced_instr = trace.executed_instructions[slc.trace_position]
-                slc.trace_position -= 1
+            if not last_state.last_instr:  # type: ignore[truthy-bool]
+                # Reached end of executed instructions -> return slice
+                return self._collect_slice(slc)
 
-            # Stack housekeeping
-            prev_import_back_call = self._stack_housekeeping(
-                last_state, last_unique_instr, slc
-            )
+            last_unique_instr, last_traced_instr = self._advance(slc, last_state, trace)
+            self._slice_step(slc, last_state, last_unique_instr, last_traced_instr)
 
-            # Control dependency
-            control_dependency = self.check_control_dependency(
-                slc.context, last_unique_instr, slc.code_object_id
-            )
+            if time.time() > slc.timeout:
+                raise SlicingTimeoutException
 
-            # Data dependencies
-            # Explicit data dependency
-            (
-                exp_data_dep,
-                slc.new_attribute_object_uses,
-            ) = self.check_explicit_data_dependency(
-                slc.context, last_unique_instr, last_traced_instr
-            )
+    @staticmethod
+    def _collect_slice(slc: SlicingState) -> list[UniqueInstruction]:
+        # Remove duplicates and keep the order
+        instructions = set()
+        slice_instructions = []
+        for i in reversed(slc.context.instr_in_slice):
+            if i not in instructions:
+                instructions.add(i)
+                slice_instructions.append(i)
+        return slice_instructions
+
+    def _advance(
+        self, slc: SlicingState, last_state: LastInstrState, trace: ExecutionTrace
+    ) -> tuple[UniqueInstruction, ExecutedInstruction | None]:
+        last_unique_instr = self.create_unique_instruction(
+            slc.file,
+            last_state.last_instr,
+            slc.code_object_id,
+            slc.basic_block_id,
+            slc.offset,
+        )
+        # Adjust trace position
+        last_traced_instr = None
+        if last_state.last_instr.opcode in op.TRACED_INSTRUCTIONS:
+            # Only definitions and uses look at the traced instruction, see
+            # check_explicit_data_dependency and add_uses.
+            if last_unique_instr.is_def() or last_unique_instr.is_use():
+                last_traced_instr = trace.executed_instructions[slc.trace_position]
+            slc.trace_position -= 1
+        return last_unique_instr, last_traced_instr
 
-            # Dependency via method call
-            if last_state.call and slc.code_object_dependent:
-                imp_data_dep = True
-                slc.code_object_dependent = False
-
-                if last_state.import_start:
-                    # We need to include the import statement after determining
-                    # if one of the instructions executed by the import is included
-                    # (because IMPORT_NAME is traced afterwards).
-                    slc.context.instr_in_slice.append(prev_import_back_call)
-                    num_import_pops = StackEffect.stack_effect(
-                        prev_import_back_call.opcode, arg=None, jump=False
-                    )[0]
-                    slc.trace_stack.update_pop_operations(
-                        num_import_pops, prev_import_back_call, True
-                    )
-            # Implicit data dependency (over stack)
-            if slc.stack_simulation:
-                stack_dep, include_use = slc.trace_stack.update_push_operations(
-                    slc.pushes, last_state.returned
-                )
-                if stack_dep:
-                    imp_data_dep = True
-            if last_state.returned:
-                slc.code_object_dependent = False
+    def _slice_step(
+        self,
+        slc: SlicingState,
+        last_state: LastInstrState,
+        last_unique_instr: UniqueInstruction,
+        last_traced_instr: ExecutedInstruction | None,
+    ) -> None:
+        criterion_in_slice = imp_data_dep = False
+        include_use = True
 
-            if control_dependency or exp_data_dep or imp_data_dep:
-                criterion_in_slice = True
+        if last_state.exception:
+            # Stack can not be reliably simulated when an exception occurred
+            slc.stack_simulation = False
 
-                if not last_state.call:
-                    slc.code_object_dependent = True
+        # Stack housekeeping
+        prev_import_back_call = self._stack_housekeeping(
+            last_state, last_unique_instr, slc
+        )
 
-            # Unconditional jumps
-            if last_state.jump and last_state.last_instr.is_uncond_jump():
-                criterion_in_slice = True
+        # Control dependency
+        control_dependency = self.check_control_dependency(
+            slc.context, last_unique_instr, slc.code_object_id
+        )
 
-            # Housekeeping for execution trace, stack
-            self._trace_housekeeping(
-                criterion_in_slice,
-                include_use,
-                last_traced_instr,
-                last_unique_instr,
-                slc,
+        # Data dependencies
+        # Explicit data dependency
+        (
+            exp_data_dep,
+            slc.new_attribute_object_uses,
+        ) = self.check_explicit_data_dependency(
+            slc.context, last_unique_instr, last_traced_instr
+        )
+
+        # Dependency via method call
+        if last_state.call and slc.code_object_dependent:
+            imp_data_dep = True
+            slc.code_object_dependent = False
+
+            if last_state.import_start:
+                # We need to include the import statement after determining
+                # if one of the instructions executed by the import is included
+                # (because IMPORT_NAME is traced afterwards).
+                slc.context.instr_in_slice.append(prev_import_back_call)
+                num_import_pops = StackEffect.stack_effect(
+                    prev_import_back_call.opcode, arg=None, jump=False
+                )[0]
+                slc.trace_stack.update_pop_operations(
+                    num_import_pops, prev_import_back_call, True
+                )
+        # Implicit data dependency (over stack)
+        if slc.stack_simulation:
+            stack_dep, include_use = slc.trace_stack.update_push_operations(
+                slc.pushes, last_state.returned
             )
+            if stack_dep:
+                imp_data_dep = True
+        if last_state.returned:
+            slc.code_object_dependent = False
 
-            # next iteration
-            slc.curr_instr = last_state.last_instr
+        if control_dependency or exp_data_dep or imp_data_dep:
+            criterion_in_slice = True
 
-            if time.time() > slc.timeout:
-                raise SlicingTimeoutException
+            if not last_state.call:
+                slc.code_object_dependent = True
+
+        # Unconditional jumps
+        if last_state.jump and last_state.last_instr.is_uncond_jump():
+            criterion_in_slice = True
+
+        # Housekeeping for execution trace, stack
+        self._trace_housekeeping(
+            criterion_in_slice,
+            include_use,
+            last_traced_instr,
+            last_unique_instr,
+            slc,
+        )
+
+        # next iteration
+        slc.curr_instr = last_state.last_instr
 
     def _stack_housekeeping(self, last_state, last_unique_instr, slc):
         prev_import_back_call = slc.trace_stack.get_import_frame()
@@ -388,28 +522,16 @@ class DynamicSlicer:
         self, instr: UniqueInstruction, code_object_id: int, basic_block_id: int
     ) -> Instr:
         # Get relevant basic block
-        basic_block = None
-        bb_offset = -1
         code_object = self._known_code_objects.get(code_object_id)
         assert code_object, "Unknown code object id"
-        for node in code_object.original_cfg.nodes:
-            if node.index == basic_block_id:
-                basic_block = node.basic_block
-                bb_offset = node.offset
-
-        if (not basic_block) or (bb_offset < 0):
+        bytecode_index = code_object.bytecode_index
+        basic_block, _ = bytecode_index.basic_block(basic_block_id)
+        instruction = basic_block[
+            bytecode_index.instruction_index(basic_block_id, instr.offset)
+        ]
+        if instr.opcode != instruction.opcode or instr.lineno != instruction.lineno:
             raise InstructionNotFoundException
-
-        for instruction in basic_block:
-            if (
-                instr.opcode == instruction.opcode  # type: ignore[union-attr]
-                and instr.lineno == instruction.lineno  # type: ignore[union-attr]
-                and instr.offset == bb_offset
-            ):
-                return instruction  # type: ignore[return-value]
-            bb_offset += 2
-
-        raise InstructionNotFoundException
+        return instruction
 
     def create_unique_instruction(
         self, file: str, instr: Instr, code_object_id: int, node_id: int, offset: int
@@ -462,7 +584,8 @@ class DynamicSlicer:
 
         code_object: CodeObjectMetaData = self._known_code_objects[code_object_id]
         cdg: ControlDependenceGraph = code_object.cdg
-        curr_node = self.get_node(unique_instr.node_id, cdg)
+        bytecode_index = code_object.bytecode_index
+        curr_node = bytecode_index.cdg_node(unique_instr.node_id)
         assert curr_node, "Invalid node id"
         successors = cdg.get_successors(curr_node)
 
@@ -472,7 +595,7 @@ class DynamicSlicer:
         # If so: include current instruction in the slice, remove all instructions
         # control dependent on current instruction
         for instr in context.instr_ctrl_deps:
-            instr_node = self.get_node(instr.node_id, cdg)
+            instr_node = bytecode_index.cdg_node(instr.node_id)
             if instr_node in successors:
                 instr_ctrl_deps_copy.remove(instr)
                 control_dependency = True
@@ -495,7 +618,7 @@ class DynamicSlicer:
         """
         code_object: CodeObjectMetaData = self._known_code_objects[code_object_id]
         cdg: ControlDependenceGraph = code_object.cdg
-        curr_node = self.get_node(unique_instr.node_id, cdg)
+        curr_node = code_object.bytecode_index.cdg_node(unique_instr.node_id)
         assert curr_node, "Invalid node id"
         predecessors = cdg.get_predecessors(curr_node)
 
@@ -503,25 +626,6 @@ class DynamicSlicer:
             if not predecessor.is_artificial:
                 context.instr_ctrl_deps.add(unique_instr)
 
-    @staticmethod
-    def get_node(
-        node_id: int, graph: ControlDependenceGraph | CFG
-    ) -> ProgramGraphNode | None:
-        """Iterate through all nodes of the graph and return the node with the given id.
-
-        Args:
-            node_id: the node id to find inside the given graph
-            graph: the graph to find the node inside of
-
-        Returns:
-            A ProgramGraphNode object with the given id
-            or None if the id is not in the nodes
-        """
-        for node in graph.nodes:
-            if node.index == node_id:
-                return node
-        return None
-
     def check_explicit_data_dependency(  # noqa: C901
         self,
         context: SlicingContext,
@@ -810,6 +914,11 @@ class DynamicSlicer:
         Returns:
             a set of line ids used in the given list of instructions
         """
+        known_lines: dict[tuple[str, int], int] = {}
+        for known_line_id, line_meta in subject_properties.existing_lines.items():
+            known_lines.setdefault(
+                (line_meta.file_name, line_meta.line_number), known_line_id
+            )
         line_ids = set()
         curr_line = -1
         for instruction in instructions:
@@ -818,14 +927,44 @@ class DynamicSlicer:
             if instruction.lineno == curr_line:  # only add new lines
                 continue
             curr_line = instruction.lineno  # type: ignore[assignment]
-            line_ids.add(
-                DynamicSlicer.get_line_id_by_instruction(
-                    instruction, subject_properties
+            if (line_id := known_lines.get((instruction.file, curr_line))) is None:
+                raise ValueError(
+                    "The instruction's line is not registered in the known data"
                 )
-            )
+            line_ids.add(line_id)
         return line_ids
 
 
+def _same_import_back_call(
+    first: UniqueInstruction | None, second: UniqueInstruction | None
+) -> bool:
+    if first is None or second is None:
+        return first is second
+    return (
+        first == second
+        and first.code_object_id == second.code_object_id
+        and first.node_id == second.node_id
+        and first.offset == second.offset
+    )
+
+
+def _is_at_instruction(slc: SlicingState, instr: UniqueInstruction) -> bool:
+    return (
+        slc.file == instr.file
+        and slc.code_object_id == instr.code_object_id
+        and slc.basic_block_id == instr.node_id
+        and slc.offset == instr.offset
+    )
+
+
+def _copy_last_state(last_state: LastInstrState) -> LastInstrState:
+    if last_state.import_back_call is None:
+        return last_state
+    return dataclasses.replace(
+        last_state, import_back_call=copy.copy(last_state.import_back_call)
+    )
+
+
 class AssertionSlicer:
     """Holds all logic of slicing traced assertions.
 
@@ -850,16 +989,12 @@ class AssertionSlicer:
         code_meta = self._known_code_objects[traced_instr.code_object_id]
 
         # find out the basic block of the assertion
-        basic_block = None
-        for node in code_meta.original_cfg.nodes:
-            if node.index == traced_instr.node_id and node.basic_block:
-                basic_block = node.basic_block
-        assert basic_block, "node id or code object id were off"
+        basic_block, _ = code_meta.bytecode_index.basic_block(traced_instr.node_id)
 
         # the traced instruction is always the jump at the end of the bb
         original_instr = None
         for instr in reversed(list(basic_block)):
-            if instr.opcode == traced_instr.opcode:  # type: ignore[union-attr]
+            if instr.opcode == traced_instr.opcode:
                 original_instr = instr
                 break
         assert original_instr
@@ -871,7 +1006,7 @@ class AssertionSlicer:
             traced_instr.node_id,
             code_meta,
             traced_instr.offset,
-            original_instr.arg,  # type: ignore[union-attr]
+            original_instr.arg,
             traced_instr.lineno,
         )
 
@@ -7,7 +7,15 @@
 """Contains all code related to executed instruction classes."""
 from __future__ import annotations
 
+import operator
+
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
+from typing import overload
 
 from opcode import opname
 
@@ -136,3 +144,430 @@ class ExecutedReturnInstruction(ExecutedInstruction):
             f"{'(ret)':<7} {self.file:<40} {opname[self.opcode]:<72} "
             f"{self.code_object_id:02d} @ line: {self.lineno:d}-{self.offset:d}"
         )
+
+
+_KINDS: tuple[type[ExecutedInstruction], ...] = (
+    ExecutedInstruction,
+    ExecutedMemoryInstruction,
+    ExecutedAttributeInstruction,
+    ExecutedControlInstruction,
+    ExecutedCallInstruction,
+    ExecutedReturnInstruction,
+)
+_KIND_CODES: dict[type[ExecutedInstruction], int] = {
+    kind: code for code, kind in enumerate(_KINDS)
+}
+
+_MUTABLE_TYPE = 1
+_OBJECT_CREATION = 2
+# Artificial instructions may have no line number and the tracer does not always
+# know the address of an accessed attribute.
+_NO_LINENO = -1
+_NO_ADDRESS = -(2**63)
+
+
+class ExecutedInstructionLog(Sequence[ExecutedInstruction]):
+    """An append-only sequence of executed instructions, stored column-wise.
+
+    Tracing for checked coverage records every executed bytecode instruction.
+    Instead of keeping an object per instruction, the log stores each field in a
+    typed array; file names and arguments are interned per log and stored by
+    their index.  Indexing the log creates the instruction object for this single
+    position, whereas the accessors, e.g., ``opcode(index)``, read a single field
+    without creating an object.  Logs are concatenated column by column.
+    """
+
+    __slots__ = (
+        "_kinds",
+        "_files",
+        "_code_object_ids",
+        "_node_ids",
+        "_opcodes",
+        "_arguments",
+        "_linenos",
+        "_offsets",
+        "_arg_addresses",
+        "_src_addresses",
+        "_flags",
+        "_values",
+        "_value_ids",
+    )
+
+    def __init__(self, instructions: Iterable[ExecutedInstruction] | None = None):
+        """Initializes the log.
+
+        Args:
+            instructions: The instructions the log shall initially contain.
+        """
+        self._kinds = bytearray()
+        self._files = array("I")
+        self._code_object_ids = array("I")
+        self._node_ids = array("I")
+        self._opcodes = array("B")
+        self._arguments = array("I")
+        self._linenos = array("i")
+        self._offsets = array("I")
+        self._arg_addresses = array("q")
+        self._src_addresses = array("q")
+        self._flags = bytearray()
+        # The interned file names and arguments.
+        self._values: list[Any] = []
+        self._value_ids: dict[Any, int] = {}
+        if instructions is not None:
+            self.extend(instructions)
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    @overload
+    def __getitem__(self, index: int) -> ExecutedInstruction:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ExecutedInstruction]:
+        ...  # pragma: no cover
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        kind = _KINDS[self._kinds[index]]
+        values = self._values
+        fields: tuple[Any, Any, Any, Any, Any, Any, Any] = (
+            values[self._files[index]],
+            self._code_object_ids[index],
+            self._node_ids[index],
+            self._opcodes[index],
+            values[self._arguments[index]],
+            None if (lineno := self._linenos[index]) == _NO_LINENO else lineno,
+            self._offsets[index],
+        )
+        instruction: ExecutedInstruction
+        if kind is ExecutedMemoryInstruction:
+            flags = self._flags[index]
+            instruction = ExecutedMemoryInstruction(
+                *fields,
+                _address(self._arg_addresses[index]),
+                bool(flags & _MUTABLE_TYPE),
+                bool(flags & _OBJECT_CREATION),
+            )
+        elif kind is ExecutedAttributeInstruction:
+            instruction = ExecutedAttributeInstruction(
+                *fields,
+                _address(self._src_addresses[index]),
+                _address(self._arg_addresses[index]),
+                bool(self._flags[index] & _MUTABLE_TYPE),
+            )
+        else:
+            instruction = kind(*fields)
+        return instruction
+
+    def __iter__(self) -> Iterator[ExecutedInstruction]:
+        for index in range(len(self._kinds)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(map(operator.eq, self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + sum(column.__sizeof__() for column in self._columns())
+            + self._values.__sizeof__()
+            + self._value_ids.__sizeof__()
+        )
+
+    def __getstate__(self) -> tuple[list[Any], tuple[Any, ...]]:
+        return self._values, self._columns()
+
+    def __setstate__(self, state: tuple[list[Any], tuple[Any, ...]]) -> None:
+        self._values, columns = state
+        (
+            self._kinds,
+            self._files,
+            self._code_object_ids,
+            self._node_ids,
+            self._opcodes,
+            self._arguments,
+            self._linenos,
+            self._offsets,
+            self._arg_addresses,
+            self._src_addresses,
+            self._flags,
+        ) = columns
+        self._value_ids = {value: index for index, value in enumerate(self._values)}
+
+    def _columns(self) -> tuple[Any, ...]:
+        return (
+            self._kinds,
+            self._files,
+            self._code_object_ids,
+            self._node_ids,
+            self._opcodes,
+            self._arguments,
+            self._linenos,
+            self._offsets,
+            self._arg_addresses,
+            self._src_addresses,
+            self._flags,
+        )
+
+    def _intern(self, value: Any) -> int:
+        value_id = self._value_ids.get(value)
+        if value_id is None:
+            value_id = self._value_ids[value] = len(self._values)
+            self._values.append(value)
+        return value_id
+
+    def add(
+        self,
+        kind: type[ExecutedInstruction],
+        file: str,
+        code_object_id: int,
+        node_id: int,
+        opcode: int,
+        argument: int | str | None,
+        lineno: int | None,
+        offset: int,
+        arg_address: int | None = 0,
+        src_address: int | None = 0,
+        is_mutable_type: bool = False,
+        object_creation: bool = False,
+    ) -> None:
+        """Appends an executed instruction given by its fields.
+
+        Args:
+            kind: The class of the executed instruction
+            file: File name of the module containing the instruction
+            code_object_id: code object containing the instruction
+            node_id: the node of the code object containing the instruction
+            opcode: the opcode of the instruction
+            argument: the argument of the instruction
+            lineno: the line number of the instruction
+            offset: the offset of the instruction
+            arg_address: the memory address of the argument, if any
+            src_address: the memory address of the accessed object, if any
+            is_mutable_type: if the argument is mutable
+            object_creation: if the instruction creates the object used
+        """
+        # Convert all fields first, such that a failing conversion does not leave
+        # the columns with different lengths.
+        kind_code = _KIND_CODES[kind]
+        file_id = self._intern(file)
+        argument_id = self._intern(argument)
+        lineno = _NO_LINENO if lineno is None else lineno
+        arg_address = _NO_ADDRESS if arg_address is None else arg_address
+        src_address = _NO_ADDRESS if src_address is None else src_address
+        flags = (_MUTABLE_TYPE if is_mutable_type else 0) | (
+            _OBJECT_CREATION if object_creation else 0
+        )
+        self._kinds.append(kind_code)
+        self._files.append(file_id)
+        self._code_object_ids.append(code_object_id)
+        self._node_ids.append(node_id)
+        self._opcodes.append(opcode)
+        self._arguments.append(argument_id)
+        self._linenos.append(lineno)
+        self._offsets.append(offset)
+        self._arg_addresses.append(arg_address)
+        self._src_addresses.append(src_address)
+        self._flags.append(flags)
+
+    def append(self, instruction: ExecutedInstruction) -> None:
+        """Appends an executed instruction.
+
+        Args:
+            instruction: The instruction to append
+        """
+        if isinstance(instruction, ExecutedMemoryInstruction):
+            self.add(
+                ExecutedMemoryInstruction,
+                instruction.file,
+                instruction.code_object_id,
+                instruction.node_id,
+                instruction.opcode,
+                instruction.argument,
+                instruction.lineno,
+                instruction.offset,
+                arg_address=instruction.arg_address,
+                is_mutable_type=instruction.is_mutable_type,
+                object_creation=instruction.object_creation,
+            )
+        elif isinstance(instruction, ExecutedAttributeInstruction):
+            self.add(
+                ExecutedAttributeInstruction,
+                instruction.file,
+                instruction.code_object_id,
+                instruction.node_id,
+                instruction.opcode,
+                instruction.argument,
+                instruction.lineno,
+                instruction.offset,
+                arg_address=instruction.arg_address,
+                src_address=instruction.src_address,
+                is_mutable_type=instruction.is_mutable_type,
+            )
+        else:
+            self.add(
+                type(instruction),
+                instruction.file,
+                instruction.code_object_id,
+                instruction.node_id,
+                instruction.opcode,
+                instruction.argument,
+                instruction.lineno,
+                instruction.offset,
+            )
+
+    def extend(self, instructions: Iterable[ExecutedInstruction]) -> None:
+        """Appends all given executed instructions.
+
+        The columns of another log are appended as a whole, only the ids of its
+        interned values are translated.
+
+        Args:
+            instructions: The instructions to append
+        """
+        if not isinstance(instructions, ExecutedInstructionLog):
+            for instruction in instructions:
+                self.append(instruction)  # noqa: PERF402
+            return
+        if instructions is self:
+            instructions = instructions.copy()
+        value_ids = [self._intern(value) for value in instructions._values]
+        for own, other in zip(self._columns(), instructions._columns(), strict=True):
+            own.extend(other)
+        if value_ids != list(range(len(value_ids))):
+            start = len(self._files) - len(instructions)
+            self._files[start:] = array(
+                "I", map(value_ids.__getitem__, instructions._files)
+            )
+            self._arguments[start:] = array(
+                "I", map(value_ids.__getitem__, instructions._arguments)
+            )
+
+    def copy(self) -> ExecutedInstructionLog:
+        """Provides a copy of this log.
+
+        Returns:
+            A copy of this log
+        """
+        copied = ExecutedInstructionLog()
+        copied.__setstate__(
+            (list(self._values), tuple(column[:] for column in self._columns()))
+        )
+        return copied
+
+    def file(self, index: int) -> str:
+        """Provides the file name of the instruction at the given index.
+
+        Args:
+            index: The position in the log
+
+        Returns:
+            The file name of the module containing the instruction
+        """
+        return self._values[self._files[index]]
+
+    def code_object_id(self, index: int) -> int:
+        """Provides the code object id of the instruction at the given index.
+
+        Args:
+            index: The position in the log
+
+        Returns:
+            The id of the code object containing the instruction
+        """
+        return self._code_object_ids[index]
+
+    def node_id(self, index: int) -> int:
+        """Provides the node id of the instruction at the given index.
+
+        Args:
+            index: The position in the log
+
+        Returns:
+            The id of the node containing the instruction
+        """
+        return self._node_ids[index]
+
+    def opcode(self, index: int) -> int:
+        """Provides the opcode of the instruction at the given index.
+
+        Args:
+            index: The position in the log
+
+        Returns:
+            The opcode of the instruction
+        """
+        return self._opcodes[index]
+
+    def argument(self, index: int) -> int | str | None:
+        """Provides the argument of the instruction at the given index.
+
+        Args:
+            index: The position in the log
+
+        Returns:
+            The argument of the instruction
+        """
+        return self._values[self._arguments[index]]
+
+    def lineno(self, index: int) -> int | None:
+        """Provides the line number of the instruction at the given index.
+
+        Args:
+            index: The position in the log
+
+        Returns:
+            The line number of the instruction, if it has one
+        """
+        return None if (lineno := self._linenos[index]) == _NO_LINENO else lineno
+
+    def offset(self, index: int) -> int:
+        """Provides the offset of the instruction at the given index.
+
+        Args:
+            index: The position in the log
+
+        Returns:
+            The offset of the instruction
+        """
+        return self._offsets[index]
+
+    def is_jump(self, index: int) -> bool:
+        """Whether the instruction at the given index is a jump condition.
+
+        Args:
+            index: The position in the log
+
+        Returns:
+            True, if the instruction is a jump condition, False otherwise.
+        """
+        return _KINDS[self._kinds[index]].is_jump()
+
+    def rindex_opcode(self, opcode: int) -> int:
+        """Provides the position of the last instruction with the given opcode.
+
+        Args:
+            opcode: The opcode to look for
+
+        Returns:
+            The last position of an instruction with this opcode, or -1 if none
+        """
+        opcodes = self._opcodes
+        for index in range(len(opcodes) - 1, -1, -1):
+            if opcodes[index] == opcode:
+                return index
+        return -1
+
+
+def _address(address: int) -> Any:
+    # The tracer records None for addresses it does not know.
+    return None if address == _NO_ADDRESS else address
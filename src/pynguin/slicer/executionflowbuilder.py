@@ -9,8 +9,6 @@
 """Provides classes to reconstruct the execution given an execution trace."""
 from __future__ import annotations
 
-import dis
-
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -25,7 +23,6 @@ UNSET = object()
 
 if TYPE_CHECKING:
     from pynguin.instrumentation.instrumentation import CodeObjectMetaData
-    from pynguin.slicer.executedinstruction import ExecutedInstruction
     from pynguin.testcase.execution import ExecutionTrace
 
 
@@ -71,8 +68,8 @@ class UniqueInstruction(Instr):
         self.offset = offset
 
         # Additional information from disassembly
-        dis_instr = self.locate_in_disassembly(
-            list(dis.get_instructions(code_meta.code_object))
+        dis_instr = code_meta.bytecode_index.disassembled_instruction(
+            self.opcode, offset
         )
         self.dis_arg = dis_instr.arg
         self.is_jump_target = dis_instr.is_jump_target
@@ -121,34 +118,6 @@ class UniqueInstruction(Instr):
         """
         return self.opcode in op.COND_BRANCH_INSTRUCTIONS
 
-    def locate_in_disassembly(self, disassembly) -> dis.Instruction:
-        """Retrieves the instruction inside disassembled bytecode.
-
-        Args:
-            disassembly: the disassembled bytecode containing the instruction
-
-        Returns:
-            The instruction from withing the bytecode.
-
-        Raises:
-            InstructionNotFoundException: If the instruction is not
-                located in the code object.
-        """
-        # EXTENDED_ARG instructions are not counted for instrumented offsets,
-        # which has to be compensated here
-        offset_offset = 0
-
-        for dis_instr in disassembly:
-            if dis_instr.opcode == op.EXTENDED_ARG:
-                offset_offset += 2
-
-            if dis_instr.opcode == self.opcode and dis_instr.offset == (
-                self.offset + offset_offset
-            ):
-                return dis_instr
-
-        raise InstructionNotFoundException
-
     def __hash__(self):
         return hash((self.name, self.code_object_id, self.node_id, self.offset))
 
@@ -308,38 +277,35 @@ class ExecutionFlowBuilder:
             efb_state.file, instr, efb_state.co_id, efb_state.bb_id, efb_state.offset
         )
 
-        # Get the instruction last in the trace
-        last_traced_instr = self.trace.executed_instructions[trace_pos]
-
         # Determine last instruction
         last_instr = self._determine_last_instruction(
             efb_state,
             basic_block,
             instr_index,
-            last_traced_instr,
+            trace_pos,
             unique_instr,
         )
 
         # Handle return instruction
-        if last_traced_instr.opcode in op.OP_RETURN:
+        if self.trace.executed_instructions.opcode(trace_pos) in op.OP_RETURN:
             last_instr = self._handle_return_instructions(
                 efb_state,
                 instr,
                 last_instr,
-                last_traced_instr,
+                trace_pos,
                 unique_instr,
             )
 
         # Handle method invocation
         if not last_instr:  # type: ignore[truthy-bool]
             last_instr = self._handle_method_invocation(
-                efb_state, import_instr, last_traced_instr
+                efb_state, import_instr, trace_pos
             )
 
         # Handle generators and exceptions
         if not efb_state.call and not efb_state.returned:
             last_instr = self._handle_generator_and_exceptions(
-                efb_state, last_instr, last_traced_instr
+                efb_state, last_instr, trace_pos
             )
 
         return LastInstrState(
@@ -361,7 +327,7 @@ class ExecutionFlowBuilder:
         efb_state: ExecutionFlowBuilderState,
         basic_block,
         instr_index,
-        last_traced_instr,
+        trace_pos: int,
         unique_instr,
     ) -> Instr:
         if instr_index > 0:
@@ -372,16 +338,17 @@ class ExecutionFlowBuilder:
             # Instruction is the last instruction in this basic block
             # -> decide what to do with this instruction
             # The instruction is a jump target, check if it was jumped to
+            executed_instructions = self.trace.executed_instructions
             if (
-                last_traced_instr.is_jump()
-                and last_traced_instr.argument == efb_state.bb_id
+                executed_instructions.is_jump(trace_pos)
+                and executed_instructions.argument(trace_pos) == efb_state.bb_id
             ):
                 # It was jumped to this instruction,
                 # continue with target basic block of last traced
-                assert (
-                    efb_state.co_id == last_traced_instr.code_object_id
+                assert efb_state.co_id == executed_instructions.code_object_id(
+                    trace_pos
                 ), "Jump to instruction must originate from same code object"
-                last_instr = self._continue_at_last_traced(last_traced_instr, efb_state)
+                last_instr = self._continue_at_last_traced(trace_pos, efb_state)
                 efb_state.jump = True
             else:
                 # If this is not a jump target,
@@ -398,7 +365,7 @@ class ExecutionFlowBuilder:
         efb_state: ExecutionFlowBuilderState,
         instr,
         last_instr,
-        last_traced_instr,
+        trace_pos: int,
         unique_instr,
     ):
         if instr.opcode != op.IMPORT_NAME:
@@ -411,11 +378,10 @@ class ExecutionFlowBuilder:
             if last_instr:
                 if (last_instr.opcode in op.OP_CALL) or (
                     last_instr.opcode in op.TRACED_INSTRUCTIONS
-                    and last_instr.opcode != last_traced_instr.opcode
+                    and last_instr.opcode
+                    != self.trace.executed_instructions.opcode(trace_pos)
                 ):
-                    last_instr = self._continue_at_last_traced(
-                        last_traced_instr, efb_state
-                    )
+                    last_instr = self._continue_at_last_traced(trace_pos, efb_state)
                     efb_state.returned = True
 
             else:
@@ -424,13 +390,13 @@ class ExecutionFlowBuilder:
                 # setUp(), i.e. when no calls but multiple methods are involved.
                 # The only way to resolve this is to continue at the last traced
                 # instruction (RETURN).
-                last_instr = self._continue_at_last_traced(last_traced_instr, efb_state)
+                last_instr = self._continue_at_last_traced(trace_pos, efb_state)
                 efb_state.returned = True
         else:
             # Imports are "special calls": The instructions on the module level of
             # the imported module are executed before the IMPORT_NAME instruction
             # We call this an "import back call" here.
-            last_instr = self._continue_at_last_traced(last_traced_instr, efb_state)
+            last_instr = self._continue_at_last_traced(trace_pos, efb_state)
             efb_state.import_back_call = unique_instr
             efb_state.returned = True
         return last_instr
@@ -439,7 +405,7 @@ class ExecutionFlowBuilder:
         self,
         efb_state: ExecutionFlowBuilderState,
         import_instr: UniqueInstruction | None,
-        last_traced_instr,
+        trace_pos: int,
     ) -> Instr:
         # There is not last instruction in code object,
         # so there must have been a call.
@@ -449,7 +415,7 @@ class ExecutionFlowBuilder:
             # Either an explicit call (when the last traced is a call instruction),
             # or an implicit call to a magic method. In both cases tracing is
             # continued at the caller.
-            last_instr = self._continue_at_last_traced(last_traced_instr, efb_state)
+            last_instr = self._continue_at_last_traced(trace_pos, efb_state)
         else:
             # Imports are "special calls": the instructions on the module level of
             # the imported module are executed before the IMPORT_NAME instruction
@@ -463,25 +429,25 @@ class ExecutionFlowBuilder:
         self,
         efb_state: ExecutionFlowBuilderState,
         last_instr,
-        last_traced_instr: ExecutedInstruction,
+        trace_pos: int,
     ) -> Instr:
         if last_instr.opcode in [op.YIELD_VALUE, op.YIELD_FROM]:
             # Generators produce an unusual execution flow: the interpreter handles
             # jumps to the respective yield statement internally and we can not see
             # this in the trace. So we assume that this unusual case (explained in
             # the next branch) is not an exception but the return from a generator.
-            last_instr = self._continue_at_last_traced(last_traced_instr, efb_state)
+            last_instr = self._continue_at_last_traced(trace_pos, efb_state)
 
         elif (
             last_instr
             and last_instr.opcode in op.TRACED_INSTRUCTIONS
-            and last_instr.opcode != last_traced_instr.opcode
+            and last_instr.opcode != self.trace.executed_instructions.opcode(trace_pos)
         ):
             # The last instruction that is determined is not in the trace,
             # despite the fact that it should be. There is only one known remaining
             # reasons for this: during an exception. Tracing continues with the last
             # traced instruction (and probably misses some in between).
-            last_instr = self._continue_at_last_traced(last_traced_instr, efb_state)
+            last_instr = self._continue_at_last_traced(trace_pos, efb_state)
             efb_state.exception = True
         return last_instr
 
@@ -503,14 +469,15 @@ class ExecutionFlowBuilder:
 
     def _continue_at_last_traced(
         self,
-        last_traced_instr: ExecutedInstruction,
+        trace_pos: int,
         efb_state: ExecutionFlowBuilderState,
     ) -> Instr:
-        efb_state.file = last_traced_instr.file
-        efb_state.co_id = last_traced_instr.code_object_id
-        efb_state.bb_id = last_traced_instr.node_id
-        last_instr = self._locate_traced_in_bytecode(last_traced_instr)
-        efb_state.offset = last_traced_instr.offset
+        executed_instructions = self.trace.executed_instructions
+        efb_state.file = executed_instructions.file(trace_pos)
+        efb_state.co_id = executed_instructions.code_object_id(trace_pos)
+        efb_state.bb_id = executed_instructions.node_id(trace_pos)
+        last_instr = self._locate_traced_in_bytecode(trace_pos)
+        efb_state.offset = executed_instructions.offset(trace_pos)
 
         return last_instr
 
@@ -557,13 +524,8 @@ class ExecutionFlowBuilder:
         code_object = self.known_code_objects.get(code_object_id)
         assert code_object, "Unknown code object id"
         # Locate basic block in CFG to which instruction belongs
-        instr = None
-        for node in code_object.original_cfg.nodes:
-            if node.index == basic_block_id and node.basic_block:
-                instr = node.basic_block[-1]
-                break
-        assert instr, "Block did not contain a last instruction"
-        return instr  # type: ignore[return-value]
+        basic_block, _ = code_object.bytecode_index.basic_block(basic_block_id)
+        return basic_block[-1]
 
     def _get_basic_block(
         self, code_object_id: int, basic_block_id: int
@@ -586,27 +548,26 @@ class ExecutionFlowBuilder:
         """
         code_object = self.known_code_objects[code_object_id]
         assert code_object is not None, "Unknown code object id"
-        for node in code_object.original_cfg.nodes:
-            if node.index == basic_block_id and node.basic_block:
-                return node.basic_block, node.offset  # type: ignore[return-value]
-
-        raise InstructionNotFoundException
-
-    def _locate_traced_in_bytecode(self, instr: ExecutedInstruction) -> Instr:
-        basic_block, bb_offset = self._get_basic_block(
-            instr.code_object_id, instr.node_id
-        )
-
-        for instruction in basic_block:
-            if (
-                instr.opcode == instruction.opcode
-                and instr.lineno == instruction.lineno
-                and instr.offset == bb_offset
-            ):
-                return instruction
-            bb_offset += 2
-
-        raise InstructionNotFoundException
+        return code_object.bytecode_index.basic_block(basic_block_id)
+
+    def _locate_traced_in_bytecode(self, trace_pos: int) -> Instr:
+        executed_instructions = self.trace.executed_instructions
+        node_id = executed_instructions.node_id(trace_pos)
+        bytecode_index = self.known_code_objects[
+            executed_instructions.code_object_id(trace_pos)
+        ].bytecode_index
+        basic_block, _ = bytecode_index.basic_block(node_id)
+        instruction = basic_block[
+            bytecode_index.instruction_index(
+                node_id, executed_instructions.offset(trace_pos)
+            )
+        ]
+        if (
+            executed_instructions.opcode(trace_pos) != instruction.opcode
+            or executed_instructions.lineno(trace_pos) != instruction.lineno
+        ):
+            raise InstructionNotFoundException
+        return instruction
 
     @staticmethod
     def locate_in_basic_block(
@@ -627,9 +588,11 @@ class ExecutionFlowBuilder:
             InstructionNotFoundException: when the given instruction is
                 not in the given basic block
         """
-        for index, instruction in enumerate(basic_block):
-            if instruction == instr and instr_offset == bb_offset:
-                return index
-            bb_offset += 2
-
-        raise InstructionNotFoundException
+        index, remainder = divmod(instr_offset - bb_offset, 2)
+        if (
+            remainder
+            or not 0 <= index < len(basic_block)
+            or basic_block[index] != instr
+        ):
+            raise InstructionNotFoundException
+        return index
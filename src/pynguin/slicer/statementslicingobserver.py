@@ -14,9 +14,11 @@ import pynguin.testcase.statement as st
 import pynguin.testcase.testcase as tc
 import pynguin.utils.opcodes as op
 
-from pynguin.ga.computations import compute_statement_checked_lines
+from pynguin.ga.computations import compute_criteria_checked_lines
+from pynguin.ga.computations import select_statement_slicing_criteria
 from pynguin.slicer.dynamicslicer import SlicingCriterion
 from pynguin.slicer.executionflowbuilder import UniqueInstruction
+from pynguin.utils.exceptions import SlicingTimeoutException
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,7 +28,9 @@ class StatementSlicingObserver(ex.ExecutionObserver):
     """Observer that updates the checked lines of a testcase.
 
     Observes the execution of a test case and calculates the
-    slices of its statements.
+    slices of its statements.  The slices are calculated outside the executing
+    thread, such that slicing, which is bounded by its own timeout, does not count
+    against the timeout of the execution.
     """
 
     _STORE_INSTRUCTION_OFFSET = 3
@@ -36,6 +40,10 @@ class StatementSlicingObserver(ex.ExecutionObserver):
 
         def __init__(self):  # noqa: D107
             super().__init__()
+            self.reset()
+
+        def reset(self) -> None:
+            """Reset the slicing criteria for a new execution."""
             self.slicing_criteria: dict[int, SlicingCriterion] = {}
 
     def __init__(self, tracer: ex.ExecutionTracer) -> None:
@@ -47,12 +55,12 @@ class StatementSlicingObserver(ex.ExecutionObserver):
         self._tracer = tracer
         self._slicing_local_state = StatementSlicingObserver.SlicingLocalState()
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
+    @property
+    def rewrites_statements(self) -> bool:  # noqa: D102
+        return False
 
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self._slicing_local_state.reset()
 
     def before_statement_execution(  # noqa: D102
         self, statement: st.Statement, node: ast.stmt, exec_ctx: ex.ExecutionContext
@@ -96,20 +104,36 @@ class StatementSlicingObserver(ex.ExecutionObserver):
     def after_test_case_execution_inside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ex.ExecutionResult
     ) -> None:
-        checked_lines = compute_statement_checked_lines(
-            test_case.statements,
-            result.execution_trace,
-            self._tracer.get_subject_properties(),
-            self._slicing_local_state.slicing_criteria,
+        result.statement_slicing_criteria = select_statement_slicing_criteria(
+            test_case.statements, self._slicing_local_state.slicing_criteria
         )
-        result.execution_trace.checked_lines.update(checked_lines)
 
-    def after_test_case_execution_outside_thread(
+    def after_test_case_execution_outside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ex.ExecutionResult
     ) -> None:
-        """Not used.
-
-        Args:
-            test_case: Not used
-            result: Not used
-        """
+        if not result.statement_slicing_criteria:
+            return
+        result.execution_trace.checked_lines.update(
+            _compute_checked_lines(
+                result.execution_trace,
+                self._tracer.get_subject_properties(),
+                result.statement_slicing_criteria,
+            )
+        )
+        result.statement_slicing_criteria = []
+
+
+def _compute_checked_lines(
+    trace: ex.ExecutionTrace,
+    subject_properties: ex.SubjectProperties,
+    slicing_criteria: list[SlicingCriterion],
+) -> set[int]:
+    # A test case whose slicing timed out is not failed, its lines are rather
+    # reported unchecked.
+    try:
+        return compute_criteria_checked_lines(
+            trace, subject_properties, slicing_criteria
+        )
+    except SlicingTimeoutException:
+        _LOGGER.debug("Slicing the statements of a test case timed out")
+        return set()
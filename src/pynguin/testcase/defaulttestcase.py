@@ -40,6 +40,7 @@ class DefaultTestCase(tc.TestCase):
             self._statements.append(statement)
         else:
             self._statements.insert(position, statement)
+        self.invalidate_structural_hash()
         return statement.ret_val
 
     def add_variable_creating_statement(  # noqa: D102
@@ -49,10 +50,12 @@ class DefaultTestCase(tc.TestCase):
             self._statements.append(statement)
         else:
             self._statements.insert(position, statement)
+        self.invalidate_structural_hash()
         return statement.ret_val
 
     def add_statements(self, statements: list[stmt.Statement]) -> None:  # noqa: D102
         self._statements.extend(statements)
+        self.invalidate_structural_hash()
 
     def append_test_case(self, test_case: tc.TestCase) -> None:  # noqa: D102
         memo: dict[vr.VariableReference, vr.VariableReference] = {}
@@ -63,20 +66,24 @@ class DefaultTestCase(tc.TestCase):
                 # Thus we know that clone.ret_val is not None
                 memo[statement.ret_val] = clone.ret_val  # type: ignore[assignment]
             self._statements.append(clone)
+        self.invalidate_structural_hash()
 
     def remove(self, position: int) -> None:  # noqa: D102
         self._logger.debug("Removing statement at position %d", position)
         if position >= self.size():
             return
         del self._statements[position]
+        self.invalidate_structural_hash()
 
     def remove_statement(self, statement: stmt.Statement) -> None:  # noqa: D102
         self._statements.remove(statement)
+        self.invalidate_structural_hash()
 
     def chop(self, pos: int) -> None:  # noqa: D102
         assert pos >= 0
         while len(self._statements) > pos + 1:
             del self._statements[-1]
+        self.invalidate_structural_hash()
 
     def contains(self, statement: stmt.Statement) -> bool:  # noqa: D102
         return statement in self._statements
@@ -90,6 +97,7 @@ class DefaultTestCase(tc.TestCase):
     ) -> vr.VariableReference | None:
         assert 0 <= position < len(self._statements)
         self._statements[position] = statement
+        self.invalidate_structural_hash()
         return statement.ret_val
 
     def has_statement(self, position: int) -> bool:  # noqa: D102
@@ -106,6 +114,9 @@ class DefaultTestCase(tc.TestCase):
                 memo[statement.ret_val] = copy.ret_val  # type: ignore[assignment]
             test_case._statements.append(copy)
             copy.assertions = statement.copy_assertions(memo)
+        if limit is None:
+            # The clone is structurally equal to this test case.
+            test_case._structural_hash = self._structural_hash
         return test_case
 
     def get_dependencies(  # noqa: D102
@@ -150,7 +161,9 @@ class DefaultTestCase(tc.TestCase):
             if other._statements:
                 return False
         else:
-            if len(self._statements) != len(other._statements):
+            if len(self._statements) != len(other._statements) or self._hash_differs(
+                other
+            ):
                 return False
             memo: dict[vr.VariableReference, vr.VariableReference] = {}
             for left, right in zip(self._statements, other._statements, strict=True):
@@ -166,10 +179,22 @@ class DefaultTestCase(tc.TestCase):
                     return False
         return True
 
+    def _hash_differs(self, other: DefaultTestCase) -> bool:
+        # Only compare the hashes if they are already known.
+        return (
+            self._structural_hash is not None
+            and other._structural_hash is not None
+            and self._structural_hash != other._structural_hash
+        )
+
     def __hash__(self) -> int:
-        memo: dict[vr.VariableReference, int] = {
-            statement.ret_val: idx
-            for idx, statement in enumerate(self._statements)
-            if statement.ret_val is not None
-        }
-        return hash(tuple(s.structural_hash(memo) for s in self._statements))
+        if self._structural_hash is None:
+            memo: dict[vr.VariableReference, int] = {
+                statement.ret_val: idx
+                for idx, statement in enumerate(self._statements)
+                if statement.ret_val is not None
+            }
+            self._structural_hash = hash(
+                tuple(s.structural_hash(memo) for s in self._statements)
+            )
+        return self._structural_hash
@@ -12,13 +12,28 @@ import ast
 import contextlib
 import copy
 import dataclasses
+import enum
 import inspect
+import io
+import itertools
 import logging
+import math
+import multiprocessing
+import operator
 import os
+import pickle
+import signal
 import sys
 import threading
+import time
 
 from abc import abstractmethod
+from collections import Counter
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
 from collections.abc import Sized
 from dataclasses import dataclass
 from dataclasses import field
@@ -28,6 +43,7 @@ from queue import Empty
 from queue import Queue
 from types import BuiltinFunctionType
 from types import BuiltinMethodType
+from types import CodeType
 from types import ModuleType
 from typing import TYPE_CHECKING
 from typing import Any
@@ -49,6 +65,7 @@ import pynguin.configuration as config
 import pynguin.slicer.executedinstruction as ei
 import pynguin.testcase.statement as stmt
 import pynguin.testcase.statement_to_ast as stmt_to_ast
+import pynguin.testcase.testcase as tc
 import pynguin.testcase.variablereference as vr
 import pynguin.utils.generic.genericaccessibleobject as gao
 import pynguin.utils.namingscope as ns
@@ -59,12 +76,16 @@ from pynguin.analyses.typesystem import ANY
 from pynguin.analyses.typesystem import Instance
 from pynguin.analyses.typesystem import ProperType
 from pynguin.analyses.typesystem import TupleType
+from pynguin.analyses.typesystem import TypeInfo
 from pynguin.instrumentation.instrumentation import ArtificialInstr
 from pynguin.instrumentation.instrumentation import CheckedCoverageInstrumentation
 from pynguin.instrumentation.instrumentation import CodeObjectMetaData
 from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.instrumentation.instrumentation import PredicateMetaData
 from pynguin.instrumentation.instrumentation import PynguinCompare
+from pynguin.utils.compactcollections import DenseCountMapping
+from pynguin.utils.compactcollections import DenseDistanceMapping
+from pynguin.utils.compactcollections import DenseSet
 from pynguin.utils.mirror import Mirror
 from pynguin.utils.orderedset import OrderedSet
 from pynguin.utils.type_utils import given_exception_matches
@@ -76,9 +97,11 @@ from pynguin.utils.type_utils import is_string
 immutable_types = (int, float, complex, str, tuple, frozenset, bytes)
 
 if TYPE_CHECKING:
-    import pynguin.testcase.testcase as tc
+    from multiprocessing.connection import Connection
+    from typing import ClassVar
 
     from pynguin.analyses import module
+    from pynguin.slicer.dynamicslicer import SlicingCriterion
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -143,6 +166,21 @@ class ExecutionContext:
         """
         return self._variable_names
 
+    def rebind_variables(self, statements: Sequence[stmt.Statement]) -> None:
+        """Bind the variables of the given statements to the existing values.
+
+        Variables are named in the order in which the statements refer to them.
+        Rebinding the variables of statements that are structurally equal to the
+        statements that were executed in this context thus gives them the names, and
+        therefore the values, of the variables of the executed statements.
+
+        Args:
+            statements: Statements that are structurally equal to the executed ones
+        """
+        self._variable_names = ns.NamingScope()
+        for statement in statements:
+            self.node_for_statement(statement)
+
     def get_reference_value(self, reference: vr.Reference) -> Any:
         """Resolve the given reference in this execution context.
 
@@ -250,9 +288,10 @@ class ExecutionObserver:
     """An Observer that can be used to observe the execution of a test case.
 
     Important Note: If an observer is stateful, then this state must be encapsulated
-    in a threading.local, i.e., be bound to a thread. Note that thread local data
-    is initialized per thread, so there is no need to clear any pre-existing data
-    (because there is none), as every thread gets its own instance.
+    in a threading.local, i.e., be bound to a thread. Note that the executing thread
+    is reused for subsequent test cases, so an observer has to reset its thread local
+    data in ExecutionObserver::before_test_case_execution, which is called from
+    inside the executing thread.
 
     Methods that are called from within the thread are not allowed to interact with the
     'outside'. The only thing that should leave an observer are results when they are
@@ -269,10 +308,44 @@ class ExecutionObserver:
     For more details, look at some implementations, e.g., AssertionTraceObserver.
     """
 
+    @property
+    def rewrites_statements(self) -> bool:
+        """Might this observer return a different node for a statement?
+
+        The executor compiles a whole test case at once, if none of its observers
+        rewrites the nodes of statements in
+        ExecutionObserver::before_statement_execution.  Observers that never do so
+        should override this to return False.
+
+        Returns:
+            Whether this observer might rewrite the nodes of statements
+        """
+        return True
+
+    @property
+    def supports_prefix_snapshots(self) -> bool:
+        """Can executions observed by this observer be resumed from a snapshot?
+
+        A PrefixSnapshotTestCaseExecutor resumes the execution of a test case from a
+        snapshot that was taken while executing a structurally equal prefix of
+        another test case.  The observer then sees the statements of the prefix of
+        the other test case, and the remaining statements of the resumed one, in a
+        forked process.  This is only sound for observers that refer to statements
+        by their position and that do not count executions inside the executing
+        thread.  Observers that fulfil this should override this to return True.
+
+        Returns:
+            Whether executions observed by this observer can be resumed
+        """
+        return False
+
     @abstractmethod
     def before_test_case_execution(self, test_case: tc.TestCase):
         """Called before test case execution.
 
+        The call happens from inside the thread that executes the test case, so this
+        is the place to reset any thread local state from a previous execution.
+
         Args:
             test_case: The test cases that will be executed.
         """
@@ -311,6 +384,21 @@ class ExecutionObserver:
             result: The execution result
         """
 
+    def after_remote_test_case_execution(
+        self, test_case: tc.TestCase, executed_statements: int
+    ) -> None:
+        """Called from the main thread after a test case was executed in a process.
+
+        The state that an observer changes in another process, e.g., in a worker
+        process of a ParallelTestCaseExecutor, is lost.  Observers that count
+        executions inside the executing thread should override this to count the
+        execution of the test case and of the statements that were reached.
+
+        Args:
+            test_case: The test case that was executed
+            executed_statements: The number of statements that were executed
+        """
+
     @abstractmethod
     def before_statement_execution(
         self, statement: stmt.Statement, node: ast.stmt, exec_ctx: ExecutionContext
@@ -358,6 +446,10 @@ class AssertionExecutionObserver(ExecutionObserver):
         """
         self._tracer = tracer
 
+    @property
+    def rewrites_statements(self) -> bool:  # noqa: D102
+        return False
+
     def before_test_case_execution(self, test_case: tc.TestCase):
         """Not used.
 
@@ -415,7 +507,9 @@ class AssertionExecutionObserver(ExecutionObserver):
                 )
                 executor.execute_ast(assertion_node, exec_ctx)
 
-                code_object_id, node_id = self._get_assertion_node_and_code_object_ids()
+                code_object_id = executor.last_code_object_id
+                assert code_object_id is not None, "Assertion was not instrumented"
+                node_id = self._get_assertion_node_id(code_object_id)
                 self._tracer.register_assertion_position(
                     code_object_id, node_id, assertion
                 )
@@ -424,12 +518,10 @@ class AssertionExecutionObserver(ExecutionObserver):
                 # Restore old state
                 self._tracer.disable()
 
-    def _get_assertion_node_and_code_object_ids(self) -> tuple[int, int]:
-        existing_code_objects = (
-            self._tracer.get_subject_properties().existing_code_objects
-        )
-        code_object_id = len(existing_code_objects) - 1
-        code_object = existing_code_objects[code_object_id]
+    def _get_assertion_node_id(self, code_object_id: int) -> int:
+        code_object = self._tracer.get_subject_properties().existing_code_objects[
+            code_object_id
+        ]
         assert_node = None
         for node in code_object.cfg.nodes:
             if node.is_artificial:
@@ -441,7 +533,7 @@ class AssertionExecutionObserver(ExecutionObserver):
             ):
                 assert_node = node
         assert assert_node
-        return code_object_id, assert_node.index
+        return assert_node.index
 
 
 class ReturnTypeObserver(ExecutionObserver):
@@ -455,6 +547,10 @@ class ReturnTypeObserver(ExecutionObserver):
 
         def __init__(self):  # noqa: D107
             super().__init__()
+            self.reset()
+
+        def reset(self) -> None:
+            """Reset the observed return types for a new execution."""
             self.return_type_trace: dict[int, type] = {}
             self.return_type_generic_args: dict[int, tuple[type, ...]] = {}
 
@@ -469,12 +565,16 @@ class ReturnTypeObserver(ExecutionObserver):
         # Non-local state
         self._test_cluster = test_cluster
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
+    @property
+    def rewrites_statements(self) -> bool:  # noqa: D102
+        return False
 
-        Args:
-            test_case: Not used
-        """
+    @property
+    def supports_prefix_snapshots(self) -> bool:  # noqa: D102
+        return True
+
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self._return_type_local_state.reset()
 
     def after_test_case_execution_inside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ExecutionResult
@@ -565,14 +665,36 @@ class ExecutionTrace:
 
     _logger = logging.getLogger(__name__)
 
-    executed_code_objects: OrderedSet[int] = field(default_factory=OrderedSet)
-    executed_predicates: dict[int, int] = field(default_factory=dict)
-    true_distances: dict[int, float] = field(default_factory=dict)
-    false_distances: dict[int, float] = field(default_factory=dict)
-    covered_line_ids: OrderedSet[int] = field(default_factory=OrderedSet)
-    executed_instructions: list[ei.ExecutedInstruction] = field(default_factory=list)
+    executed_code_objects: DenseSet = field(default_factory=DenseSet)
+    executed_predicates: DenseCountMapping = field(default_factory=DenseCountMapping)
+    true_distances: DenseDistanceMapping = field(default_factory=DenseDistanceMapping)
+    false_distances: DenseDistanceMapping = field(default_factory=DenseDistanceMapping)
+    covered_line_ids: DenseSet = field(default_factory=DenseSet)
+    executed_instructions: ei.ExecutedInstructionLog = field(
+        default_factory=ei.ExecutedInstructionLog
+    )
     executed_assertions: list[ExecutedAssertion] = field(default_factory=list)
-    checked_lines: OrderedSet[int] = field(default_factory=OrderedSet)
+    checked_lines: DenseSet = field(default_factory=DenseSet)
+
+    def __post_init__(self) -> None:
+        # The ids are dense, so store them in compact containers, even if the
+        # trace was created from arbitrary sets and dicts.
+        if not isinstance(self.executed_code_objects, DenseSet):
+            self.executed_code_objects = DenseSet(self.executed_code_objects)
+        if not isinstance(self.executed_predicates, DenseCountMapping):
+            self.executed_predicates = DenseCountMapping(self.executed_predicates)
+        if not isinstance(self.true_distances, DenseDistanceMapping):
+            self.true_distances = DenseDistanceMapping(self.true_distances)
+        if not isinstance(self.false_distances, DenseDistanceMapping):
+            self.false_distances = DenseDistanceMapping(self.false_distances)
+        if not isinstance(self.covered_line_ids, DenseSet):
+            self.covered_line_ids = DenseSet(self.covered_line_ids)
+        if not isinstance(self.checked_lines, DenseSet):
+            self.checked_lines = DenseSet(self.checked_lines)
+        if not isinstance(self.executed_instructions, ei.ExecutedInstructionLog):
+            self.executed_instructions = ei.ExecutedInstructionLog(
+                self.executed_instructions
+            )
 
     def merge(self, other: ExecutionTrace) -> None:
         """Merge the values from the other execution trace.
@@ -581,12 +703,14 @@ class ExecutionTrace:
             other: Merges the other traces into this trace
         """
         self.executed_code_objects.update(other.executed_code_objects)
-        for key, value in other.executed_predicates.items():
-            self.executed_predicates[key] = self.executed_predicates.get(key, 0) + value
-        self._merge_min(self.true_distances, other.true_distances)
-        self._merge_min(self.false_distances, other.false_distances)
+        self.executed_predicates.merge(other.executed_predicates)
+        self.true_distances.merge(other.true_distances)
+        self.false_distances.merge(other.false_distances)
         self.covered_line_ids.update(other.covered_line_ids)
         self.checked_lines.update(other.checked_lines)
+        self._merge_instructions(other)
+
+    def _merge_instructions(self, other: ExecutionTrace) -> None:
         shift: int = len(self.executed_instructions)
         self.executed_instructions.extend(other.executed_instructions)
         self.executed_assertions.extend(
@@ -599,16 +723,35 @@ class ExecutionTrace:
             for executed_assertion in other.executed_assertions
         )
 
-    @staticmethod
-    def _merge_min(target: dict[int, float], source: dict[int, float]) -> None:
-        """Merge source into target. Minimum value wins.
+    def approximate_size(self) -> int:
+        """Approximates the memory used by this trace, in bytes.
 
-        Args:
-            target: the target to merge the values in
-            source: the source of the merge
+        The executed instructions are stored column-wise, so their log reports
+        its own size.  The size of the executed assertions is extrapolated from
+        the first one instead of measuring each of them.
+
+        Returns:
+            The approximate size of this trace in bytes
         """
-        for key, value in source.items():
-            target[key] = min(target.get(key, inf), value)
+        size = sum(
+            sys.getsizeof(container)
+            for container in (
+                self.executed_code_objects,
+                self.executed_predicates,
+                self.true_distances,
+                self.false_distances,
+                self.covered_line_ids,
+                self.executed_instructions,
+                self.executed_assertions,
+                self.checked_lines,
+            )
+        )
+        if self.executed_assertions:
+            first = self.executed_assertions[0]
+            size += len(self.executed_assertions) * (
+                sys.getsizeof(first) + sys.getsizeof(vars(first))
+            )
+        return size
 
     def update_predicate_distances(
         self, distance_true: float, distance_false: float, predicate: int
@@ -620,15 +763,9 @@ class ExecutionTrace:
             distance_false: the measured false distance
             predicate: the predicate id
         """
-        self.executed_predicates[predicate] = (
-            self.executed_predicates.get(predicate, 0) + 1
-        )
-        self.true_distances[predicate] = min(
-            self.true_distances.get(predicate, inf), distance_true
-        )
-        self.false_distances[predicate] = min(
-            self.false_distances.get(predicate, inf), distance_false
-        )
+        self.executed_predicates.increment(predicate)
+        self.true_distances.minimize(predicate, distance_true)
+        self.false_distances.minimize(predicate, distance_false)
 
     def add_instruction(
         self,
@@ -649,10 +786,16 @@ class ExecutionTrace:
             lineno: the line number of the instruction
             offset: the offset of the instruction
         """
-        executed_instr = ei.ExecutedInstruction(
-            module, code_object_id, node_id, opcode, None, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            None,
+            lineno,
+            offset,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_memory_instruction(
         self,
@@ -681,7 +824,8 @@ class ExecutionTrace:
             is_mutable_type: if the argument is mutable
             object_creation: if the instruction creates the object used
         """
-        executed_instr = ei.ExecutedMemoryInstruction(
+        self.executed_instructions.add(
+            ei.ExecutedMemoryInstruction,
             module,
             code_object_id,
             node_id,
@@ -689,11 +833,10 @@ class ExecutionTrace:
             arg_name,
             lineno,
             offset,
-            arg_address,
-            is_mutable_type,
-            object_creation,
+            arg_address=arg_address,
+            is_mutable_type=is_mutable_type,
+            object_creation=object_creation,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_attribute_instruction(
         self,
@@ -722,7 +865,8 @@ class ExecutionTrace:
             arg_address: the memory address of the argument
             is_mutable_type: if the attribute is mutable
         """
-        executed_instr = ei.ExecutedAttributeInstruction(
+        self.executed_instructions.add(
+            ei.ExecutedAttributeInstruction,
             module,
             code_object_id,
             node_id,
@@ -730,11 +874,10 @@ class ExecutionTrace:
             attr_name,
             lineno,
             offset,
-            src_address,
-            arg_address,
-            is_mutable_type,
+            arg_address=arg_address,
+            src_address=src_address,
+            is_mutable_type=is_mutable_type,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_jump_instruction(
         self,
@@ -757,10 +900,16 @@ class ExecutionTrace:
             offset: the offset of the instruction
             target_id: the target offset to jump to
         """
-        executed_instr = ei.ExecutedControlInstruction(
-            module, code_object_id, node_id, opcode, target_id, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedControlInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            target_id,
+            lineno,
+            offset,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_call_instruction(
         self,
@@ -783,12 +932,17 @@ class ExecutionTrace:
             offset: the offset of the instruction
             arg: the argument to the instruction
         """
-        executed_instr = ei.ExecutedCallInstruction(
-            module, code_object_id, node_id, opcode, arg, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedCallInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            arg,
+            lineno,
+            offset,
         )
 
-        self.executed_instructions.append(executed_instr)
-
     def add_return_instruction(
         self,
         module: str,
@@ -808,11 +962,216 @@ class ExecutionTrace:
             lineno: the line number of the instruction
             offset: the offset of the instruction
         """
-        executed_instr = ei.ExecutedReturnInstruction(
-            module, code_object_id, node_id, opcode, None, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedReturnInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            None,
+            lineno,
+            offset,
+        )
+
+
+class AggregatedExecutionTrace:
+    """The merged trace of a changing list of execution results.
+
+    Merging the traces of all results each time the fitness or coverage of a test
+    suite is computed costs time proportional to the size of the whole suite.  This
+    class keeps the merged trace of the results it was last updated with and only
+    adds, or takes out, the traces of the results that changed since then.
+
+    Execution counts can simply be subtracted again.  The covered ids are
+    recomputed with a single bitwise or over all traces, and minimal branch
+    distances only for the predicates for which a removed trace held the minimum.
+    """
+
+    def __init__(self, orig: AggregatedExecutionTrace | None = None) -> None:
+        """Initializes the aggregated trace.
+
+        Args:
+            orig: Original, if we clone an existing aggregated trace.
+        """
+        self._results: list[ExecutionResult] = []
+        self._trace = ExecutionTrace()
+        if orig is not None:
+            self._results = list(orig._results)
+            trace = orig._trace
+            self._trace = ExecutionTrace(
+                executed_code_objects=trace.executed_code_objects.copy(),
+                executed_predicates=trace.executed_predicates.copy(),
+                true_distances=trace.true_distances.copy(),
+                false_distances=trace.false_distances.copy(),
+                covered_line_ids=trace.covered_line_ids.copy(),
+                executed_instructions=trace.executed_instructions.copy(),
+                executed_assertions=list(trace.executed_assertions),
+                checked_lines=trace.checked_lines.copy(),
+            )
+
+    @property
+    def results(self) -> list[ExecutionResult]:
+        """Provides the results of the last update, whose traces are merged.
+
+        Returns:
+            The merged results
+        """
+        return self._results
+
+    @property
+    def trace(self) -> ExecutionTrace:
+        """Provides the merged trace of the results of the last update.
+
+        Returns:
+            The merged trace
+        """
+        return self._trace
+
+    def clone(self) -> AggregatedExecutionTrace:
+        """Clones the aggregated trace.
+
+        Returns:
+            A clone of this aggregated trace
+        """
+        return AggregatedExecutionTrace(orig=self)
+
+    def update(self, results: list[ExecutionResult]) -> ExecutionTrace:
+        """Update the merged trace to the given results.
+
+        The returned trace is updated in place by later calls and must not be
+        modified.
+
+        Args:
+            results: The results whose traces shall be merged
+
+        Returns:
+            The merged traces of the given results.
+        """
+        previous = self._results
+        unchanged_prefix = len(previous) <= len(results) and all(
+            map(operator.is_, previous, results)
         )
+        if unchanged_prefix:
+            for result in results[len(previous) :]:
+                assert result.execution_trace is not None
+                self._trace.merge(result.execution_trace)
+        else:
+            self._replace(previous, results)
+        self._results = list(results)
+        return self._trace
+
+    def _replace(
+        self, previous: list[ExecutionResult], results: list[ExecutionResult]
+    ) -> None:
+        removed = _identity_difference(previous, results)
+        added = _identity_difference(results, previous)
+
+        trace = self._trace
+        dirty_true: set[int] = set()
+        dirty_false: set[int] = set()
+        for result in removed:
+            removed_trace = result.execution_trace
+            assert removed_trace is not None
+            trace.executed_predicates.subtract(removed_trace.executed_predicates)
+            dirty_true.update(
+                _held_minima(removed_trace.true_distances, trace.true_distances)
+            )
+            dirty_false.update(
+                _held_minima(removed_trace.false_distances, trace.false_distances)
+            )
+        for result in added:
+            added_trace = result.execution_trace
+            assert added_trace is not None
+            trace.executed_predicates.merge(added_trace.executed_predicates)
+            trace.true_distances.merge(added_trace.true_distances)
+            trace.false_distances.merge(added_trace.false_distances)
+
+        traces = [result.execution_trace for result in results]
+        _recompute_minima(
+            trace.true_distances,
+            dirty_true,
+            [other.true_distances for other in traces],
+        )
+        _recompute_minima(
+            trace.false_distances,
+            dirty_false,
+            [other.false_distances for other in traces],
+        )
+        trace.executed_code_objects = DenseSet()
+        trace.executed_code_objects.update(
+            *(other.executed_code_objects for other in traces)
+        )
+        trace.covered_line_ids = DenseSet()
+        trace.covered_line_ids.update(*(other.covered_line_ids for other in traces))
+        trace.checked_lines = DenseSet()
+        trace.checked_lines.update(*(other.checked_lines for other in traces))
+        trace.executed_instructions = ei.ExecutedInstructionLog()
+        trace.executed_assertions = []
+        for other in traces:
+            trace._merge_instructions(other)
+
+
+def _identity_difference(
+    left: list[ExecutionResult], right: list[ExecutionResult]
+) -> list[ExecutionResult]:
+    """Provides the results of the left list that are not in the right list.
+
+    Results are compared by identity and duplicates are counted.
+
+    Args:
+        left: The results to filter
+        right: The results to remove
+
+    Returns:
+        The results of the left list that are not in the right list
+    """
+    remaining = Counter(map(id, right))
+    difference = []
+    for result in left:
+        if remaining[id(result)] > 0:
+            remaining[id(result)] -= 1
+        else:
+            difference.append(result)
+    return difference
+
+
+def _held_minima(
+    distances: Mapping[int, float], minima: Mapping[int, float]
+) -> list[int]:
+    """Provides the predicates whose minimal distance stems from the given distances.
+
+    Args:
+        distances: The distances of a single trace
+        minima: The minimal distances over all traces
+
+    Returns:
+        The predicates for which the given distances are minimal
+    """
+    return [key for key, value in distances.items() if not value > minima[key]]
 
-        self.executed_instructions.append(executed_instr)
+
+def _recompute_minima(
+    minima: DenseDistanceMapping,
+    predicates: set[int],
+    all_distances: list[DenseDistanceMapping],
+) -> None:
+    """Recomputes the minimal distances of the given predicates.
+
+    Args:
+        minima: The minimal distances that are updated
+        predicates: The predicates whose minimum is recomputed
+        all_distances: The distances of all traces
+    """
+    for predicate in predicates:
+        values = [
+            distances[predicate]
+            for distances in all_distances
+            if predicate in distances
+        ]
+        if values:
+            minima[predicate] = min(values)
+        else:
+            del minima[predicate]
 
 
 @dataclasses.dataclass
@@ -849,6 +1208,12 @@ class ExecutionResult:
         default_factory=dict, init=False
     )
 
+    # Slicing criteria of the statements, which are sliced outside the executing
+    # thread.
+    statement_slicing_criteria: list[SlicingCriterion] = dataclasses.field(
+        default_factory=list, init=False
+    )
+
     def has_test_exceptions(self) -> bool:
         """Returns true if any exceptions were thrown during the execution.
 
@@ -991,6 +1356,82 @@ class SubjectProperties:
     object_addresses: OrderedSet[int] = field(default_factory=OrderedSet)
 
 
+class InstrumentationProfile:
+    """Counts the invocations of the hooks of a tracer and the time spent in them.
+
+    The counters are kept per hook and code object.  A line is attributed to the
+    code object in which it is first defined.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self._calls: Counter[tuple[str, int]] = Counter()
+        self._time_ns: Counter[tuple[str, int]] = Counter()
+
+    def record(self, hook: str, code_object_id: int, elapsed_ns: int) -> None:
+        """Records an invocation of a hook.
+
+        Args:
+            hook: The name of the hook
+            code_object_id: The id of the code object that invoked the hook
+            elapsed_ns: The time spent in the hook in nanoseconds
+        """
+        key = hook, code_object_id
+        self._calls[key] += 1
+        self._time_ns[key] += elapsed_ns
+
+    @property
+    def total_calls(self) -> int:
+        """Provides the number of invocations of all hooks.
+
+        Returns:
+            The number of invocations
+        """
+        return sum(self._calls.values())
+
+    @property
+    def total_time_ns(self) -> int:
+        """Provides the time spent in all hooks.
+
+        Returns:
+            The time in nanoseconds
+        """
+        return sum(self._time_ns.values())
+
+    def probes(self) -> list[tuple[str, int, int, int]]:
+        """Provides the counters of all hooks and code objects.
+
+        Returns:
+            Tuples of hook, code object id, invocations, and time spent in
+            nanoseconds, sorted by decreasing time
+        """
+        return sorted(
+            (
+                (hook, code_object_id, calls, self._time_ns[hook, code_object_id])
+                for (hook, code_object_id), calls in self._calls.items()
+            ),
+            key=lambda probe: (-probe[3], probe[0], probe[1]),
+        )
+
+    def to_dict(self) -> dict[str, dict[int, tuple[int, int]]]:
+        """Provides the counters grouped by hook.
+
+        Returns:
+            Maps the hooks to the invocations and the time spent in nanoseconds
+            per code object
+        """
+        profile: dict[str, dict[int, tuple[int, int]]] = {}
+        for hook, code_object_id, calls, time_ns in sorted(
+            self.probes(), key=lambda probe: (probe[0], probe[1])
+        ):
+            profile.setdefault(hook, {})[code_object_id] = calls, time_ns
+        return profile
+
+    def reset(self) -> None:
+        """Clears all counters."""
+        self._calls.clear()
+        self._time_ns.clear()
+
+
 class ExecutionTracer:
     """Tracks branch distances and covered statements during execution.
 
@@ -1006,6 +1447,8 @@ class ExecutionTracer:
             super().__init__()
             self.enabled = True
             self.trace = ExecutionTrace()
+            # The generation of the tracer the thread was bound to
+            self.generation = -1
 
     def __init__(self) -> None:  # noqa: D107
         self.subject_properties = SubjectProperties()
@@ -1018,6 +1461,19 @@ class ExecutionTracer:
         self.init_trace()
         self._current_thread_identifier: int | None = None
 
+        # Only the thread that is bound to the current generation may trace.  The
+        # hooks compare the generation of the calling thread, which is cheaper than
+        # determining its identity.
+        self._generations = itertools.count()
+        self._generation = next(self._generations)
+
+        # Whether the probes of the respective coverage metric are tracked
+        self._trace_branches = True
+        self._trace_lines = True
+        self._trace_checked = True
+
+        self._profile: InstrumentationProfile | None = None
+
     @property
     def current_thread_identifier(self) -> int | None:
         """Get the current thread identifier.
@@ -1031,12 +1487,135 @@ class ExecutionTracer:
     def current_thread_identifier(self, current: int) -> None:
         """Set the current thread identifier.
 
-        Tracing calls from any other thread are ignored.
+        Starts a new generation of the tracer and binds it to the calling thread,
+        if it is the given thread.  Tracing calls from any other thread, i.e.,
+        from threads bound to an older generation, kill that thread.
 
         Args:
             current: the current thread
         """
         self._current_thread_identifier = current
+        generation = next(self._generations)
+        if current == threading.get_ident():
+            self._thread_local_state.generation = generation
+        self._generation = generation
+
+    def is_current_thread(self) -> bool:
+        """Whether the calling thread is bound to the current generation.
+
+        Returns:
+            Whether the calling thread may trace
+        """
+        return self._thread_local_state.generation == self._generation
+
+    @property
+    def traced_coverage_metrics(self) -> set[config.CoverageMetric]:
+        """Provides the coverage metrics whose probes are tracked.
+
+        Returns:
+            The traced coverage metrics
+        """
+        traced = {
+            config.CoverageMetric.BRANCH: self._trace_branches,
+            config.CoverageMetric.LINE: self._trace_lines,
+            config.CoverageMetric.CHECKED: self._trace_checked,
+        }
+        return {metric for metric, enabled in traced.items() if enabled}
+
+    def set_traced_coverage_metrics(
+        self, coverage_metrics: Iterable[config.CoverageMetric]
+    ) -> None:
+        """Sets the coverage metrics whose probes are tracked.
+
+        The module under test is instrumented once for all coverage metrics that are
+        needed during a run, e.g., also for those that are only computed on the
+        final test suite.  The probes of the other metrics only check whether the
+        calling thread may still trace and return, such that they can be switched on
+        later without reloading the module.
+
+        Args:
+            coverage_metrics: The coverage metrics to trace
+        """
+        metrics = set(coverage_metrics)
+        self._trace_branches = config.CoverageMetric.BRANCH in metrics
+        self._trace_lines = config.CoverageMetric.LINE in metrics
+        self._trace_checked = config.CoverageMetric.CHECKED in metrics
+
+    # Maps the hooks called by the instrumentation to functions that provide the id
+    # of the calling code object from their arguments.
+    _PROFILED_HOOKS: ClassVar[dict[str, Callable[[SubjectProperties, tuple], int]]] = {
+        "executed_code_object": lambda _, args: args[0],
+        "executed_compare_predicate": lambda properties, args: (
+            properties.existing_predicates[args[2]].code_object_id
+        ),
+        "executed_bool_predicate": lambda properties, args: (
+            properties.existing_predicates[args[1]].code_object_id
+        ),
+        "executed_exception_match": lambda properties, args: (
+            properties.existing_predicates[args[2]].code_object_id
+        ),
+        "track_line_visit": lambda properties, args: (
+            properties.existing_lines[args[0]].code_object_id
+        ),
+        "track_generic": lambda _, args: args[1],
+        "track_memory_access": lambda _, args: args[1],
+        "track_attribute_access": lambda _, args: args[1],
+        "track_jump": lambda _, args: args[1],
+        "track_call": lambda _, args: args[1],
+        "track_return": lambda _, args: args[1],
+    }
+
+    @property
+    def profile(self) -> InstrumentationProfile | None:
+        """Provides the profile of the hooks, if profiling is enabled.
+
+        Returns:
+            The profile of the hooks, or None
+        """
+        return self._profile
+
+    def enable_profiling(self) -> InstrumentationProfile:
+        """Counts the invocations of the hooks and the time spent in them.
+
+        The hooks of this tracer are replaced by wrappers that update the profile,
+        such that a tracer that does not profile pays nothing for it.  The time
+        spent in a wrapper itself is not accounted for.  Invocations in forked
+        processes, e.g., of parallel executions or of prefix snapshots,
+        are not recorded.
+
+        Returns:
+            The profile that is updated by the hooks
+        """
+        if self._profile is None:
+            self._profile = InstrumentationProfile()
+            for hook, get_code_object_id in self._PROFILED_HOOKS.items():
+                setattr(
+                    self,
+                    hook,
+                    self._profiled_hook(
+                        hook, getattr(self, hook), get_code_object_id, self._profile
+                    ),
+                )
+        return self._profile
+
+    def _profiled_hook(
+        self,
+        hook: str,
+        method: Callable[..., None],
+        get_code_object_id: Callable[[SubjectProperties, tuple], int],
+        profile: InstrumentationProfile,
+    ) -> Callable[..., None]:
+        def profiled(*args) -> None:
+            start = time.perf_counter_ns()
+            try:
+                method(*args)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                profile.record(
+                    hook, get_code_object_id(self.subject_properties, args), elapsed
+                )
+
+        return profiled
 
     @property
     def import_trace(self) -> ExecutionTrace:
@@ -1136,11 +1715,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_branches:
+            return
+
         assert (
             code_object_id in self.subject_properties.existing_code_objects
         ), "Cannot trace unknown code object"
@@ -1176,11 +1758,14 @@ class ExecutionTracer:
             RuntimeError: raised when called from another thread.
             AssertionError: when encountering an unknown compare op.
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_branches:
+            return
+
         if self.is_disabled():
             return
 
@@ -1257,11 +1842,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_branches:
+            return
+
         if self.is_disabled():
             return
 
@@ -1307,11 +1895,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_branches:
+            return
+
         if self.is_disabled():
             return
 
@@ -1343,11 +1934,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_lines:
+            return
+
         if self.is_disabled():
             return
 
@@ -1421,11 +2015,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_checked:
+            return
+
         if self.is_disabled():
             return
 
@@ -1467,11 +2064,14 @@ class ExecutionTracer:
             ValueError: when no argument is given
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_checked:
+            return
+
         if self.is_disabled():
             return
 
@@ -1543,11 +2143,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_checked:
+            return
+
         if self.is_disabled():
             return
 
@@ -1604,11 +2207,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_checked:
+            return
+
         if self.is_disabled():
             return
 
@@ -1645,11 +2251,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_checked:
+            return
+
         if self.is_disabled():
             return
 
@@ -1684,11 +2293,14 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
 
+        if not self._trace_checked:
+            return
+
         if self.is_disabled():
             return
 
@@ -1711,7 +2323,7 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
@@ -1722,9 +2334,10 @@ class ExecutionTracer:
         if statement.has_only_exception_assertion():
             trace = self._thread_local_state.trace
             error_call_position = len(trace.executed_instructions) - 1
-            error_causing_instr = trace.executed_instructions[error_call_position]
-            code_object_id = error_causing_instr.code_object_id
-            node_id = error_causing_instr.node_id
+            code_object_id = trace.executed_instructions.code_object_id(
+                error_call_position
+            )
+            node_id = trace.executed_instructions.node_id(error_call_position)
             trace.executed_assertions.append(
                 ExecutedAssertion(
                     code_object_id,
@@ -1747,7 +2360,7 @@ class ExecutionTracer:
         Raises:
             RuntimeError: raised when called from another thread
         """
-        if threading.current_thread().ident != self._current_thread_identifier:
+        if self._thread_local_state.generation != self._generation:
             raise RuntimeError(
                 "The current thread shall not be executed any more, thus I kill it."
             )
@@ -1755,12 +2368,9 @@ class ExecutionTracer:
         if self.is_disabled():
             return
 
-        exec_instr = self.get_trace().executed_instructions
-        pop_jump_if_true_position = len(exec_instr) - 1
-        for instr in reversed(exec_instr):
-            if instr.opcode == op.POP_JUMP_IF_TRUE:
-                break
-            pop_jump_if_true_position -= 1
+        pop_jump_if_true_position = (
+            self.get_trace().executed_instructions.rindex_opcode(op.POP_JUMP_IF_TRUE)
+        )
         assert (
             pop_jump_if_true_position != -1
         ), "Node in code object did not contain a POP_JUMP_IF_TRUE instruction"
@@ -1822,20 +2432,22 @@ class ExecutionTracer:
     def __repr__(self) -> str:
         return "ExecutionTracer"
 
-    def lineids_to_linenos(self, line_ids: OrderedSet[int]) -> OrderedSet[int]:
+    def lineids_to_linenos(self, line_ids: Iterable[int]) -> OrderedSet[int]:
         """Convenience method to translate line ids to line numbers.
 
         Args:
             line_ids: The ids that should be translated.
 
         Returns:
-            The line numbers.
+            The line numbers, in ascending order.
         """
         return OrderedSet(
-            [
-                self.subject_properties.existing_lines[line_id].line_number
-                for line_id in line_ids
-            ]
+            sorted(
+                {
+                    self.subject_properties.existing_lines[line_id].line_number
+                    for line_id in line_ids
+                }
+            )
         )
 
 
@@ -2092,29 +2704,446 @@ class AbstractTestCaseExecutor(abc.ABC):
             Result of the execution
         """
 
+    def execute_many(self, test_cases: Sequence[tc.TestCase]) -> list[ExecutionResult]:
+        """Executes all statements of each of the given test cases.
+
+        Implementations are free to schedule the executions as they like, e.g.,
+        sequentially, pipelined, or in parallel, but the results are always returned
+        in the order of the given test cases.  This default implementation simply
+        executes one test case after another.
+
+        Args:
+            test_cases: the test cases that should be executed.
+
+        Returns:
+            The results of the executions, in the order of the given test cases.
+        """
+        return [self.execute(test_case) for test_case in test_cases]
 
-class TestCaseExecutor(AbstractTestCaseExecutor):
-    """An executor that executes the generated test cases."""
+
+class _ExecutionWorker:
+    """A long-lived thread that executes the test cases handed to it.
+
+    Reusing the thread avoids creating and tearing down a thread for every single
+    execution.  A worker that is stuck in a timed out execution is abandoned by its
+    executor, which then starts a new one.  An idle worker terminates itself after
+    some time, such that discarded executors do not leak threads.
+    """
 
     def __init__(
         self,
-        tracer: ExecutionTracer,
-        module_provider: ModuleProvider | None = None,
-        maximum_test_execution_timeout: int = 5,
-        test_execution_time_per_statement: int = 1,
+        execute: Callable[[tc.TestCase, Queue], None],
+        idle_timeout: float,
+        claim: Callable[[], None],
     ) -> None:
-        """Create new test case executor.
+        """Create and start a new worker.
 
         Args:
-            tracer: the execution tracer
-            module_provider: The used module provider
-            maximum_test_execution_timeout: The minimum timeout time (in seconds)
-                before a test case execution times out.
-            test_execution_time_per_statement: The amount of time (in seconds) that is
-                added to the timeout per statement, up to minimum_test_execution_timeout
+            execute: The function that executes a test case inside the worker thread
+                and puts the result into the given queue.
+            idle_timeout: The time (in seconds) after which an idle worker terminates.
+            claim: The function that binds the tracer to the worker thread before it
+                executes a test case.
         """
-        # Repeatedly opening/closing devnull caused problems.
-        # This is closed when Pynguin terminates, since we don't need this output
+        self._execute = execute
+        self._idle_timeout = idle_timeout
+        self._claim = claim
+        self._tasks: Queue[tc.TestCase | None] = Queue()
+        self._results: Queue[ExecutionResult | BaseException] = Queue()
+        # Guards the decision of an idle worker to terminate against new submissions,
+        # and the start of an execution against the abandonment of the worker.
+        self._lock = threading.Lock()
+        self._alive = True
+        self._thread = threading.Thread(
+            target=self._run, name="_execute_test_case_worker", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def thread(self) -> threading.Thread:
+        """Provides the thread of this worker.
+
+        Returns:
+            The thread of this worker
+        """
+        return self._thread
+
+    def submit(self, test_cases: Sequence[tc.TestCase]) -> bool:
+        """Hand the given test cases to the worker.
+
+        The worker executes them one after another.
+
+        Args:
+            test_cases: The test cases to execute
+
+        Returns:
+            Whether the worker accepted the test cases, i.e., was still alive.
+        """
+        with self._lock:
+            if not self._alive:
+                return False
+            for test_case in test_cases:
+                self._tasks.put(test_case)
+            return True
+
+    def get_result(self, timeout: float) -> ExecutionResult | BaseException:
+        """Wait for the result of the next submitted test case.
+
+        Args:
+            timeout: The maximum time (in seconds) to wait for the result
+
+        Returns:
+            The execution result or the exception that was raised while executing
+            the test case.
+
+        Raises:
+            Empty: if no result is available within the given timeout
+        """
+        return self._results.get(timeout=timeout)
+
+    def abandon(self) -> None:
+        """Abandon this worker.
+
+        The worker accepts no more test cases, drops the test cases that are still
+        pending, and terminates as soon as it returns from its current execution.
+        """
+        with self._lock:
+            self._alive = False
+            while not self._tasks.empty():
+                self._tasks.get_nowait()
+            self._tasks.put(None)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                test_case = self._tasks.get(timeout=self._idle_timeout)
+            except Empty:
+                with self._lock:
+                    if self._tasks.empty():
+                        self._alive = False
+                        return
+                continue
+            if test_case is None:
+                return
+            with self._lock:
+                # The worker may have taken the test case off the queue right before
+                # it was abandoned.  An abandoned worker must not claim the tracer,
+                # otherwise it would trace concurrently with its replacement.
+                if not self._alive:
+                    return
+                self._claim()
+            try:
+                self._execute(test_case, self._results)
+            except BaseException as err:  # noqa: BLE001
+                self._results.put(err)
+
+
+class CompiledCodeCache:
+    """A least-recently-used cache of instrumented code objects.
+
+    The code objects are stored under a structural dump of the AST they were
+    compiled from, such that the statements of the same shape, e.g., `int_0 = 42`,
+    are only compiled and instrumented once.  Dumping a node takes longer than
+    compiling it, so the cache only pays off for instrumented code.  Together with
+    a code object, the id of the code object that was registered with the tracer
+    when the code was instrumented can be stored.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create a new cache.
+
+        Args:
+            maxsize: The maximum number of cached code objects, a value smaller than
+                one disables the cache.
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[CodeType, int | None]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key_for(node: ast.Module) -> str:
+        """Compute the key under which the code of the given node is cached.
+
+        Args:
+            node: The node to compute the key for
+
+        Returns:
+            The key for the node
+        """
+        return ast.dump(node, include_attributes=True)
+
+    def get(self, key: str) -> tuple[CodeType, int | None] | None:
+        """Look up the code object stored under the given key.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            The code object and the id of its registered code object, if any, or
+            None, if nothing is stored under the key.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, code: CodeType, code_object_id: int | None = None) -> None:
+        """Store a code object, evicting the least-recently used one if necessary.
+
+        Args:
+            key: The key to store the code object under
+            code: The code object to store
+            code_object_id: The id under which the code object was registered with
+                the tracer, if it is instrumented
+        """
+        if self._maxsize < 1:
+            return
+        self._entries[key] = (code, code_object_id)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached code objects, but keep the hit and miss counters."""
+        self._entries.clear()
+
+    @property
+    def hits(self) -> int:
+        """Provides the number of successful look-ups.
+
+        Returns:
+            The number of successful look-ups
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Provides the number of failed look-ups.
+
+        Returns:
+            The number of failed look-ups
+        """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _is_same_context(left: tuple[Any, ...], right: tuple[Any, ...]) -> bool:
+    """Checks whether two execution contexts consist of the same objects.
+
+    Args:
+        left: The first context
+        right: The second context
+
+    Returns:
+        Whether both contexts consist of identical objects
+    """
+    return len(left) == len(right) and all(
+        lhs is rhs for lhs, rhs in zip(left, right, strict=True)
+    )
+
+
+class ExecutionResultCache:
+    """A least-recently-used cache of the execution results of test cases.
+
+    Results are stored under a clone of the executed test case, such that they are
+    found again for structurally equal test cases.  A result is only served from
+    the cache after another execution of a structurally equal test case produced
+    the same execution trace and exceptions.  Test cases for which this is not the
+    case are considered nondeterministic and their results are never cached, just
+    like the results of test cases that timed out.
+
+    A result is only valid for the context it was produced in, i.e., the attached
+    observers, whether the test case was instrumented and the subject properties
+    of the tracer.  A result from a different context is not served.
+
+    The cached results are bounded by the approximate size of their execution
+    traces, which make up most of their memory.
+    """
+
+    # Maximum number of test cases that are remembered to be nondeterministic.
+    _MAX_NONDETERMINISTIC = 1024
+
+    @dataclass
+    class _Entry:
+        result: ExecutionResult
+        context: tuple[Any, ...]
+        size: int
+        verified: bool = False
+
+    def __init__(self, budget: int = 64 * 1024 * 1024) -> None:
+        """Create a new cache.
+
+        Args:
+            budget: The number of bytes the cached results may occupy
+        """
+        self._budget = budget
+        self._size = 0
+        self._entries: OrderedDict[
+            tc.TestCase, ExecutionResultCache._Entry
+        ] = OrderedDict()
+        self._nondeterministic: OrderedDict[tc.TestCase, None] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self, test_case: tc.TestCase, context: tuple[Any, ...]
+    ) -> ExecutionResult | None:
+        """Look up the result of a structurally equal test case.
+
+        Args:
+            test_case: The test case to look up
+            context: The context of the execution
+
+        Returns:
+            A copy of the cached result, or None, if there is no verified result
+            for the given context.
+        """
+        entry = self._entries.get(test_case)
+        if (
+            entry is None
+            or not entry.verified
+            or not _is_same_context(entry.context, context)
+        ):
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(test_case)
+        return self._copy_result(entry.result)
+
+    def put(
+        self, test_case: tc.TestCase, context: tuple[Any, ...], result: ExecutionResult
+    ) -> None:
+        """Record the result of an execution of the given test case.
+
+        Args:
+            test_case: The executed test case
+            context: The context of the execution
+            result: The result of the execution
+        """
+        if test_case in self._nondeterministic:
+            return
+        if result.timeout:
+            self._remove(test_case)
+            return
+        entry = self._entries.get(test_case)
+        if entry is None or not _is_same_context(entry.context, context):
+            self._remove(test_case)
+            size = result.execution_trace.approximate_size()
+            if size > self._budget:
+                return
+            self._entries[test_case.clone()] = ExecutionResultCache._Entry(
+                self._copy_result(result), context, size
+            )
+            self._size += size
+            while self._size > self._budget:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+        elif self._same_outcome(entry.result, result):
+            entry.verified = True
+            self._entries.move_to_end(test_case)
+        else:
+            self._remove(test_case)
+            self._nondeterministic[test_case.clone()] = None
+            if len(self._nondeterministic) > self._MAX_NONDETERMINISTIC:
+                self._nondeterministic.popitem(last=False)
+
+    def _remove(self, test_case: tc.TestCase) -> None:
+        if (entry := self._entries.pop(test_case, None)) is not None:
+            self._size -= entry.size
+
+    def clear(self) -> None:
+        """Remove all cached results, but keep the hit and miss counters."""
+        self._entries.clear()
+        self._nondeterministic.clear()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Provides the approximate number of bytes the cached results occupy.
+
+        Returns:
+            The approximate size of the cached results in bytes
+        """
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        """Provides the number of results that were served from the cache.
+
+        Returns:
+            The number of results that were served from the cache
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Provides the number of failed look-ups.
+
+        Returns:
+            The number of failed look-ups
+        """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _same_outcome(left: ExecutionResult, right: ExecutionResult) -> bool:
+        return {idx: type(exc) for idx, exc in left.exceptions.items()} == {
+            idx: type(exc) for idx, exc in right.exceptions.items()
+        } and left.execution_trace == right.execution_trace
+
+    @staticmethod
+    def _copy_result(result: ExecutionResult) -> ExecutionResult:
+        # The statement-indexed data is replaced when the test case changes, so the
+        # cache and each user of a cached result need their own copy of it.
+        copied = copy.copy(result)
+        copied.exceptions = dict(result.exceptions)
+        copied.raw_return_types = dict(result.raw_return_types)
+        copied.raw_return_type_generic_args = dict(result.raw_return_type_generic_args)
+        copied.proper_return_type_trace = dict(result.proper_return_type_trace)
+        copied.proxy_knowledge = dict(result.proxy_knowledge)
+        return copied
+
+
+class TestCaseExecutor(AbstractTestCaseExecutor):
+    """An executor that executes the generated test cases.
+
+    The test cases are executed on a long-lived worker thread, which is only
+    replaced when an execution times out.
+    """
+
+    # Time (in seconds) after which an idle worker thread terminates.
+    _WORKER_IDLE_TIMEOUT = 1.0
+
+    # Name under which the statement hook is available to a compiled test case.
+    _STATEMENT_HOOK_NAME = "__pynguin_statement_hook__"
+
+    def __init__(
+        self,
+        tracer: ExecutionTracer,
+        module_provider: ModuleProvider | None = None,
+        maximum_test_execution_timeout: int = 5,
+        test_execution_time_per_statement: int = 1,
+    ) -> None:
+        """Create new test case executor.
+
+        Args:
+            tracer: the execution tracer
+            module_provider: The used module provider
+            maximum_test_execution_timeout: The minimum timeout time (in seconds)
+                before a test case execution times out.
+            test_execution_time_per_statement: The amount of time (in seconds) that is
+                added to the timeout per statement, up to minimum_test_execution_timeout
+        """
+        # Repeatedly opening/closing devnull caused problems.
+        # This is closed when Pynguin terminates, since we don't need this output
         # anyway this is acceptable.
         self._null_file = open(os.devnull, mode="w")  # noqa: PTH123, SIM115
 
@@ -2126,6 +3155,7 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         )
         self._tracer = tracer
         self._observers: list[ExecutionObserver] = []
+        self._worker: _ExecutionWorker | None = None
         self._instrument = (
             config.CoverageMetric.CHECKED
             in config.configuration.statistics_output.coverage_metrics
@@ -2134,6 +3164,14 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         self._checked_transformer = InstrumentationTransformer(
             self._tracer, [checked_instrumentation]
         )
+        self._code_cache = CompiledCodeCache(
+            config.configuration.test_execution.compiled_code_cache_size
+        )
+        # The subject properties the instrumented code objects in the cache were
+        # registered with.
+        self._code_cache_properties: SubjectProperties | None = None
+        self._last_code_object_id: int | None = None
+        self._result_cache: ExecutionResultCache | None = None
 
         def log_thread_exception(arg):
             _LOGGER.error(
@@ -2142,214 +3180,1518 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
                 exc_info=(arg.exc_type, arg.exc_value, arg.exc_traceback),
             )
 
-        # Set our own exception hook, so timeout related errors in executing threads
-        # are not spilled out to stderr and clutter our formatted output but are send
-        # to the logger
-        threading.excepthook = log_thread_exception
+        # Set our own exception hook, so timeout related errors in executing threads
+        # are not spilled out to stderr and clutter our formatted output but are send
+        # to the logger
+        threading.excepthook = log_thread_exception
+
+    @property
+    def module_provider(self) -> ModuleProvider:
+        """The module provider used by this executor.
+
+        Returns:
+            The used module provider
+        """
+        return self._module_provider
+
+    def add_observer(self, observer: ExecutionObserver) -> None:
+        """Add an execution observer.
+
+        Args:
+            observer: the observer to be added.
+        """
+        self._observers.append(observer)
+
+    def clear_observers(self) -> None:
+        """Remove all existing observers."""
+        self._observers.clear()
+
+    @contextlib.contextmanager
+    def temporarily_add_observer(self, observer: ExecutionObserver):  # noqa: D102
+        self._observers.append(observer)
+        yield
+        self._observers.remove(observer)
+
+    @property
+    def tracer(self) -> ExecutionTracer:
+        """Provide access to the execution tracer.
+
+        Returns:
+            The execution tracer
+        """
+        return self._tracer
+
+    @property
+    def code_cache(self) -> CompiledCodeCache:
+        """Provides the cache of the code objects instrumented by execute_ast.
+
+        Returns:
+            The cache of instrumented code objects
+        """
+        return self._code_cache
+
+    @property
+    def last_code_object_id(self) -> int | None:
+        """Provides the id of the code object that was last executed by execute_ast.
+
+        Returns:
+            The id under which the code object of the module that was last executed
+            by execute_ast is registered with the tracer, or None, if the module was
+            not instrumented.
+        """
+        return self._last_code_object_id
+
+    @property
+    def result_cache(self) -> ExecutionResultCache | None:
+        """Provides the cache of execution results, if any.
+
+        Returns:
+            The cache of execution results, or None, if results are not cached
+        """
+        return self._result_cache
+
+    def set_result_cache(self, result_cache: ExecutionResultCache | None) -> None:
+        """Set the cache that execution results are served from and stored in.
+
+        Caching results is only sound for executions whose side effects do not
+        matter, e.g., during the search, but not while executing test cases
+        repeatedly on purpose, e.g., to detect flaky assertions.
+
+        Args:
+            result_cache: The cache to use, or None to always execute test cases
+        """
+        self._result_cache = result_cache
+
+    def set_instrument(self, instrument: bool) -> None:
+        """Set if the test is to be instrumented as well.
+
+        Args:
+            instrument: Whether to instrument the test and its assertions.
+        """
+        self._instrument = instrument
+
+    def execute(  # noqa: D102
+        self,
+        test_case: tc.TestCase,
+    ) -> ExecutionResult:
+        return self.execute_many([test_case])[0]
+
+    def execute_many(  # noqa: D102
+        self, test_cases: Sequence[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        if self._result_cache is not None:
+            return self._execute_with_result_cache(test_cases, self._result_cache)
+        results = self._execute_test_cases(test_cases)
+        # Notify the observers only after the whole batch, such that they do not
+        # run concurrently to the execution of the subsequent test cases.
+        for test_case, result in zip(test_cases, results, strict=True):
+            self._after_test_case_execution_outside_thread(test_case, result)
+        return results
+
+    def _execute_test_cases(
+        self, test_cases: Sequence[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        """Execute the given test cases without notifying the observers outside.
+
+        Args:
+            test_cases: The test cases to execute
+
+        Returns:
+            The execution results, in the order of the given test cases
+        """
+        return self._execute_in_worker(test_cases)
+
+    def _execute_with_result_cache(
+        self, test_cases: Sequence[tc.TestCase], result_cache: ExecutionResultCache
+    ) -> list[ExecutionResult]:
+        """Serve the results from the cache and only execute the remaining cases.
+
+        The observers are notified about the executed test cases before their
+        results are cached, because they may complete the results outside the
+        executing thread, e.g., with the checked lines.
+
+        Args:
+            test_cases: The test cases to execute
+            result_cache: The cache of execution results
+
+        Returns:
+            The execution results, in the order of the given test cases
+        """
+        context = (
+            *self._observers,
+            self._instrument,
+            self._tracer.get_subject_properties(),
+        )
+        results: list[ExecutionResult | None] = [
+            result_cache.get(test_case, context) for test_case in test_cases
+        ]
+        to_execute = [idx for idx, result in enumerate(results) if result is None]
+        served = [idx for idx, result in enumerate(results) if result is not None]
+        if to_execute:
+            executed = self._execute_test_cases([test_cases[idx] for idx in to_execute])
+            for idx, result in zip(to_execute, executed, strict=True):
+                self._after_test_case_execution_outside_thread(test_cases[idx], result)
+                result_cache.put(test_cases[idx], context, result)
+                results[idx] = result
+        for idx in served:
+            self._after_test_case_execution_outside_thread(
+                test_cases[idx], cast(ExecutionResult, results[idx])
+            )
+        return cast(list[ExecutionResult], results)
+
+    def _get_timeout(self, test_case: tc.TestCase) -> float:
+        """Compute the time (in seconds) the given test case is allowed to run.
+
+        Args:
+            test_case: The test case
+
+        Returns:
+            The timeout for the test case
+        """
+        return min(
+            self._maximum_test_execution_timeout,
+            self._test_execution_time_per_statement * len(test_case.statements),
+        )
+
+    def _execute_in_worker(
+        self, test_cases: Sequence[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        """Execute the test cases in the worker thread and wait for their results.
+
+        The whole batch is handed to the worker at once.  If an execution times out,
+        the worker is abandoned and the remaining test cases are handed to a new one.
+        Observers are not notified outside the executing thread.
+
+        Args:
+            test_cases: The test cases to execute
+
+        Returns:
+            The execution results, in the order of the given test cases
+
+        Raises:
+            RuntimeError: If the execution failed due to a bug in Pynguin.
+        """
+        results: list[ExecutionResult] = []
+        with contextlib.redirect_stdout(self._null_file), contextlib.redirect_stderr(
+            self._null_file
+        ):
+            worker: _ExecutionWorker | None = None
+            for idx, test_case in enumerate(test_cases):
+                if worker is None:
+                    worker = self._submit_to_worker(test_cases[idx:])
+                try:
+                    outcome = worker.get_result(timeout=self._get_timeout(test_case))
+                except Empty:
+                    self._abandon_worker(worker)
+                    worker = None
+                    results.append(ExecutionResult(timeout=True))
+                    _LOGGER.warning("Experienced timeout from test-case execution")
+                    continue
+                if isinstance(outcome, BaseException):
+                    self._abandon_worker(worker)
+                    _LOGGER.error(
+                        "Finished thread did not return a result.", exc_info=outcome
+                    )
+                    raise RuntimeError("Bug in Pynguin!") from outcome
+                results.append(outcome)
+        return results
+
+    def _submit_to_worker(self, test_cases: Sequence[tc.TestCase]) -> _ExecutionWorker:
+        """Hand the test cases to the worker thread, start a new one if necessary.
+
+        Args:
+            test_cases: The test cases to execute
+
+        Returns:
+            The worker that executes the test cases
+        """
+        if self._worker is None or not self._worker.submit(test_cases):
+            self._worker = _ExecutionWorker(
+                self._execute_test_case, self._WORKER_IDLE_TIMEOUT, self._claim_tracer
+            )
+            accepted = self._worker.submit(test_cases)
+            assert accepted, "A fresh worker must accept test cases"
+        return self._worker
+
+    def _abandon_worker(self, worker: _ExecutionWorker) -> None:
+        """Abandon the given worker, such that its thread is killed.
+
+        Args:
+            worker: The worker to abandon
+        """
+        # Set thread ident to invalid value, such that the tracer
+        # kills the thread
+        self._tracer.current_thread_identifier = -1
+        worker.abandon()
+        self._worker = None
+
+    def _before_test_case_execution(self, test_case: tc.TestCase) -> None:
+        self._tracer.init_trace()
+        for observer in self._observers:
+            observer.before_test_case_execution(test_case)
+
+    def _claim_tracer(self) -> None:
+        self._tracer.current_thread_identifier = threading.current_thread().ident
+
+    def _execute_test_case(self, test_case: tc.TestCase, result_queue: Queue) -> None:
+        self._before_test_case_execution(test_case)
+        result = ExecutionResult()
+        exec_ctx = ExecutionContext(self._module_provider)
+        self._execute_statements_from(test_case, exec_ctx, result, 0)
+        self._after_test_case_execution_inside_thread(test_case, result)
+        result_queue.put(result)
+
+    def _execute_statements_from(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+        start: int,
+    ) -> None:
+        """Execute the statements of the test case, beginning at the given position.
+
+        Args:
+            test_case: The test case to execute
+            exec_ctx: The execution context, which already contains the values of the
+                variables that are created before the start position
+            result: The execution result to report exceptions to
+            start: The position of the first statement to execute
+        """
+        if self._instrument or any(
+            observer.rewrites_statements for observer in self._observers
+        ):
+            self._execute_statements(test_case, exec_ctx, result, start)
+        else:
+            self._execute_compiled_test_case(test_case, exec_ctx, result, start)
+
+    def _reached_statement(
+        self,
+        test_case: tc.TestCase,
+        position: int,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+    ) -> None:
+        """Called inside the executing thread before the observers are notified.
+
+        Subclasses may override this to act on the state of the execution before
+        the statement at the given position is executed.
+
+        Args:
+            test_case: The executed test case
+            position: The position of the statement that is executed next
+            exec_ctx: The execution context
+            result: The execution result
+        """
+
+    def _execute_statements(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+        start: int = 0,
+    ) -> None:
+        """Compile and execute the statements of the test case one by one.
+
+        Args:
+            test_case: The test case to execute
+            exec_ctx: The execution context
+            result: The execution result to report exceptions to
+            start: The position of the first statement to execute
+        """
+        statements = test_case.statements
+        for idx in range(start, len(statements)):
+            statement = statements[idx]
+            self._reached_statement(test_case, idx, exec_ctx, result)
+            ast_node = ExecutionContext.wrap_node_in_module(
+                self._before_statement_execution(statement, exec_ctx)
+            )
+            exception = self.execute_ast(ast_node, exec_ctx)
+            self._after_statement_execution(statement, exec_ctx, exception)
+            if exception is not None:
+                result.report_new_thrown_exception(idx, exception)
+                break
+
+    def _execute_compiled_test_case(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+        start: int = 0,
+    ) -> None:
+        """Compile the whole test case into one code object and execute it.
+
+        This is only possible if no observer rewrites the nodes of the statements
+        and the statements are not instrumented themselves.  A call to a hook is
+        placed between two subsequent statements, which notifies the observers after
+        the previous and before the next statement, and keeps track of the position
+        of the statement that is being executed.
+
+        Args:
+            test_case: The test case to execute
+            exec_ctx: The execution context
+            result: The execution result to report exceptions to
+            start: The position of the first statement to execute
+
+        Raises:
+            BaseException: If notifying the observers raised an exception, e.g.,
+                to kill this thread.
+        """
+        statements = test_case.statements
+        nodes = {
+            idx: exec_ctx.node_for_statement(statements[idx])
+            for idx in range(start, len(statements))
+        }
+        body: list[ast.stmt] = []
+        for idx, node in nodes.items():
+            body.extend((self._statement_hook_call(idx), node))
+        body.append(self._statement_hook_call(len(statements)))
+        module = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Executing %s", ast.unparse(module))
+        code = compile(module, "<ast>", "exec")
+
+        position = -1
+        hook_failed = False
+
+        def statement_hook(idx: int) -> None:
+            nonlocal position, hook_failed
+            try:
+                if idx > start:
+                    self._after_statement_execution(statements[idx - 1], exec_ctx, None)
+                if idx < len(statements):
+                    self._reached_statement(test_case, idx, exec_ctx, result)
+                    self._before_statement_execution(
+                        statements[idx], exec_ctx, nodes[idx]
+                    )
+            except BaseException:
+                hook_failed = True
+                raise
+            position = idx
+
+        exec_ctx.local_namespace[self._STATEMENT_HOOK_NAME] = statement_hook
+        try:
+            exec(  # noqa: S102
+                code, exec_ctx.global_namespace, exec_ctx.local_namespace
+            )
+        except BaseException as err:  # noqa: BLE001
+            if hook_failed:
+                raise
+            _LOGGER.debug(
+                "Failed to execute statement:\n%s%s",
+                ast.unparse(nodes[position]),
+                err.args,
+            )
+            self._after_statement_execution(statements[position], exec_ctx, err)
+            result.report_new_thrown_exception(position, err)
+        finally:
+            exec_ctx.local_namespace.pop(self._STATEMENT_HOOK_NAME, None)
+
+    @classmethod
+    def _statement_hook_call(cls, idx: int) -> ast.stmt:
+        return ast.Expr(
+            value=ast.Call(
+                func=ast.Name(id=cls._STATEMENT_HOOK_NAME, ctx=ast.Load()),
+                args=[ast.Constant(value=idx)],
+                keywords=[],
+            )
+        )
+
+    def _after_test_case_execution_inside_thread(
+        self, test_case: tc.TestCase, result: ExecutionResult
+    ) -> None:
+        """Collect the trace data after each executed test case.
+
+        Args:
+            test_case: The executed test case
+            result: The execution result
+        """
+        result.execution_trace = self._tracer.get_trace()
+        for observer in self._observers:
+            observer.after_test_case_execution_inside_thread(test_case, result)
+
+    def _after_test_case_execution_outside_thread(
+        self, test_case: tc.TestCase, result: ExecutionResult
+    ) -> None:
+        """Process results outside of thread.
+
+        Args:
+            test_case: The executed test case
+            result: The execution result
+        """
+        for observer in self._observers:
+            observer.after_test_case_execution_outside_thread(test_case, result)
+
+    def _before_statement_execution(
+        self,
+        statement: stmt.Statement,
+        exec_ctx: ExecutionContext,
+        ast_node: ast.stmt | None = None,
+    ) -> ast.stmt:
+        # Check if the current thread is still the one that should be executing
+        # Otherwise raise an exception to kill it.
+        if not self.tracer.is_current_thread():
+            # Kill this thread
+            raise RuntimeError(
+                "The current thread shall not be executed any more, thus I kill it."
+            )
+
+        # We need to disable the tracer, because an observer might interact with an
+        # object of the SUT via the ExecutionContext and trigger code execution, which
+        # is not caused by the test case and should therefore not be in the trace.
+        self._tracer.disable()
+
+        if ast_node is None:
+            ast_node = exec_ctx.node_for_statement(statement)
+        try:
+            for observer in self._observers:
+                ast_node = observer.before_statement_execution(
+                    statement, ast_node, exec_ctx
+                )
+        finally:
+            self._tracer.enable()
+        return ast_node
+
+    def execute_ast(
+        self,
+        ast_node: ast.Module,
+        exec_ctx: ExecutionContext,
+    ) -> BaseException | None:
+        """Execute the given ast_node in the given context.
+
+        You can use this in an observer if you also need to execute an AST Node.
+
+        Args:
+            ast_node: The node to execute.
+            exec_ctx: The execution context
+
+        Returns:
+            The raised exception, if any.
+        """
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Executing %s", ast.unparse(ast_node))
+
+        code = self._compile(ast_node)
+        try:
+            exec(  # noqa: S102
+                code, exec_ctx.global_namespace, exec_ctx.local_namespace
+            )
+        except BaseException as err:  # noqa: BLE001
+            failed_stmt = ast.unparse(ast_node)
+            _LOGGER.debug("Failed to execute statement:\n%s%s", failed_stmt, err.args)
+            return err
+
+        return None
+
+    def _compile(self, ast_node: ast.Module) -> CodeType:
+        """Compile and, if required, instrument the given node.
+
+        The instrumented code object of a structurally equal node is reused from
+        the cache.
+
+        Args:
+            ast_node: The node to compile
+
+        Returns:
+            The code object of the node
+        """
+        if not self._instrument:
+            # Computing the key of the cache takes longer than compiling the node.
+            self._last_code_object_id = None
+            return compile(ast_node, "<ast>", "exec")
+
+        properties = self._tracer.get_subject_properties()
+        if properties is not self._code_cache_properties:
+            # The instrumented code objects refer to the ids of the code objects
+            # they were registered under, which are lost when the tracer is reset.
+            self._code_cache.clear()
+            self._code_cache_properties = properties
+        key = CompiledCodeCache.key_for(ast_node)
+        if (entry := self._code_cache.get(key)) is not None:
+            code, self._last_code_object_id = entry
+            return code
+
+        # The code object of the module is registered first.
+        code_object_id = len(properties.existing_code_objects)
+        code = self._checked_transformer.instrument_module(
+            compile(ast_node, "<ast>", "exec")
+        )
+        self._code_cache.put(key, code, code_object_id)
+        self._last_code_object_id = code_object_id
+        return code
+
+    def _after_statement_execution(
+        self,
+        statement: stmt.Statement,
+        exec_ctx: ExecutionContext,
+        exception: BaseException | None,
+    ):
+        # See comments in _before_statement_execution
+        if not self.tracer.is_current_thread():
+            # Kill this thread
+            raise RuntimeError(
+                "The current thread shall not be executed any more, thus I kill it."
+            )
+
+        self._tracer.disable()
+        try:
+            for observer in reversed(self._observers):
+                observer.after_statement_execution(statement, self, exec_ctx, exception)
+        finally:
+            self._tracer.enable()
+
+
+class _ResultPickler(pickle.Pickler):
+    """Pickles execution results inside a forked process.
+
+    Objects that the parent process shares with the forked one, e.g., the executed
+    test case, its statements and variable references, are not serialized but only
+    referenced by their identity in the parent process.
+    """
+
+    def __init__(self, file: io.BytesIO, persistent_ids: dict[int, int]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._persistent_ids = persistent_ids
+
+    def persistent_id(self, obj: Any) -> int | None:
+        return self._persistent_ids.get(id(obj))
+
+
+class _ResultUnpickler(pickle.Unpickler):
+    """Restores execution results pickled by a _ResultPickler."""
+
+    def __init__(self, file: io.BytesIO, shared_objects: dict[int, Any]) -> None:
+        super().__init__(file)
+        self._shared_objects = shared_objects
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self._shared_objects[pid]
+
+
+class _PinnedObjects:
+    """Objects that are kept alive, such that they can be referenced by identity.
+
+    Every pinned object gets a position, which increases with every pinned object
+    and is never reused, even if pinned objects are released.  A snapshot process
+    can resolve the identity of an object that has a smaller position than the
+    number of objects that were pinned before it was forked, if the object is still
+    pinned: as long as it is, its identity cannot be reused by another object.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[int, Any]] = {}
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """Provides the number of objects that were pinned so far.
+
+        Returns:
+            The number of objects that were pinned so far
+        """
+        return self._count
+
+    def pin(self, obj: Any) -> int:
+        """Pin the given object, unless it is pinned already.
+
+        Args:
+            obj: The object to pin
+
+        Returns:
+            The position of the object
+        """
+        if (entry := self._entries.get(id(obj))) is None:
+            entry = self._entries[id(obj)] = (self._count, obj)
+            self._count += 1
+        return entry[0]
+
+    def position(self, obj: Any) -> int | float:
+        """Provides the position of the given object.
+
+        Args:
+            obj: The object
+
+        Returns:
+            The position of the object, or infinity, if it is not pinned
+        """
+        if (entry := self._entries.get(id(obj))) is None:
+            return math.inf
+        return entry[0]
+
+    def get(self, identity: int) -> Any:
+        """Provides the pinned object with the given identity.
+
+        Args:
+            identity: The identity of the object
+
+        Returns:
+            The pinned object
+        """
+        return self._entries[identity][1]
+
+    def release_from(self, position: int) -> None:
+        """Releases the objects that were pinned at or after the given position.
+
+        Args:
+            position: The position of the first object to release
+        """
+        self._entries = {
+            identity: entry
+            for identity, entry in self._entries.items()
+            if entry[0] < position
+        }
+
+    def __contains__(self, identity: int) -> bool:
+        return identity in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _TestCasePickler(pickle.Pickler):
+    """Pickles test cases to resume their execution in a prefix snapshot process.
+
+    Test cases, their statements, references, assertions and types are serialized
+    by value.  All other objects, e.g., the accessible objects of the test cluster,
+    are pinned, i.e., kept alive in this process, and only referenced by their
+    identity.  A snapshot process is forked from this process, so it can resolve the
+    identities of all objects that were pinned before it was forked.
+    """
+
+    _BY_VALUE = (
+        tc.TestCase,
+        stmt.Statement,
+        vr.Reference,
+        ass.Assertion,
+        ProperType,
+        TypeInfo,
+        OrderedSet,
+        enum.Enum,
+        type,
+    )
+
+    def __init__(
+        self,
+        file: io.BytesIO,
+        pinned: _PinnedObjects,
+        limit: int | None = None,
+    ) -> None:
+        """Create a new pickler.
+
+        Args:
+            file: The file to pickle to
+            pinned: The pinned objects
+            limit: The number of objects that were pinned before the snapshot
+                process was forked, or None, if objects shall only be pinned
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._pinned = pinned
+        self._limit = limit
+
+    def persistent_id(self, obj: Any) -> int | None:
+        if isinstance(obj, self._BY_VALUE) or type(obj).__module__ == "builtins":
+            return None
+        if self._limit is None:
+            self._pinned.pin(obj)
+        elif self._pinned.position(obj) >= self._limit:
+            raise pickle.PicklingError("Object was not pinned before the snapshot")
+        return id(obj)
+
+
+class _TestCaseUnpickler(pickle.Unpickler):
+    """Restores test cases pickled by a _TestCasePickler in a snapshot process."""
+
+    def __init__(self, file: io.BytesIO, pinned: _PinnedObjects) -> None:
+        super().__init__(file)
+        self._pinned = pinned
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self._pinned.get(pid)
+
+
+def _starts_with(test_case: tc.TestCase, prefix: tc.TestCase) -> bool:
+    """Checks whether the test case starts with the statements of the prefix.
+
+    Args:
+        test_case: The test case
+        prefix: The statements that the test case shall start with
+
+    Returns:
+        Whether the first statements of the test case are structurally equal to
+        the statements of the prefix
+    """
+    if prefix.size() > test_case.size():
+        return False
+    memo: dict[vr.VariableReference, vr.VariableReference] = {}
+    for left, right in zip(prefix.statements, test_case.statements, strict=False):
+        if ((lret := left.ret_val) is None) ^ ((rret := right.ret_val) is None):
+            return False
+        if lret is not None:
+            memo[lret] = rret  # type: ignore[assignment]
+        if not left.structural_eq(right, memo):
+            return False
+    return True
+
+
+def _collect_shared_objects(test_cases: Sequence[tc.TestCase]) -> dict[int, Any]:
+    """Collect the objects that execution results of the test cases may refer to.
+
+    Args:
+        test_cases: The test cases that are executed
+
+    Returns:
+        A mapping from the identity of each object to the object
+    """
+    shared: dict[int, Any] = {}
+    for test_case in test_cases:
+        shared[id(test_case)] = test_case
+        for statement in test_case.statements:
+            shared[id(statement)] = statement
+            for reference in statement.get_variable_references():
+                shared[id(reference)] = reference
+            if (accessible := statement.accessible_object()) is not None:
+                shared[id(accessible)] = accessible
+            for assertion in statement.assertions:
+                shared[id(assertion)] = assertion
+    return shared
+
+
+def _is_transferable(exception: BaseException) -> bool:
+    """Checks whether the exception survives a round trip through pickle.
+
+    Args:
+        exception: The exception to check
+
+    Returns:
+        Whether the exception can be transferred to another process
+    """
+    try:
+        pickle.loads(pickle.dumps(exception))  # noqa: S301
+    except Exception:  # noqa: BLE001
+        return False
+    return True
+
+
+def _serialize_result(result: ExecutionResult, persistent_ids: dict[int, int]) -> bytes:
+    """Serialize an execution result in a forked process.
+
+    Exceptions that cannot be transferred are replaced by a RuntimeError carrying
+    their description.  If the result still cannot be pickled, e.g., because an
+    observer recorded a type that is not importable, only the timeout flag, the
+    exceptions and the execution trace are transferred.
+
+    Args:
+        result: The execution result
+        persistent_ids: Maps the identities of the objects shared with the parent
+            process to their identities in the parent process
+
+    Returns:
+        The serialized execution result
+    """
+    for idx, exception in result.exceptions.items():
+        if not _is_transferable(exception):
+            result.exceptions[idx] = RuntimeError(
+                f"{type(exception).__name__}: {exception}"
+            )
+    buffer = io.BytesIO()
+    try:
+        _ResultPickler(buffer, persistent_ids).dump(result)
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Could not serialize the full execution result", exc_info=True)
+        reduced = ExecutionResult(timeout=result.timeout)
+        reduced.exceptions = result.exceptions
+        reduced.execution_trace = result.execution_trace
+        buffer = io.BytesIO()
+        _ResultPickler(buffer, persistent_ids).dump(reduced)
+    return buffer.getvalue()
+
+
+class ParallelTestCaseExecutor(TestCaseExecutor):
+    """An executor that spreads test cases over a pool of forked worker processes.
+
+    Each worker process is forked from the Pynguin process when a batch of test cases
+    is executed, so it has the SUT already imported and instrumented and inherits
+    the test cases it shall execute.  Only the execution results are serialized back
+    to the parent process.  A worker that does not deliver a result in time is
+    killed, together with any test case that hangs inside it.
+
+    All observer callbacks but
+    ExecutionObserver::after_test_case_execution_outside_thread are invoked inside
+    the worker processes.  Observers therefore have to stick to the contract of
+    ExecutionObserver and only pass data on via the execution result.  The workers
+    record how many statements of each test case they reached, which is reported
+    to the observers in ExecutionObserver::after_remote_test_case_execution, such
+    that, e.g., the stopping conditions on the number of test or statement
+    executions can count the executions in the worker processes.
+
+    If a test case times out, or crashes its worker process, the worker is killed
+    and the test cases that it has not executed yet are executed again by fresh
+    worker processes.
+
+    Single test cases are executed in-process, as is everything while the test cases
+    themselves are instrumented for checked coverage, because their code objects
+    are registered with the tracer during execution.
+    """
+
+    # Additional time (in seconds) that a worker process gets to deliver a result
+    # on top of the timeout of the test case, e.g., for serializing it.
+    _RESULT_GRACE_PERIOD = 1.0
+
+    def __init__(
+        self,
+        tracer: ExecutionTracer,
+        module_provider: ModuleProvider | None = None,
+        maximum_test_execution_timeout: int = 5,
+        test_execution_time_per_statement: int = 1,
+        number_of_processes: int | None = None,
+    ) -> None:
+        """Create new parallel test case executor.
+
+        Args:
+            tracer: the execution tracer
+            module_provider: The used module provider
+            maximum_test_execution_timeout: The minimum timeout time (in seconds)
+                before a test case execution times out.
+            test_execution_time_per_statement: The amount of time (in seconds) that is
+                added to the timeout per statement, up to minimum_test_execution_timeout
+            number_of_processes: The number of worker processes, defaults to the
+                number of available CPUs.
+        """
+        super().__init__(
+            tracer,
+            module_provider,
+            maximum_test_execution_timeout,
+            test_execution_time_per_statement,
+        )
+        if number_of_processes is None:
+            number_of_processes = os.cpu_count() or 1
+        if "fork" not in multiprocessing.get_all_start_methods():
+            _LOGGER.warning(
+                "Forking processes is not supported, executing test cases in-process"
+            )
+            number_of_processes = 1
+        self._number_of_processes = number_of_processes
+        # Inside a worker process, the number of reached statements of each test
+        # case of the batch and the index of the test case that is executed.
+        self._reached_statements: Any = None
+        self._current_index = 0
+
+    @property
+    def number_of_processes(self) -> int:
+        """Provides the number of worker processes.
+
+        Returns:
+            The number of worker processes
+        """
+        return self._number_of_processes
+
+    def _execute_test_cases(
+        self, test_cases: Sequence[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        """Executes the given test cases in parallel.
+
+        Args:
+            test_cases: the test cases that should be executed.
+
+        Returns:
+            The results of the executions, in the order of the given test cases.
+        """
+        if self._instrument or self._number_of_processes < 2 or len(test_cases) < 2:
+            return super()._execute_test_cases(test_cases)
+
+        shared_objects = _collect_shared_objects(test_cases)
+        context = multiprocessing.get_context("fork")
+        # Written by the worker processes, and still readable after killing them.
+        reached_statements = context.RawArray("q", len(test_cases))
+        number_of_workers = min(self._number_of_processes, len(test_cases))
+        workers = []
+        for worker_idx in range(number_of_workers):
+            indices = range(worker_idx, len(test_cases), number_of_workers)
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=self._execute_in_process,
+                args=(test_cases, indices, sender, shared_objects, reached_statements),
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            workers.append((process, receiver, indices))
+
+        results: list[ExecutionResult | None] = [None] * len(test_cases)
+        for process, receiver, indices in workers:
+            try:
+                executed = self._receive_results(
+                    test_cases, indices, receiver, shared_objects, results
+                )
+            finally:
+                if process.is_alive():
+                    process.kill()
+                process.join()
+                receiver.close()
+            for idx in executed:
+                self._after_remote_test_case_execution(
+                    test_cases[idx], reached_statements[idx]
+                )
+
+        # The test cases after a timeout or a crash were not executed by the
+        # killed worker process.
+        if remaining := [idx for idx, result in enumerate(results) if result is None]:
+            for idx, result in zip(
+                remaining,
+                self._execute_test_cases([test_cases[idx] for idx in remaining]),
+                strict=True,
+            ):
+                results[idx] = result
+        return cast(list[ExecutionResult], results)
 
-    @property
-    def module_provider(self) -> ModuleProvider:
-        """The module provider used by this executor.
+    def _receive_results(
+        self,
+        test_cases: Sequence[tc.TestCase],
+        indices: range,
+        receiver: Connection,
+        shared_objects: dict[int, Any],
+        results: list[ExecutionResult | None],
+    ) -> list[int]:
+        """Receive the results of a worker process until it times out or crashes.
+
+        Args:
+            test_cases: The test cases of the batch
+            indices: The indices of the test cases executed by the worker process
+            receiver: The connection to receive the serialized results from
+            shared_objects: The objects shared with the worker process
+            results: The results of the batch, which are filled in
 
         Returns:
-            The used module provider
+            The indices of the test cases that the worker process executed
         """
-        return self._module_provider
+        executed: list[int] = []
+        for idx in indices:
+            executed.append(idx)
+            try:
+                if not receiver.poll(
+                    self._get_timeout(test_cases[idx]) + self._RESULT_GRACE_PERIOD
+                ):
+                    _LOGGER.warning("Experienced timeout from worker process")
+                    results[idx] = ExecutionResult(timeout=True)
+                    break
+                results[idx] = _ResultUnpickler(
+                    io.BytesIO(receiver.recv_bytes()), shared_objects
+                ).load()
+            except EOFError:
+                _LOGGER.error("Worker process terminated without delivering results")
+                results[idx] = ExecutionResult(timeout=True)
+                break
+        return executed
 
-    def add_observer(self, observer: ExecutionObserver) -> None:
-        """Add an execution observer.
+    def _after_remote_test_case_execution(
+        self, test_case: tc.TestCase, executed_statements: int
+    ) -> None:
+        """Report a test case that was executed in a worker process.
 
         Args:
-            observer: the observer to be added.
+            test_case: The executed test case
+            executed_statements: The number of statements that were executed
         """
-        self._observers.append(observer)
+        for observer in self._observers:
+            observer.after_remote_test_case_execution(test_case, executed_statements)
 
-    def clear_observers(self) -> None:
-        """Remove all existing observers."""
-        self._observers.clear()
+    def _execute_in_process(
+        self,
+        test_cases: Sequence[tc.TestCase],
+        indices: range,
+        connection: Connection,
+        shared_objects: dict[int, Any],
+        reached_statements: Any,
+    ) -> None:
+        """Executes the test cases at the given indices inside a worker process.
 
-    @contextlib.contextmanager
-    def temporarily_add_observer(self, observer: ExecutionObserver):  # noqa: D102
-        self._observers.append(observer)
-        yield
-        self._observers.remove(observer)
+        Args:
+            test_cases: The test cases of the batch
+            indices: The indices of the test cases to execute in this process
+            connection: The connection to send the serialized results through
+            shared_objects: The objects shared with the parent process
+            reached_statements: The shared array to record the number of reached
+                statements of each test case of the batch in
+        """
+        # The worker thread of the parent process does not exist after forking.
+        self._worker = None
+        self._reached_statements = reached_statements
+        # Forked processes share the identities of the objects with their parent.
+        persistent_ids = {identity: identity for identity in shared_objects}
+        for idx in indices:
+            self._current_index = idx
+            (result,) = self._execute_in_worker([test_cases[idx]])
+            connection.send_bytes(_serialize_result(result, persistent_ids))
+        connection.close()
+
+    def _reached_statement(
+        self,
+        test_case: tc.TestCase,
+        position: int,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+    ) -> None:
+        if (
+            self._reached_statements is not None
+            # An abandoned thread must not count for the next test case.
+            and self._tracer.is_current_thread()
+        ):
+            self._reached_statements[self._current_index] = position + 1
+
+
+@dataclass
+class _PrefixSnapshot:
+    """A process that holds the state of an execution before a statement."""
+
+    pid: int
+    prefix: tc.TestCase
+    context: tuple[Any, ...]
+    pinned_limit: int
+    requests: Connection
+    responses: Connection
+
+    def close_connections(self) -> None:
+        """Close the connections to the snapshot process."""
+        self.requests.close()
+        self.responses.close()
+
+
+class PrefixSnapshotTestCaseExecutor(TestCaseExecutor):
+    """An executor that resumes executions from snapshots of executed prefixes.
+
+    While a test case is executed in-process, the executor forks a snapshot process
+    before a statement, if the statements since the start of the test case, or since
+    the last snapshot, took long enough to execute.  The snapshot process holds the
+    state of the execution, i.e., the values of the variables, the trace and the
+    thread-local state of the observers, and waits.  A test case that starts with
+    statements that are structurally equal to the prefix of a snapshot, e.g., an
+    offspring of the executed test case that was mutated after the prefix, is sent
+    to the snapshot process instead of being executed from scratch.  The snapshot
+    process forks again, such that its own state stays untouched, and only executes
+    the remaining statements.  The trace of the result thus consists of the trace of
+    the prefix and the trace of the remaining statements.
+
+    Resuming an execution assumes that the prefix behaves deterministically.  It is
+    not done while the test cases themselves are instrumented for checked coverage,
+    or if an observer does not support it, see
+    ExecutionObserver::supports_prefix_snapshots.  Test cases that cannot be resumed
+    are executed in-process.  Each snapshot process keeps a copy-on-write copy of the
+    memory of the Pynguin process alive; the least recently used snapshots are
+    terminated if there are more than the given number of them.
+    """
+
+    # Additional time (in seconds) that a snapshot process gets to deliver a result
+    # on top of the timeout of the test case, e.g., for forking and serializing.
+    _RESULT_GRACE_PERIOD = 1.0
+
+    def __init__(
+        self,
+        tracer: ExecutionTracer,
+        module_provider: ModuleProvider | None = None,
+        maximum_test_execution_timeout: int = 5,
+        test_execution_time_per_statement: int = 1,
+        number_of_snapshots: int = 16,
+        snapshot_interval: float = 0.05,
+    ) -> None:
+        """Create new prefix snapshot test case executor.
+
+        Args:
+            tracer: the execution tracer
+            module_provider: The used module provider
+            maximum_test_execution_timeout: The minimum timeout time (in seconds)
+                before a test case execution times out.
+            test_execution_time_per_statement: The amount of time (in seconds) that is
+                added to the timeout per statement, up to minimum_test_execution_timeout
+            number_of_snapshots: The maximum number of snapshot processes
+            snapshot_interval: The minimum time (in seconds) that the statements of
+                a test case have to take since its start, or since the last snapshot,
+                before another snapshot is taken
+        """
+        super().__init__(
+            tracer,
+            module_provider,
+            maximum_test_execution_timeout,
+            test_execution_time_per_statement,
+        )
+        if not hasattr(os, "fork"):
+            _LOGGER.warning("Forking processes is not supported, taking no snapshots")
+            number_of_snapshots = 0
+        self._number_of_snapshots = number_of_snapshots
+        self._snapshot_interval = snapshot_interval
+        self._snapshots: OrderedDict[int, _PrefixSnapshot] = OrderedDict()
+        # The objects that are referenced by identity, see _TestCasePickler.
+        self._pinned = _PinnedObjects()
+        # Only set while the executed test cases may be snapshotted.
+        self._snapshot_context: tuple[Any, ...] | None = None
+        self._new_snapshots: list[_PrefixSnapshot] = []
+        self._last_snapshot_time = 0.0
+        self._resumed_executions = 0
 
     @property
-    def tracer(self) -> ExecutionTracer:
-        """Provide access to the execution tracer.
+    def number_of_snapshots(self) -> int:
+        """Provides the maximum number of snapshot processes.
 
         Returns:
-            The execution tracer
+            The maximum number of snapshot processes
         """
-        return self._tracer
+        return self._number_of_snapshots
 
-    def set_instrument(self, instrument: bool) -> None:
-        """Set if the test is to be instrumented as well.
+    def set_number_of_snapshots(self, number_of_snapshots: int) -> None:
+        """Set the maximum number of snapshot processes.
+
+        Surplus snapshot processes are terminated, a value of 0 terminates all of
+        them and disables taking snapshots.
 
         Args:
-            instrument: Whether to instrument the test and its assertions.
+            number_of_snapshots: The new maximum number of snapshot processes
         """
-        self._instrument = instrument
+        self._number_of_snapshots = number_of_snapshots
+        self._evict_surplus_snapshots()
 
-    def execute(  # noqa: D102
-        self,
-        test_case: tc.TestCase,
-    ) -> ExecutionResult:
-        with contextlib.redirect_stdout(self._null_file), contextlib.redirect_stderr(
-            self._null_file
-        ):
-            return_queue: Queue[ExecutionResult] = Queue()
-            thread = threading.Thread(
-                target=self._execute_test_case,
-                args=(test_case, return_queue),
-                daemon=True,
+    @property
+    def resumed_executions(self) -> int:
+        """Provides the number of executions that were resumed from a snapshot.
+
+        Returns:
+            The number of executions that were resumed from a snapshot
+        """
+        return self._resumed_executions
+
+    def clear_snapshots(self) -> None:
+        """Terminate all snapshot processes."""
+        for snapshot in list(self._snapshots.values()):
+            self._evict(snapshot)
+
+    def _execute_test_cases(
+        self, test_cases: Sequence[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        """Resume the executions of the test cases from snapshots, where possible.
+
+        Args:
+            test_cases: the test cases that should be executed.
+
+        Returns:
+            The results of the executions, in the order of the given test cases.
+        """
+        if (
+            self._instrument
+            or self._number_of_snapshots < 1
+            or not all(
+                observer.supports_prefix_snapshots for observer in self._observers
             )
-            thread.start()
-            thread.join(
-                timeout=min(
-                    self._maximum_test_execution_timeout,
-                    self._test_execution_time_per_statement * len(test_case.statements),
-                )
+        ):
+            return super()._execute_test_cases(test_cases)
+
+        context = (*self._observers, self._tracer.get_subject_properties())
+        results: list[ExecutionResult | None] = [
+            self._resume(test_case, context) for test_case in test_cases
+        ]
+        if to_execute := [idx for idx, result in enumerate(results) if result is None]:
+            executed = self._execute_taking_snapshots(
+                [test_cases[idx] for idx in to_execute], context
             )
-            if thread.is_alive():
-                # Set thread ident to invalid value, such that the tracer
-                # kills the thread
-                self._tracer.current_thread_identifier = -1
-                result = ExecutionResult(timeout=True)
-                _LOGGER.warning("Experienced timeout from test-case execution")
-            else:
-                try:
-                    result = return_queue.get(block=False)
-                except Empty as ex:
-                    _LOGGER.error("Finished thread did not return a result.")
-                    raise RuntimeError("Bug in Pynguin!") from ex
-        self._after_test_case_execution_outside_thread(test_case, result)
-        return result
+            for idx, result in zip(to_execute, executed, strict=True):
+                results[idx] = result
+        return cast(list[ExecutionResult], results)
 
-    def _before_test_case_execution(self, test_case: tc.TestCase) -> None:
-        self._tracer.init_trace()
-        for observer in self._observers:
-            observer.before_test_case_execution(test_case)
+    def _execute_taking_snapshots(
+        self, test_cases: Sequence[tc.TestCase], context: tuple[Any, ...]
+    ) -> list[ExecutionResult]:
+        """Execute the test cases in-process and take snapshots of their prefixes.
 
-    def _execute_test_case(self, test_case: tc.TestCase, result_queue: Queue) -> None:
-        self._before_test_case_execution(test_case)
-        result = ExecutionResult()
-        exec_ctx = ExecutionContext(self._module_provider)
-        self._tracer.current_thread_identifier = threading.current_thread().ident
-        for idx, statement in enumerate(test_case.statements):
-            ast_node = self._before_statement_execution(statement, exec_ctx)
-            exception = self.execute_ast(ast_node, exec_ctx)
-            self._after_statement_execution(statement, exec_ctx, exception)
-            if exception is not None:
-                result.report_new_thrown_exception(idx, exception)
-                break
-        self._after_test_case_execution_inside_thread(test_case, result)
-        result_queue.put(result)
+        Args:
+            test_cases: The test cases to execute
+            context: The context of the execution
 
-    def _after_test_case_execution_inside_thread(
-        self, test_case: tc.TestCase, result: ExecutionResult
-    ) -> None:
-        """Collect the trace data after each executed test case.
+        Returns:
+            The execution results, in the order of the given test cases
+        """
+        self._snapshot_context = context
+        try:
+            return super()._execute_test_cases(test_cases)
+        finally:
+            self._snapshot_context = None
+            for snapshot in self._new_snapshots:
+                self._snapshots[snapshot.pid] = snapshot
+            self._new_snapshots.clear()
+            self._evict_surplus_snapshots()
+
+    def _pin(self, test_case: tc.TestCase) -> None:
+        """Pin the objects that the test case refers to before taking a snapshot.
+
+        Later test cases probably refer to the same objects, which can only be sent
+        to the snapshot process, if they were pinned before it was forked.  This
+        includes the accessible objects of the test cluster that a mutation might
+        add to a later test case.
 
         Args:
-            test_case: The executed test case
-            result: The execution result
+            test_case: The test case
         """
-        result.execution_trace = self._tracer.get_trace()
-        for observer in self._observers:
-            observer.after_test_case_execution_inside_thread(test_case, result)
+        cluster = test_case.test_cluster
+        if id(cluster) not in self._pinned:
+            for accessible in itertools.chain(
+                cluster.accessible_objects_under_test,
+                *cluster.generators.values(),
+                *cluster.modifiers.values(),
+            ):
+                self._pinned.pin(accessible)
+            self._pinned.pin(cluster)
+        try:
+            _TestCasePickler(io.BytesIO(), self._pinned).dump(test_case)
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Could not pin the objects of a test case", exc_info=True)
 
-    def _after_test_case_execution_outside_thread(
-        self, test_case: tc.TestCase, result: ExecutionResult
+    def _reached_statement(
+        self,
+        test_case: tc.TestCase,
+        position: int,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
     ) -> None:
-        """Process results outside of thread.
+        if position == 0:
+            self._last_snapshot_time = time.perf_counter()
+            return
+        if (
+            self._snapshot_context is None
+            or len(self._new_snapshots) >= self._number_of_snapshots
+            or time.perf_counter() - self._last_snapshot_time < self._snapshot_interval
+            # An abandoned thread must not take snapshots.
+            or not self._tracer.is_current_thread()
+        ):
+            return
+        self._take_snapshot(test_case, position, exec_ctx, result)
+        self._last_snapshot_time = time.perf_counter()
+
+    def _take_snapshot(
+        self,
+        test_case: tc.TestCase,
+        position: int,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+    ) -> None:
+        """Fork a snapshot process that holds the state of the current execution.
+
+        The snapshot process never returns from this method.
 
         Args:
             test_case: The executed test case
+            position: The position of the statement that is executed next
+            exec_ctx: The execution context
             result: The execution result
         """
-        for observer in self._observers:
-            observer.after_test_case_execution_outside_thread(test_case, result)
-
-    def _before_statement_execution(
-        self, statement: stmt.Statement, exec_ctx: ExecutionContext
-    ) -> ast.Module:
-        # Check if the current thread is still the one that should be executing
-        # Otherwise raise an exception to kill it.
-        if self.tracer.current_thread_identifier != threading.current_thread().ident:
-            # Kill this thread
-            raise RuntimeError(
-                "The current thread shall not be executed any more, thus I kill it."
+        assert self._snapshot_context is not None
+        prefix = test_case.clone(limit=position)
+        self._pin(test_case)
+        requests, request_sender = multiprocessing.Pipe(duplex=False)
+        response_receiver, responses = multiprocessing.Pipe(duplex=False)
+        try:
+            pid = os.fork()
+        except OSError:
+            _LOGGER.debug("Could not fork a snapshot process", exc_info=True)
+            for connection in (requests, request_sender, response_receiver, responses):
+                connection.close()
+            return
+        if pid == 0:
+            try:
+                request_sender.close()
+                response_receiver.close()
+                for snapshot in (*self._snapshots.values(), *self._new_snapshots):
+                    snapshot.close_connections()
+                self._snapshot_context = None
+                self._serve_snapshot(requests, responses, position, exec_ctx, result)
+            finally:
+                os._exit(0)
+        requests.close()
+        responses.close()
+        self._new_snapshots.append(
+            _PrefixSnapshot(
+                pid,
+                prefix,
+                self._snapshot_context,
+                self._pinned.count,
+                request_sender,
+                response_receiver,
             )
+        )
 
-        # We need to disable the tracer, because an observer might interact with an
-        # object of the SUT via the ExecutionContext and trigger code execution, which
-        # is not caused by the test case and should therefore not be in the trace.
-        self._tracer.disable()
+    def _serve_snapshot(
+        self,
+        requests: Connection,
+        responses: Connection,
+        position: int,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+    ) -> None:
+        """Resume executions from the state of this snapshot process.
 
-        ast_node = exec_ctx.node_for_statement(statement)
-        try:
-            for observer in self._observers:
-                ast_node = observer.before_statement_execution(
-                    statement, ast_node, exec_ctx
-                )
-        finally:
-            self._tracer.enable()
-        return ExecutionContext.wrap_node_in_module(ast_node)
+        Each execution is resumed in a forked process, which keeps the state of this
+        process untouched.  If that process fails, an empty response is sent.
 
-    def execute_ast(
+        Args:
+            requests: The connection to receive the test cases from
+            responses: The connection to send the results through
+            position: The position of the statement that is executed next
+            exec_ctx: The execution context
+            result: The execution result
+        """
+        while True:
+            try:
+                request = requests.recv_bytes()
+            except EOFError:
+                return
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    self._resume_in_snapshot(
+                        request, responses, position, exec_ctx, result
+                    )
+                    status = 0
+                finally:
+                    os._exit(status)
+            _, status = os.waitpid(pid, 0)
+            if status != 0:
+                responses.send_bytes(b"")
+
+    def _resume_in_snapshot(
         self,
-        ast_node: ast.Module,
+        request: bytes,
+        responses: Connection,
+        position: int,
         exec_ctx: ExecutionContext,
-    ) -> BaseException | None:
-        """Execute the given ast_node in the given context.
+        result: ExecutionResult,
+    ) -> None:
+        """Execute the remaining statements of a test case in a forked process.
 
-        You can use this in an observer if you also need to execute an AST Node.
+        The process first sends its id, such that it can be killed on a timeout,
+        and then the result of the execution.
 
         Args:
-            ast_node: The node to execute.
+            request: The serialized test case and the objects shared with the
+                Pynguin process, paired with their identities there
+            responses: The connection to send the results through
+            position: The position of the statement that is executed next
             exec_ctx: The execution context
+            result: The execution result
+        """
+        responses.send_bytes(str(os.getpid()).encode())
+        test_case, shared_objects = _TestCaseUnpickler(
+            io.BytesIO(request), self._pinned
+        ).load()
+        exec_ctx.rebind_variables(test_case.statements[:position])
+        self._execute_statements_from(test_case, exec_ctx, result, position)
+        self._after_test_case_execution_inside_thread(test_case, result)
+        persistent_ids = {id(obj): identity for identity, obj in shared_objects}
+        responses.send_bytes(_serialize_result(result, persistent_ids))
+
+    def _resume(
+        self, test_case: tc.TestCase, context: tuple[Any, ...]
+    ) -> ExecutionResult | None:
+        """Resume the execution of the test case from the longest matching snapshot.
+
+        Args:
+            test_case: The test case to execute
+            context: The context of the execution
 
         Returns:
-            The raised exception, if any.
+            The execution result, or None, if the execution could not be resumed
         """
-        if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug("Executing %s", ast.unparse(ast_node))
-
-        code = compile(ast_node, "<ast>", "exec")
-        if self._instrument:
-            code = self._checked_transformer.instrument_module(code)
+        snapshot: _PrefixSnapshot | None = None
+        for candidate in self._snapshots.values():
+            if (
+                snapshot is None or candidate.prefix.size() > snapshot.prefix.size()
+            ) and (
+                _is_same_context(candidate.context, context)
+                and _starts_with(test_case, candidate.prefix)
+            ):
+                snapshot = candidate
+        if snapshot is None:
+            return None
 
+        shared_objects = _collect_shared_objects([test_case])
+        buffer = io.BytesIO()
         try:
-            exec(  # noqa: S102
-                code, exec_ctx.global_namespace, exec_ctx.local_namespace
+            _TestCasePickler(buffer, self._pinned, snapshot.pinned_limit).dump(
+                (test_case, list(shared_objects.items()))
             )
-        except BaseException as err:  # noqa: BLE001
-            failed_stmt = ast.unparse(ast_node)
-            _LOGGER.debug("Failed to execute statement:\n%s%s", failed_stmt, err.args)
-            return err
-
-        return None
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Could not send test case to snapshot", exc_info=True)
+            return None
+        try:
+            result = self._receive_result(
+                snapshot, test_case, buffer.getvalue(), shared_objects
+            )
+        except (OSError, EOFError):
+            _LOGGER.debug("Lost connection to snapshot process", exc_info=True)
+            result = None
+        if result is None or result.timeout:
+            # The responses of the snapshot process might be out of sync.
+            self._evict(snapshot)
+        else:
+            self._snapshots.move_to_end(snapshot.pid)
+            self._resumed_executions += 1
+        return result
 
-    def _after_statement_execution(
+    def _receive_result(
         self,
-        statement: stmt.Statement,
-        exec_ctx: ExecutionContext,
-        exception: BaseException | None,
-    ):
-        # See comments in _before_statement_execution
-        if self.tracer.current_thread_identifier != threading.current_thread().ident:
-            # Kill this thread
-            raise RuntimeError(
-                "The current thread shall not be executed any more, thus I kill it."
-            )
+        snapshot: _PrefixSnapshot,
+        test_case: tc.TestCase,
+        request: bytes,
+        shared_objects: dict[int, Any],
+    ) -> ExecutionResult | None:
+        """Send a request to a snapshot process and receive the execution result.
 
-        self._tracer.disable()
-        try:
-            for observer in reversed(self._observers):
-                observer.after_statement_execution(statement, self, exec_ctx, exception)
-        finally:
-            self._tracer.enable()
+        Args:
+            snapshot: The snapshot to resume the execution from
+            test_case: The test case to execute
+            request: The serialized test case
+            shared_objects: The objects that the result may refer to
+
+        Returns:
+            The execution result, or None, if the snapshot process failed
+        """
+        snapshot.requests.send_bytes(request)
+        if not snapshot.responses.poll(self._RESULT_GRACE_PERIOD) or not (
+            pid := snapshot.responses.recv_bytes()
+        ):
+            return None
+        if not snapshot.responses.poll(
+            self._get_timeout(test_case) + self._RESULT_GRACE_PERIOD
+        ):
+            _LOGGER.warning("Experienced timeout from test-case execution")
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(int(pid), signal.SIGKILL)
+            return ExecutionResult(timeout=True)
+        if not (response := snapshot.responses.recv_bytes()):
+            return None
+        return _ResultUnpickler(io.BytesIO(response), shared_objects).load()
+
+    def _evict_surplus_snapshots(self) -> None:
+        while len(self._snapshots) > self._number_of_snapshots:
+            self._evict(next(iter(self._snapshots.values())))
+
+    def _evict(self, snapshot: _PrefixSnapshot) -> None:
+        """Terminate the given snapshot process.
+
+        Args:
+            snapshot: The snapshot to evict
+        """
+        del self._snapshots[snapshot.pid]
+        snapshot.close_connections()
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(snapshot.pid, signal.SIGKILL)
+        with contextlib.suppress(ChildProcessError):
+            os.waitpid(snapshot.pid, 0)
+        # No remaining snapshot process can resolve the objects that were pinned
+        # after all of them were forked.
+        self._pinned.release_from(
+            max(
+                (
+                    remaining.pinned_limit
+                    for remaining in (*self._snapshots.values(), *self._new_snapshots)
+                ),
+                default=0,
+            )
+        )
 
 
 class TypeTracingTestCaseExecutor(AbstractTestCaseExecutor):
@@ -2387,19 +4729,29 @@ class TypeTracingTestCaseExecutor(AbstractTestCaseExecutor):
         return self._delegate.tracer
 
     def execute(self, test_case: tc.TestCase) -> ExecutionResult:  # noqa: D102
+        return self.execute_many([test_case])[0]
+
+    def execute_many(  # noqa: D102
+        self, test_cases: Sequence[tc.TestCase]
+    ) -> list[ExecutionResult]:
         with self._delegate.temporarily_add_observer(self._return_type_observer):
-            result = self._delegate.execute(test_case)
-        if not result.timeout:
-            # Only execute with proxies if the test case doesn't time out.
-            # There is no need to stall another thread.
+            results = self._delegate.execute_many(test_cases)
+        # Only execute with proxies if the test case doesn't time out.
+        # There is no need to stall another thread.
+        to_trace = [
+            test_case
+            for test_case, result in zip(test_cases, results, strict=True)
+            if not result.timeout
+        ]
+        if to_trace:
             with (
                 self._delegate.temporarily_add_observer(self._type_tracing_observer),
                 tt.shim_isinstance(),
             ):
                 # TODO(fk) Do we record wrong stuff, i.e., type checks from observers?
                 #  Make use of type errors?
-                self._delegate.execute(test_case)
-        return result
+                self._delegate.execute_many(to_trace)
+        return results
 
     def temporarily_add_observer(self, observer: ExecutionObserver):  # noqa: D102
         pass
@@ -2416,6 +4768,10 @@ class TypeTracingObserver(ExecutionObserver):
 
         def __init__(self):  # noqa: D107
             super().__init__()
+            self.reset()
+
+        def reset(self) -> None:
+            """Reset the active proxies for a new execution."""
             # Active proxies per statement position and argument name.
             self.proxies: dict[tuple[int, str], tt.ObjectProxy] = {}
 
@@ -2428,12 +4784,8 @@ class TypeTracingObserver(ExecutionObserver):
         self._local_state = TypeTracingObserver.TypeTracingLocalState()
         self._cluster = cluster
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
-
-        Args:
-            test_case: Not used
-        """
+    def before_test_case_execution(self, test_case: tc.TestCase):  # noqa: D102
+        self._local_state.reset()
 
     def after_test_case_execution_inside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ExecutionResult
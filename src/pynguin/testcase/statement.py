@@ -8,11 +8,13 @@
 from __future__ import annotations
 
 import abc
+import functools
 import logging
 import math
 
 from abc import ABCMeta
 from abc import abstractmethod
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Generic
@@ -42,6 +44,30 @@ if TYPE_CHECKING:
     from pynguin.analyses import constants
 
 T = TypeVar("T")
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _changes_structure(method: _F) -> _F:
+    """Marks a method that changes the structure of its statement.
+
+    The cached structural hash of the test case the statement belongs to is
+    discarded after the method was invoked.
+
+    Args:
+        method: The method of a statement
+
+    Returns:
+        The wrapped method
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: Statement, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._test_case.invalidate_structural_hash()
+
+    return cast(_F, wrapper)
 
 
 class Statement(metaclass=ABCMeta):
@@ -471,6 +497,7 @@ class AssignmentStatement(Statement):
     def accessible_object(self) -> gao.GenericAccessibleObject | None:  # noqa: D102
         return None
 
+    @_changes_structure
     def mutate(self) -> bool:  # noqa: D102
         raise NotImplementedError("Implement me")
 
@@ -480,6 +507,7 @@ class AssignmentStatement(Statement):
             refs.add(l_var)
         return refs
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -539,6 +567,7 @@ class CollectionStatement(Generic[T], VariableCreatingStatement):
     def accessible_object(self) -> gao.GenericAccessibleObject | None:  # noqa: D102
         return None
 
+    @_changes_structure
     def mutate(self) -> bool:  # noqa: D102
         changed = False
         if (
@@ -674,6 +703,7 @@ class ListStatement(NonDictCollection):
         references.update(self._elements)
         return references
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -705,6 +735,7 @@ class SetStatement(NonDictCollection):
         references.update(self._elements)
         return references
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -736,6 +767,7 @@ class TupleStatement(NonDictCollection):
         references.update(self._elements)
         return references
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -779,6 +811,7 @@ class DictStatement(
             references.add(entry[1])
         return references
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -903,6 +936,7 @@ class FieldStatement(VariableCreatingStatement):
         return self._source
 
     @source.setter
+    @_changes_structure
     def source(self, new_source: vr.Reference) -> None:
         """Set new source.
 
@@ -914,6 +948,7 @@ class FieldStatement(VariableCreatingStatement):
     def accessible_object(self) -> gao.GenericAccessibleObject | None:  # noqa: D102
         return self._field
 
+    @_changes_structure
     def mutate(self) -> bool:  # noqa: D102
         if (
             randomness.next_float()
@@ -954,6 +989,7 @@ class FieldStatement(VariableCreatingStatement):
             refs.add(var)
         return refs
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -1017,6 +1053,7 @@ class ParametrizedStatement(VariableCreatingStatement, metaclass=ABCMeta):
         return self._args
 
     @args.setter
+    @_changes_structure
     def args(self, args: dict[str, vr.VariableReference]):
         self._args = args
 
@@ -1035,6 +1072,7 @@ class ParametrizedStatement(VariableCreatingStatement, metaclass=ABCMeta):
         references.update(self.args.values())
         return references
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -1057,6 +1095,7 @@ class ParametrizedStatement(VariableCreatingStatement, metaclass=ABCMeta):
         """
         return {name: var.clone(memo) for name, var in self._args.items()}
 
+    @_changes_structure
     def mutate(self) -> bool:  # noqa: D102
         if (
             randomness.next_float()
@@ -1330,6 +1369,7 @@ class MethodStatement(ParametrizedStatement):
         references.add(self._callee)
         return references
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -1347,6 +1387,7 @@ class MethodStatement(ParametrizedStatement):
         return self._callee
 
     @callee.setter
+    @_changes_structure
     def callee(self, new_callee: vr.VariableReference) -> None:
         """Set new callee on which the method is invoked.
 
@@ -1466,12 +1507,14 @@ class PrimitiveStatement(Generic[T], VariableCreatingStatement):
         return self._value
 
     @value.setter
+    @_changes_structure
     def value(self, value: T) -> None:
         self._value = value
 
     def accessible_object(self) -> gao.GenericAccessibleObject | None:  # noqa: D102
         return None
 
+    @_changes_structure
     def mutate(self) -> bool:  # noqa: D102
         old_value = self._value
         while self._value == old_value and self._value is not None:
@@ -1487,6 +1530,7 @@ class PrimitiveStatement(Generic[T], VariableCreatingStatement):
     def get_variable_references(self) -> set[vr.VariableReference]:  # noqa: D102
         return {self.ret_val}
 
+    @_changes_structure
     def replace(  # noqa: D102
         self, old: vr.VariableReference, new: vr.VariableReference
     ) -> None:
@@ -42,6 +42,9 @@ class TestCase(metaclass=ABCMeta):
         """
         self._statements: list[stmt.Statement] = []
         self.test_cluster: TestCluster = test_cluster
+        # The structural hash of this test case, if it was computed since the last
+        # change of its structure.
+        self._structural_hash: int | None = None
 
     @property
     def statements(self) -> list[stmt.Statement]:
@@ -52,6 +55,14 @@ class TestCase(metaclass=ABCMeta):
         """
         return self._statements
 
+    def invalidate_structural_hash(self) -> None:
+        """Discard the cached structural hash of this test case.
+
+        Has to be called whenever the structure of the test case changes, i.e.,
+        when statements are added, removed, or modified.
+        """
+        self._structural_hash = None
+
     @abstractmethod
     def accept(self, visitor: tcv.TestCaseVisitor) -> None:
         """Handles a test visitor.
@@ -0,0 +1,434 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019-2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides compact collections for dense, non-negative integer ids.
+
+The ids of code objects, predicates and lines are assigned consecutively by the
+execution tracer.  Instead of hashing them, the collections in this module use the
+ids as indices into flag or typed arrays, which keeps the execution traces
+stored in every chromosome small and makes merging them cheap.
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import MutableMapping
+from collections.abc import MutableSet
+from collections.abc import Set
+from math import inf
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+
+T = TypeVar("T", int, float)
+_DenseMappingT = TypeVar("_DenseMappingT", bound="_DenseMapping")
+
+
+class DenseSet(MutableSet[int]):
+    """A set of non-negative integers that stores one flag byte per possible element.
+
+    A byte per element is still far smaller than a hashed entry, and, unlike a
+    packed bitset, adding an element is a single item assignment, which matters on
+    the hot path of the tracer.  Iteration yields the elements in ascending order.
+    Like a built-in set, a dense set is equal to every set with the same elements.
+    """
+
+    __slots__ = ("_flags",)
+
+    def __init__(self, iterable: Iterable[int] | None = None) -> None:
+        """Initializes the set.
+
+        Args:
+            iterable: The elements the set shall initially contain.
+        """
+        self._flags = bytearray()
+        if iterable is not None:
+            self.update(iterable)
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            return value >= 0 and self._flags[value] == 1
+        except (IndexError, TypeError):
+            return False
+
+    def __iter__(self) -> Iterator[int]:
+        flags = self._flags
+        value = flags.find(1)
+        while value >= 0:
+            yield value
+            value = flags.find(1, value + 1)
+
+    def __len__(self) -> int:
+        return len(self._flags) - self._flags.count(0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._flags.__sizeof__()
+
+    def __getstate__(self) -> bytes:
+        return bytes(self._flags.rstrip(b"\x00"))
+
+    def __setstate__(self, state: bytes) -> None:
+        self._flags = bytearray(state)
+
+    def add(self, value: int) -> None:
+        """Add an element to the set.
+
+        Args:
+            value: The non-negative integer to add.
+        """
+        if not 0 <= value < len(self._flags):
+            self._flags = _grow_flags(self._flags, value + 1)
+        self._flags[value] = 1
+
+    def discard(self, value: int) -> None:
+        """Remove an element from the set, if it is present.
+
+        Args:
+            value: The integer to remove.
+        """
+        if value in self:
+            self._flags[value] = 0
+
+    def clear(self) -> None:
+        """Remove all elements from the set."""
+        self._flags = bytearray()
+
+    def update(self, *others: Iterable[int]) -> None:
+        """Add the elements of all given iterables to the set.
+
+        The flags of dense sets are merged with a single bitwise or.
+
+        Args:
+            *others: The iterables whose elements are added.
+        """
+        dense_flags = []
+        for other in others:
+            if isinstance(other, DenseSet):
+                dense_flags.append(other._flags)
+            else:
+                for value in other:
+                    self.add(value)
+        if dense_flags:
+            self._flags = _merge_flags(self._flags, *dense_flags)
+
+    def copy(self) -> DenseSet:
+        """Provides a shallow copy of this set.
+
+        Returns:
+            A copy of this set
+        """
+        copied = DenseSet()
+        copied._flags = bytearray(self._flags)
+        return copied
+
+    def union(self, *others: Iterable[int]) -> DenseSet:
+        """Provides the union of this set and the given iterables.
+
+        Args:
+            *others: The iterables to unite with.
+
+        Returns:
+            A new set containing all elements
+        """
+        result = self.copy()
+        result.update(*others)
+        return result
+
+    def intersection(self, *others: Iterable[Any]) -> DenseSet:
+        """Provides the elements of this set that are in all given iterables.
+
+        Args:
+            *others: The iterables to intersect with.
+
+        Returns:
+            A new set containing the common elements
+        """
+        result = self.copy()
+        for other in others:
+            other_set = other if isinstance(other, Set) else set(other)
+            result = DenseSet(value for value in result if value in other_set)
+        return result
+
+    def difference(self, *others: Iterable[Any]) -> DenseSet:
+        """Provides the elements of this set that are in none of the iterables.
+
+        Args:
+            *others: The iterables whose elements are removed.
+
+        Returns:
+            A new set containing the remaining elements
+        """
+        result = self.copy()
+        for other in others:
+            for value in other:
+                result.discard(value)
+        return result
+
+    def issubset(self, other: Iterable[Any]) -> bool:
+        """Checks whether every element of this set is in the other iterable.
+
+        Args:
+            other: The iterable to check against.
+
+        Returns:
+            Whether this set is a subset of the other iterable
+        """
+        other_set = other if isinstance(other, Set) else set(other)
+        return all(value in other_set for value in self)
+
+    def issuperset(self, other: Iterable[Any]) -> bool:
+        """Checks whether every element of the other iterable is in this set.
+
+        Args:
+            other: The iterable to check against.
+
+        Returns:
+            Whether this set is a superset of the other iterable
+        """
+        return all(value in self for value in other)
+
+
+def _grow_flags(flags: bytearray, size: int) -> bytearray:
+    if size <= 0:
+        raise ValueError("Dense collections can only store non-negative integers")
+    flags.extend(bytes(size - len(flags)))
+    return flags
+
+
+def _merge_flags(*flags: bytearray) -> bytearray:
+    """Computes the union of flag arrays.
+
+    The flags are either zero or one, so a bitwise or of the arrays, interpreted as
+    integers, is the element-wise or.
+
+    Args:
+        *flags: The flags to merge.
+
+    Returns:
+        The merged flags
+    """
+    merged = 0
+    for other in flags:
+        merged |= int.from_bytes(other, "little")
+    return bytearray(merged.to_bytes(max(map(len, flags)), "little"))
+
+
+class _DenseMapping(MutableMapping[int, T], Generic[T]):
+    """A mapping from non-negative integers to numbers, backed by a typed array.
+
+    The array is indexed by the key and grows to the largest key stored.  Flags like
+    those of a dense set record which keys are present; absent slots hold a neutral
+    value, such that updates and merges can operate on the slots without checking
+    for presence.
+    """
+
+    __slots__ = ("_values", "_present")
+
+    _TYPECODE: str
+    _ABSENT: T
+
+    def __init__(self, mapping: Mapping[int, T] | None = None) -> None:
+        """Initializes the mapping.
+
+        Args:
+            mapping: The entries the mapping shall initially contain.
+        """
+        self._values: array = array(self._TYPECODE)
+        self._present = bytearray()
+        if mapping is not None:
+            self.update(mapping)
+
+    def __getitem__(self, key: int) -> T:
+        try:
+            if key >= 0 and self._present[key] == 1:
+                return self._values[key]
+        except (IndexError, TypeError):
+            pass
+        raise KeyError(key)
+
+    def get(self, key: int, default: Any = None) -> Any:
+        try:
+            if key >= 0 and self._present[key] == 1:
+                return self._values[key]
+        except (IndexError, TypeError):
+            pass
+        return default
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return key >= 0 and self._present[key] == 1
+        except (IndexError, TypeError):
+            return False
+
+    def __setitem__(self, key: int, value: T) -> None:
+        if not 0 <= key < len(self._values):
+            self._grow(key + 1)
+        self._values[key] = value
+        self._present[key] = 1
+
+    def __delitem__(self, key: int) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._values[key] = self._ABSENT
+        self._present[key] = 0
+
+    def __iter__(self) -> Iterator[int]:
+        present = self._present
+        key = present.find(1)
+        while key >= 0:
+            yield key
+            key = present.find(1, key + 1)
+
+    def __len__(self) -> int:
+        return len(self._present) - self._present.count(0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + self._values.__sizeof__()
+            + self._present.__sizeof__()
+        )
+
+    def __getstate__(self) -> tuple[bytes, bytes]:
+        present = self._present.rstrip(b"\x00")
+        return self._values[: len(present)].tobytes(), bytes(present)
+
+    def __setstate__(self, state: tuple[bytes, bytes]) -> None:
+        values, present = state
+        self._values = array(self._TYPECODE)
+        self._values.frombytes(values)
+        self._present = bytearray(present)
+
+    def copy(self: _DenseMappingT) -> _DenseMappingT:
+        """Provides a shallow copy of this mapping.
+
+        Returns:
+            A copy of this mapping
+        """
+        copied = type(self)()
+        copied._values = array(self._TYPECODE, self._values)
+        copied._present = bytearray(self._present)
+        return copied
+
+    def _grow(self, size: int) -> None:
+        self._present = _grow_flags(self._present, size)
+        self._values.extend([self._ABSENT] * (size - len(self._values)))
+
+    def _prepare_merge(self, other: Mapping[int, T]) -> array | None:
+        """Prepares merging the other mapping into this mapping.
+
+        Args:
+            other: The mapping that shall be merged.
+
+        Returns:
+            The values of the other mapping, if it is a dense mapping of the same
+            kind, such that the slots can be merged directly, None otherwise.
+        """
+        if type(other) is not type(self):
+            return None
+        assert isinstance(other, _DenseMapping)
+        if len(other._values) > len(self._values):
+            self._grow(len(other._values))
+        self._present = _merge_flags(self._present, other._present)
+        return other._values
+
+
+class DenseCountMapping(_DenseMapping[int]):
+    """A mapping from non-negative integer ids to non-negative counts."""
+
+    __slots__ = ()
+
+    _TYPECODE = "Q"
+    _ABSENT = 0
+
+    def increment(self, key: int, value: int = 1) -> None:
+        """Increment the count of the given key.
+
+        Args:
+            key: The key whose count is incremented.
+            value: The amount to add.
+        """
+        if not 0 <= key < len(self._values):
+            self._grow(key + 1)
+        self._values[key] += value
+        self._present[key] = 1
+
+    def merge(self, other: Mapping[int, int]) -> None:
+        """Merge the other mapping into this mapping by summing up the counts.
+
+        Args:
+            other: The mapping to merge.
+        """
+        other_values = self._prepare_merge(other)
+        if other_values is None:
+            for key, value in other.items():
+                self.increment(key, value)
+            return
+        values = self._values
+        for key in other:
+            values[key] += other_values[key]
+
+    def subtract(self, other: Mapping[int, int]) -> None:
+        """Subtract the counts of the other mapping, which were merged before.
+
+        Keys whose count drops to zero are removed.
+
+        Args:
+            other: The mapping whose counts are subtracted.
+        """
+        values = self._values
+        for key, value in other.items():
+            assert key in self, "Cannot subtract counts that were never added"
+            values[key] -= value
+            if values[key] == 0:
+                self._present[key] = 0
+
+
+class DenseDistanceMapping(_DenseMapping[float]):
+    """A mapping from non-negative integer ids to distances."""
+
+    __slots__ = ()
+
+    _TYPECODE = "d"
+    _ABSENT = inf
+
+    def minimize(self, key: int, value: float) -> None:
+        """Store the given value, if it is smaller than the stored value.
+
+        Args:
+            key: The key whose value is updated.
+            value: The new candidate value.
+        """
+        if not 0 <= key < len(self._values):
+            self._grow(key + 1)
+        if value < self._values[key]:
+            self._values[key] = value
+        self._present[key] = 1
+
+    def merge(self, other: Mapping[int, float]) -> None:
+        """Merge the other mapping into this mapping. The minimum value wins.
+
+        Args:
+            other: The mapping to merge.
+        """
+        other_values = self._prepare_merge(other)
+        if other_values is None:
+            for key, value in other.items():
+                self.minimize(key, value)
+            return
+        values = self._values
+        for key in other:
+            if other_values[key] < values[key]:
+                values[key] = other_values[key]
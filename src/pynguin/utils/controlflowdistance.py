@@ -23,6 +23,8 @@ import pynguin.ga.computations as ff
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pynguin.analyses.controlflow import ControlDependenceGraph
     from pynguin.analyses.controlflow import ProgramGraphNode
     from pynguin.testcase.execution import ExecutionResult
@@ -231,5 +233,5 @@ def _get_node_with_predicate_id(
     return cdg_nodes.pop()
 
 
-def _predicate_fitness(predicate: int, branch_distances: dict[int, float]) -> float:
+def _predicate_fitness(predicate: int, branch_distances: Mapping[int, float]) -> float:
     return branch_distances.get(predicate, inf)
@@ -116,6 +116,32 @@ class RuntimeVariable(str, enum.Enum):
     # Number of constructors
     NumberOfConstructors = "NumberOfConstructors"
 
+    # Number of times a compiled code object of a statement or assertion was reused
+    CompiledCodeCacheHits = "CompiledCodeCacheHits"
+
+    # Number of times a statement or assertion had to be compiled
+    CompiledCodeCacheMisses = "CompiledCodeCacheMisses"
+
+    # Approximate number of bytes of execution traces that were dropped to stay
+    # within the execution trace memory budget
+    ShedExecutionTraceMemory = "ShedExecutionTraceMemory"
+
+    # Number of code objects whose instrumentation was removed during the search,
+    # because all their coverage goals were covered
+    DeinstrumentedCodeObjects = "DeinstrumentedCodeObjects"
+
+    # Number of invocations of the hooks of the instrumentation, if the
+    # instrumentation is profiled
+    InstrumentationHookCalls = "InstrumentationHookCalls"
+
+    # Time (in nanoseconds) spent in the hooks of the instrumentation, if the
+    # instrumentation is profiled
+    InstrumentationHookTime = "InstrumentationHookTime"
+
+    # The invocations of and the time spent in each hook of the instrumentation per
+    # code object, if the instrumentation is profiled
+    InstrumentationProfile = "InstrumentationProfile"
+
     # ========= Values collected during search =========
 
     # Obtained coverage (of the chosen testing criterion(s)) at different points in time
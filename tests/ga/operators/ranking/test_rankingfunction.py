@@ -11,9 +11,13 @@ import pytest
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
 
+from pynguin.ga.operators.comparator import DominanceComparator
+from pynguin.ga.operators.ranking import FitnessMatrix
 from pynguin.ga.operators.ranking import RankBasedPreferenceSorting
 from pynguin.ga.operators.ranking import RankedFronts
 from pynguin.ga.operators.ranking import RankingFunction
+from pynguin.ga.operators.ranking import fast_epsilon_dominance_assignment
+from pynguin.utils.orderedset import OrderedSet
 
 
 @pytest.fixture
@@ -71,3 +75,149 @@ def test_compute_ranking_assignment(ranking_function):
 
     result = ranking_function.compute_ranking_assignment(solutions, set())
     assert result == expected
+
+
+def _chromosome(length, *fitness_values):
+    chromosome = MagicMock(chrom.Chromosome)
+    chromosome.length.return_value = length
+    chromosome.get_fitness_values.return_value = list(fitness_values)
+    return chromosome
+
+
+def test_fitness_matrix_retrieves_values_once():
+    goals = OrderedSet([MagicMock(), MagicMock()])
+    chromosome = _chromosome(1, 0.5, 0.0)
+    matrix = FitnessMatrix([chromosome], goals)
+    assert matrix.number_of_goals == 2
+    assert matrix.row(chromosome) == [0.5, 0.0]
+    assert matrix.dominance(chromosome, chromosome) == 0
+    chromosome.get_fitness_values.assert_called_once_with(goals)
+
+
+@pytest.mark.parametrize(
+    "row_1, row_2, expected",
+    [
+        pytest.param([0.0, 1.0], [0.5, 1.0], -1),
+        pytest.param([0.5, 1.0], [0.0, 1.0], 1),
+        pytest.param([0.0, 1.0], [0.5, 0.5], 0),
+        pytest.param([0.5, 0.5], [0.5, 0.5], 0),
+    ],
+)
+def test_fitness_matrix_dominance(row_1, row_2, expected):
+    goal_1, goal_2 = MagicMock(), MagicMock()
+    chromosome_1 = _chromosome(1, *row_1)
+    chromosome_2 = _chromosome(1, *row_2)
+    chromosome_1.get_fitness_for.side_effect = dict(zip((goal_1, goal_2), row_1)).get
+    chromosome_2.get_fitness_for.side_effect = dict(zip((goal_1, goal_2), row_2)).get
+    matrix = FitnessMatrix([chromosome_1, chromosome_2], OrderedSet([goal_1, goal_2]))
+    comparator = DominanceComparator(goals=OrderedSet([goal_1, goal_2]))
+    assert matrix.dominance(chromosome_1, chromosome_2) == expected
+    assert comparator.compare(chromosome_1, chromosome_2) == expected
+
+
+def test_fitness_matrix_best_for_goal_prefers_shorter():
+    chromosome_1 = _chromosome(3, 0.5)
+    chromosome_2 = _chromosome(2, 0.5)
+    chromosome_3 = _chromosome(1, 0.7)
+    matrix = FitnessMatrix(
+        [chromosome_1, chromosome_2, chromosome_3], OrderedSet([MagicMock()])
+    )
+    assert matrix.best_for_goal(0) is chromosome_2
+
+
+def test_compute_ranking_assignment_zero_front():
+    chromosome_1 = _chromosome(1, 0.0, 0.5)
+    chromosome_2 = _chromosome(1, 0.5, 0.0)
+    chromosome_3 = _chromosome(1, 0.7, 0.7)
+    config.configuration.search_algorithm.population = 3
+    result = RankBasedPreferenceSorting().compute_ranking_assignment(
+        [chromosome_1, chromosome_2, chromosome_3],
+        OrderedSet([MagicMock(), MagicMock()]),
+    )
+    assert result.fronts == [[chromosome_1, chromosome_2], [chromosome_3]]
+    assert result.fitness_matrix.row(chromosome_3) == [0.7, 0.7]
+
+
+def test_fast_epsilon_dominance_assignment():
+    chromosome_1 = _chromosome(1, 0.0, 0.5, 0.3)
+    chromosome_2 = _chromosome(1, 0.5, 0.0, 0.3)
+    chromosome_3 = _chromosome(1, 0.0, 0.7, 0.3)
+    chromosome_4 = _chromosome(1, 0.9, 0.9, 0.3)
+    front = [chromosome_1, chromosome_2, chromosome_3, chromosome_4]
+    fast_epsilon_dominance_assignment(
+        front, OrderedSet([MagicMock(), MagicMock(), MagicMock()])
+    )
+    assert [chromosome.distance for chromosome in front] == [0.5, 0.75, 0.5, 0.0]
+
+
+@pytest.mark.parametrize(
+    "population, expected_fronts",
+    [
+        pytest.param(10, [[0, 1], [2, 3], [4], [5]]),
+        pytest.param(4, [[0, 1], [2, 3]]),
+        pytest.param(2, [[0, 1], [2, 3, 4, 5]]),
+    ],
+)
+def test_compute_ranking_assignment_fronts(population, expected_fronts):
+    chromosomes = [
+        _chromosome(1, 0.0, 0.5),
+        _chromosome(1, 0.5, 0.0),
+        _chromosome(1, 0.2, 0.7),
+        _chromosome(1, 0.7, 0.2),
+        _chromosome(1, 0.7, 0.7),
+        _chromosome(1, 0.8, 0.7),
+    ]
+    config.configuration.search_algorithm.population = population
+    result = RankBasedPreferenceSorting().compute_ranking_assignment(
+        chromosomes, OrderedSet([MagicMock(), MagicMock()])
+    )
+    assert result.fronts == [
+        [chromosomes[index] for index in front] for front in expected_fronts
+    ]
+    for rank, front in enumerate(result.fronts):
+        assert all(chromosome.rank == rank for chromosome in front)
+
+
+def test_compute_ranking_assignment_equal_solutions():
+    chromosomes = [_chromosome(1, 0.5, 0.5) for _ in range(3)]
+    chromosomes.append(_chromosome(1, 0.0, 0.0))
+    config.configuration.search_algorithm.population = 4
+    result = RankBasedPreferenceSorting().compute_ranking_assignment(
+        chromosomes, OrderedSet([MagicMock(), MagicMock()])
+    )
+    assert result.fronts == [chromosomes[3:], chromosomes[:3]]
+
+
+def test_zero_front_compares_best_with_offspring_only():
+    goal = MagicMock()
+    chromosome_1 = _chromosome(1, 0.2)
+    chromosome_2 = _chromosome(1, 0.5)
+    ranking = RankBasedPreferenceSorting()
+    config.configuration.search_algorithm.population = 1
+    ranking.compute_ranking_assignment([chromosome_1, chromosome_2], OrderedSet([goal]))
+
+    # A solution that was ranked before cannot improve, thus it is not compared.
+    chromosome_2.get_fitness_values.return_value = [0.0]
+    offspring = _chromosome(1, 0.1)
+    result = ranking.compute_ranking_assignment(
+        [chromosome_2, chromosome_1, offspring], OrderedSet([goal])
+    )
+    assert result.get_sub_front(0) == [offspring]
+
+
+def test_zero_front_rescans_without_best():
+    goal_1, goal_2 = MagicMock(), MagicMock()
+    chromosome_1 = _chromosome(1, 0.2, 0.7)
+    chromosome_2 = _chromosome(1, 0.5, 0.6)
+    chromosome_3 = _chromosome(1, 0.4, 0.9)
+    ranking = RankBasedPreferenceSorting()
+    config.configuration.search_algorithm.population = 2
+    ranking.compute_ranking_assignment(
+        [chromosome_1, chromosome_2, chromosome_3], OrderedSet([goal_1, goal_2])
+    )
+
+    result = ranking.compute_ranking_assignment(
+        [chromosome_2, chromosome_3], OrderedSet([goal_1, goal_2])
+    )
+    assert result.get_sub_front(0) == [chromosome_3, chromosome_2]
+    assert ranking._best_for_goal == {goal_1: chromosome_3, goal_2: chromosome_2}
@@ -45,3 +45,8 @@ def test_is_fulfilled(stopping_condition):
     stopping_condition.before_statement_execution(None, None, None)
     stopping_condition.before_statement_execution(None, None, None)
     assert stopping_condition.is_fulfilled()
+
+
+def test_counts_remote_execution(stopping_condition):
+    stopping_condition.after_remote_test_case_execution(None, 3)
+    assert stopping_condition.current_value() == 3
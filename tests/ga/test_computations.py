@@ -38,6 +38,17 @@ def test_run_test_case_chromosome_no_result():
     assert test_case.get_last_execution_result() == result
 
 
+def test_run_test_case_chromosome_does_not_clone_shared_test_case():
+    executor = MagicMock()
+    test_case = MagicMock()
+    func = DummyTestCaseChromosomeComputation(executor)
+    chromosome = tcc.TestCaseChromosome(test_case)
+    clone = chromosome.clone()
+    func._run_test_case_chromosome(clone)
+    executor.execute.assert_called_once_with(test_case)
+    test_case.clone.assert_not_called()
+
+
 def test_run_test_case_chromosome_has_result():
     executor = MagicMock()
     result = MagicMock()
@@ -62,6 +73,34 @@ def test_resetting_test_case_chromosome_forces_execution():
     assert test_case.get_last_execution_result() == result
 
 
+def test_run_test_case_chromosome_restores_shed_trace():
+    executor = MagicMock()
+    result = ExecutionResult()
+    executor.execute.return_value = result
+    func = DummyTestCaseChromosomeComputation(executor)
+    test_case = tcc.TestCaseChromosome(MagicMock())
+    test_case.changed = False
+    test_case.set_last_execution_result(ExecutionResult())
+    test_case.shed_execution_trace()
+    assert func._run_test_case_chromosome(test_case) is result
+    assert not test_case.execution_trace_shed
+
+
+def test_run_test_case_chromosomes_keeps_cache_of_shed_trace():
+    executor = MagicMock()
+    result = ExecutionResult()
+    executor.execute_many.return_value = [result]
+    test_case = tcc.TestCaseChromosome(MagicMock())
+    test_case.changed = False
+    test_case.set_last_execution_result(ExecutionResult())
+    test_case.shed_execution_trace()
+    with patch.object(test_case, "invalidate_cache") as invalidate_cache:
+        ff.run_test_case_chromosomes(executor, [test_case])
+    invalidate_cache.assert_not_called()
+    assert test_case.get_last_execution_result() is result
+    assert not test_case.execution_trace_shed
+
+
 @pytest.fixture()
 def executor_mock():
     return MagicMock(TestCaseExecutor)
@@ -166,7 +205,7 @@ def test_run_test_suite_chromosome():
     result0 = MagicMock()
     result1 = MagicMock()
     result2 = MagicMock()
-    executor.execute.side_effect = [result0, result1]
+    executor.execute_many.return_value = [result0, result1]
     ff = DummyTestSuiteChromosomeComputation(executor)
     indiv = tsc.TestSuiteChromosome()
     test_case0 = tcc.TestCaseChromosome(MagicMock())
@@ -184,12 +223,41 @@ def test_run_test_suite_chromosome():
     assert test_case1.get_last_execution_result() == result1
 
 
+def test_test_suite_fitness_uses_aggregated_trace():
+    executor = MagicMock()
+    executor.tracer.get_subject_properties.return_value.existing_lines = {
+        0: MagicMock(),
+        1: MagicMock(),
+        2: MagicMock(),
+    }
+    func = ff.LineTestSuiteFitnessFunction(executor)
+    indiv = tsc.TestSuiteChromosome()
+    for line in (0, 1):
+        result = ExecutionResult()
+        result.execution_trace.covered_line_ids.add(line)
+        test_case = tcc.TestCaseChromosome(MagicMock())
+        test_case.changed = False
+        test_case.set_last_execution_result(result)
+        indiv.add_test_case_chromosome(test_case)
+    assert func.compute_fitness(indiv) == 1
+    merged = indiv.aggregated_trace.update(
+        [test.get_last_execution_result() for test in indiv.test_case_chromosomes]
+    )
+    assert merged.covered_line_ids == {0, 1}
+
+    result = ExecutionResult()
+    result.execution_trace.covered_line_ids.add(2)
+    indiv.get_test_case_chromosome(1).set_last_execution_result(result)
+    assert func.compute_fitness(indiv) == 1
+    assert merged.covered_line_ids == {0, 2}
+
+
 def test_run_test_suite_chromosome_cache():
     executor = MagicMock()
     result0 = MagicMock()
     result1 = MagicMock()
     result2 = MagicMock()
-    executor.execute.side_effect = [result0, result1]
+    executor.execute_many.return_value = [result0, result1]
     func = DummyTestSuiteChromosomeComputation(executor)
     indiv = tsc.TestSuiteChromosome()
     # Executed because it was changed.
@@ -179,3 +179,35 @@ def test_computation_cache_fitness_for(cache):
     assert cache.get_fitness_for(func) == 0
     assert func.compute_fitness.call_count == 1
     assert func2.compute_fitness.call_count == 0
+
+
+def test_computation_cache_fitness_values(cache):
+    func = MagicMock()
+    func.is_maximisation_function.return_value = False
+    func.compute_fitness.return_value = 3
+    func2 = MagicMock()
+    func2.is_maximisation_function.return_value = False
+    func2.compute_fitness.return_value = 5
+    cache.add_fitness_function(func)
+    cache.add_fitness_function(func2)
+    cache._chromosome.changed = False
+
+    assert cache.get_fitness_values([func2]) == [5]
+    assert cache.get_fitness_values([func, func2]) == [3, 5]
+    assert cache.get_fitness_values([func2, func]) == [5, 3]
+    assert func.compute_fitness.call_count == 1
+    assert func2.compute_fitness.call_count == 1
+
+
+def test_computation_cache_fitness_values_changed(cache):
+    func = MagicMock()
+    func.is_maximisation_function.return_value = False
+    func.compute_fitness.return_value = 3
+    cache.add_fitness_function(func)
+    cache._chromosome.changed = False
+    assert cache.get_fitness_values([func]) == [3]
+
+    func.compute_fitness.return_value = 4
+    cache._chromosome.changed = True
+    assert cache.get_fitness_values([func]) == [4]
+    assert cache._chromosome.changed is False
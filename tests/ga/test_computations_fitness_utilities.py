@@ -118,6 +118,78 @@ def test_fitness_normalized(trace_mock, subject_properties_mock):
     )
 
 
+@given(
+    st.lists(
+        st.tuples(
+            st.integers(min_value=0, max_value=12),
+            st.booleans(),
+            st.floats(min_value=0.0, max_value=1e6),
+        ),
+        max_size=30,
+    ),
+    st.sets(st.integers(min_value=0, max_value=12)),
+    st.sets(st.integers(min_value=0, max_value=12)),
+)
+def test_fitness_dense_equals_scalar(executions, exclude_true, exclude_false):
+    subject_properties = SubjectProperties()
+    for predicate in range(10):
+        subject_properties.existing_predicates[predicate] = MagicMock(PredicateMetaData)
+    trace = ExecutionTrace()
+    for predicate, true_branch, distance in executions:
+        trace.update_predicate_distances(
+            0.0 if true_branch else distance,
+            distance if true_branch else 0.0,
+            predicate,
+        )
+    scalar_trace = ExecutionTrace()
+    scalar_trace.true_distances = dict(trace.true_distances.items())
+    scalar_trace.false_distances = dict(trace.false_distances.items())
+    scalar_trace.executed_predicates = dict(trace.executed_predicates.items())
+    assert (
+        ff._dense_branch_fitness_contributions(
+            scalar_trace, subject_properties, exclude_true, exclude_false
+        )
+        is None
+    )
+    assert ff.compute_branch_distance_fitness(
+        trace, subject_properties, None, exclude_true, exclude_false
+    ) == ff.compute_branch_distance_fitness(
+        scalar_trace, subject_properties, None, exclude_true, exclude_false
+    )
+    assert ff.compute_branch_distance_fitness_is_covered(
+        trace, subject_properties, None, exclude_true, exclude_false
+    ) == ff.compute_branch_distance_fitness_is_covered(
+        scalar_trace, subject_properties, None, exclude_true, exclude_false
+    )
+
+
+def test_fitness_is_covered_requires_zero_distances(
+    trace_mock, subject_properties_mock
+):
+    subject_properties_mock.existing_predicates[0] = MagicMock(PredicateMetaData)
+    trace_mock.executed_predicates[0] = 1
+    trace_mock.true_distances[0] = 0.0
+    trace_mock.false_distances[0] = 3.0
+    assert not ff.compute_branch_distance_fitness_is_covered(
+        trace_mock, subject_properties_mock
+    )
+    assert ff.compute_branch_distance_fitness_is_covered(
+        trace_mock, subject_properties_mock, exclude_false={0}
+    )
+
+
+def test_fitness_is_covered_fully_covered(trace_mock, subject_properties_mock):
+    for predicate in range(2):
+        subject_properties_mock.existing_predicates[predicate] = MagicMock(
+            PredicateMetaData
+        )
+        trace_mock.update_predicate_distances(0.0, 1.0, predicate)
+        trace_mock.update_predicate_distances(1.0, 0.0, predicate)
+    assert ff.compute_branch_distance_fitness_is_covered(
+        trace_mock, subject_properties_mock
+    )
+
+
 def test_branch_coverage_none(subject_properties_mock, trace_mock):
     assert ff.compute_branch_coverage(trace_mock, subject_properties_mock) == 1.0
 
@@ -274,10 +346,10 @@ def test_statement_checked_coverage_half_covered(subject_properties_mock, trace_
     mock_instr_1.file = "foo"
     statement = MagicMock()
     statements = [statement]
-    with patch.object(DynamicSlicer, "slice") as slice_mock:
+    with patch.object(DynamicSlicer, "slice_all") as slice_mock:
         with patch.object(statement, "get_position") as position_mock:
             position_mock.return_value = 1
-            slice_mock.return_value = [mock_instr_1]
+            slice_mock.return_value = [[mock_instr_1]]
             assert ff.compute_statement_checked_lines(
                 statements, trace_mock, subject_properties_mock, {1: MagicMock()}
             ) == {0}
@@ -299,10 +371,10 @@ def test_statement_checked_coverage_fully_covered(subject_properties_mock, trace
 
     statement = MagicMock()
     statements = [statement]
-    with patch.object(DynamicSlicer, "slice") as slice_mock:
+    with patch.object(DynamicSlicer, "slice_all") as slice_mock:
         with patch.object(statement, "get_position") as position_mock:
             position_mock.return_value = 1
-            slice_mock.return_value = [mock_instr_1, mock_instr_2]
+            slice_mock.return_value = [[mock_instr_1, mock_instr_2]]
             assert ff.compute_statement_checked_lines(
                 statements, trace_mock, subject_properties_mock, {1: MagicMock()}
             ) == {0, 1}
@@ -0,0 +1,91 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import importlib
+import threading
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.configuration as config
+import pynguin.ga.coveragegoals as bg
+
+from pynguin.ga.deinstrumentation import DeinstrumentationObserver
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.testcase.execution import ExecutionTracer
+
+
+@pytest.fixture
+def mixed():
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(
+        "tests.fixtures.instrumentation.mixed",
+        tracer,
+        {config.CoverageMetric.BRANCH, config.CoverageMetric.LINE},
+    ):
+        module = importlib.import_module("tests.fixtures.instrumentation.mixed")
+        module = importlib.reload(module)
+    executor = MagicMock(tracer=tracer)
+    fitness_functions = [
+        *bg.create_branch_coverage_fitness_functions(
+            executor, bg.BranchGoalPool(tracer.get_subject_properties())
+        ),
+        *bg.create_line_coverage_fitness_functions(executor),
+    ]
+    archive = MagicMock()
+    observer = DeinstrumentationObserver(archive, fitness_functions, tracer)
+    (on_target_covered,), _ = archive.add_on_target_covered.call_args
+    code_object_ids = {
+        meta.code_object.co_name: code_object_id
+        for code_object_id, meta in (
+            tracer.get_subject_properties().existing_code_objects.items()
+        )
+    }
+    return (
+        module,
+        tracer,
+        observer,
+        fitness_functions,
+        on_target_covered,
+        code_object_ids,
+    )
+
+
+def test_deinstrument_covered_code_object(mixed):
+    module, tracer, observer, fitness_functions, covered, ids = mixed
+    goals = [
+        fitness_function
+        for fitness_function in fitness_functions
+        if fitness_function.code_object_id == ids["function"]
+    ]
+    for goal in goals[:-1]:
+        covered(goal)
+    observer.after_search_iteration(MagicMock())
+    assert observer.deinstrumented_code_objects == set()
+
+    covered(goals[-1])
+    observer.after_search_iteration(MagicMock())
+    assert observer.deinstrumented_code_objects == {ids["function"]}
+    tracer.init_trace()
+    module.function(6)
+    assert ids["function"] not in tracer.get_trace().executed_code_objects
+
+    observer.after_search_finish()
+    tracer.init_trace()
+    module.function(6)
+    assert ids["function"] in tracer.get_trace().executed_code_objects
+
+
+def test_keep_instrumentation_of_loops(mixed):
+    _, _, observer, fitness_functions, covered, ids = mixed
+    for fitness_function in fitness_functions:
+        covered(fitness_function)
+    observer.after_search_iteration(MagicMock())
+    assert ids["function"] in observer.deinstrumented_code_objects
+    assert ids["generator"] not in observer.deinstrumented_code_objects
+    observer.after_search_finish()
@@ -16,6 +16,7 @@ import pynguin.testcase.defaulttestcase as dtc
 import pynguin.testcase.testfactory as tf
 
 from pynguin.testcase.execution import ExecutionResult
+from pynguin.testcase.execution import ExecutionTrace
 from pynguin.testcase.statement import ConstructorStatement
 from pynguin.testcase.statement import IntPrimitiveStatement
 
@@ -284,6 +285,79 @@ def test_mutate_all(test_case_chromosome, func, rand, result):
                 mock_func.assert_called_once()
 
 
+def test_clone_shares_test_case(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    assert clone._test_case is test_case
+    assert clone == chromosome
+
+    assert clone.test_case is not test_case
+    assert clone.test_case == test_case
+    assert chromosome.test_case is test_case
+
+
+def test_read_only_test_case_is_not_cloned(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    clone = chromosome.clone()
+    assert clone.read_only_test_case is test_case
+    assert clone._test_case_owners.count == 2
+
+
+def test_mutate_clone_keeps_original(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    for _ in range(5):
+        test_case.add_statement(IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_change_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 1.0
+    with mock.patch.object(clone, "_test_factory") as factory_mock:
+        factory_mock.has_call_on_sut.return_value = True
+        factory_mock.delete_statement_gracefully.side_effect = (
+            lambda test, idx: test.remove(idx) is None
+        )
+        with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+            float_mock.side_effect = [0.0] * 6 + [1.0] * 2
+            clone.mutate()
+    assert clone.size() == 0
+    assert test_case.size() == 5
+    assert chromosome._test_case_owners.count == 1
+
+
+def test_mutate_without_change_does_not_clone(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    clone = chromosome.clone()
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_change_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 0.0
+    with mock.patch.object(clone, "_test_factory") as factory_mock:
+        factory_mock.has_call_on_sut.return_value = True
+        clone.mutate()
+    assert clone._test_case is test_case
+    assert clone._test_case_owners.count == 2
+
+
+def test_mutate_restores_shared_backup(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_change_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 1.0
+    with mock.patch.object(clone, "_test_factory") as factory_mock:
+        factory_mock.has_call_on_sut.return_value = False
+        factory_mock.delete_statement_gracefully.side_effect = (
+            lambda test, idx: test.remove(idx) is None
+        )
+        with mock.patch("pynguin.utils.randomness.next_float") as float_mock:
+            float_mock.side_effect = [0.0] * 2 + [1.0] * 3
+            clone.mutate()
+    assert clone._test_case is test_case
+    assert test_case.size() == 1
+    assert clone._test_case_owners.count == 2
+
+
 def test_crossover_wrong_type(test_case_chromosome):
     with pytest.raises(AssertionError):
         test_case_chromosome.cross_over(MagicMock(), 0, 0)
@@ -338,3 +412,43 @@ def test_accept(test_case_chromosome):
     visitor = MagicMock()
     test_case_chromosome.accept(visitor)
     visitor.visit_test_case_chromosome.assert_called_once_with(test_case_chromosome)
+
+
+def test_shed_execution_trace(test_case_chromosome):
+    trace = ExecutionTrace(executed_code_objects={0})
+    result = ExecutionResult()
+    result.execution_trace = trace
+    result.exceptions[0] = ValueError()
+    test_case_chromosome.set_last_execution_result(result)
+    test_case_chromosome.shed_execution_trace()
+    assert test_case_chromosome.execution_trace_shed
+    shed_result = test_case_chromosome.get_last_execution_result()
+    with pytest.raises(RuntimeError):
+        shed_result.execution_trace.executed_code_objects  # noqa: B018
+    with pytest.raises(RuntimeError):
+        shed_result.execution_trace == ExecutionTrace()  # noqa: B015
+    assert shed_result.has_test_exceptions()
+    assert result.execution_trace is trace
+    assert test_case_chromosome.clone().execution_trace_shed
+
+
+def test_shed_execution_trace_without_result(test_case_chromosome):
+    test_case_chromosome.shed_execution_trace()
+    assert not test_case_chromosome.execution_trace_shed
+
+
+def test_set_last_execution_result_restores_trace(test_case_chromosome):
+    test_case_chromosome.set_last_execution_result(ExecutionResult())
+    test_case_chromosome.shed_execution_trace()
+    test_case_chromosome.set_last_execution_result(ExecutionResult())
+    assert not test_case_chromosome.execution_trace_shed
+
+
+def test_eq_with_shed_trace(test_case_chromosome):
+    clone = test_case_chromosome.clone()
+    test_case_chromosome.set_last_execution_result(ExecutionResult())
+    clone.set_last_execution_result(ExecutionResult())
+    assert test_case_chromosome == clone
+    clone.shed_execution_trace()
+    assert test_case_chromosome != clone
+    assert clone == clone  # noqa: PLR0124
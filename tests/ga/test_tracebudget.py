@@ -0,0 +1,82 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from unittest.mock import MagicMock
+
+import pynguin.ga.testcasechromosome as tcc
+import pynguin.ga.testsuitechromosome as tsc
+
+from pynguin.ga.tracebudget import ExecutionTraceBudget
+from pynguin.testcase.execution import ExecutionResult
+from pynguin.testcase.execution import ExecutionTrace
+
+
+def _chromosome(number_of_ids: int) -> tcc.TestCaseChromosome:
+    chromosome = tcc.TestCaseChromosome(MagicMock())
+    result = ExecutionResult()
+    result.execution_trace = ExecutionTrace(
+        executed_code_objects=set(range(number_of_ids))
+    )
+    chromosome.set_last_execution_result(result)
+    chromosome.changed = False
+    return chromosome
+
+
+def _size(chromosome: tcc.TestCaseChromosome) -> int:
+    result = chromosome.get_last_execution_result()
+    assert result is not None
+    return result.execution_trace.approximate_size()
+
+
+def test_enforce_within_budget():
+    chromosomes = [_chromosome(10), _chromosome(20)]
+    budget = ExecutionTraceBudget(sum(map(_size, chromosomes)))
+    assert budget.enforce(chromosomes, []) == 0
+    assert not any(chromosome.execution_trace_shed for chromosome in chromosomes)
+
+
+def test_enforce_sheds_largest_first():
+    small, large = _chromosome(10), _chromosome(10000)
+    budget = ExecutionTraceBudget(_size(small) + 1)
+    saved = budget.enforce([small, large], [])
+    assert large.execution_trace_shed
+    assert not small.execution_trace_shed
+    assert saved == budget.saved_memory > 0
+
+
+def test_enforce_keeps_elite():
+    elite, other = _chromosome(10000), _chromosome(10)
+    budget = ExecutionTraceBudget(0)
+    budget.enforce([elite, other], [elite])
+    assert not elite.execution_trace_shed
+    assert other.execution_trace_shed
+
+
+def test_enforce_keeps_trace_shared_with_elite():
+    elite = _chromosome(10000)
+    clone = elite.clone()
+    ExecutionTraceBudget(0).enforce([clone], [elite])
+    assert not clone.execution_trace_shed
+
+
+def test_enforce_sheds_shared_trace_from_all_holders():
+    chromosome = _chromosome(10000)
+    clone = chromosome.clone()
+    budget = ExecutionTraceBudget(0)
+    saved = budget.enforce([chromosome, clone], [])
+    assert chromosome.execution_trace_shed
+    assert clone.execution_trace_shed
+    assert saved == _size(_chromosome(10000))
+
+
+def test_enforce_sheds_aggregated_trace_of_suite():
+    suite = tsc.TestSuiteChromosome()
+    suite.add_test_case_chromosome(_chromosome(10000))
+    results = [test.get_last_execution_result() for test in suite.test_case_chromosomes]
+    suite.aggregated_trace.update(results)
+    ExecutionTraceBudget(0).enforce([suite], [])
+    assert suite.test_case_chromosomes[0].execution_trace_shed
+    assert suite.aggregated_trace.results == []
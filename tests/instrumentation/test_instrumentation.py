@@ -4,6 +4,7 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import dis
 import importlib
 import os
 import threading
@@ -14,6 +15,7 @@ from unittest.mock import call
 
 import pytest
 
+import pynguin.configuration as config
 import pynguin.utils.opcodes as op
 
 from pynguin.analyses.constants import ConstantPool
@@ -27,10 +29,12 @@ from pynguin.instrumentation.instrumentation import InstrumentationAdapter
 from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.instrumentation.instrumentation import LineCoverageInstrumentation
 from pynguin.instrumentation.instrumentation import PynguinCompare
+from pynguin.instrumentation.machinery import build_transformer
 from pynguin.slicer.executedinstruction import ExecutedControlInstruction
 from pynguin.slicer.executedinstruction import ExecutedMemoryInstruction
 from pynguin.slicer.executedinstruction import ExecutedReturnInstruction
 from pynguin.testcase.execution import ExecutionTracer
+from pynguin.utils.exceptions import InstructionNotFoundException
 from pynguin.utils.orderedset import OrderedSet
 
 
@@ -687,6 +691,26 @@ def test_compare_op_int(dynamic_instr, dummy_module):
     assert dynamic.get_all_constants_for(int) == OrderedSet([11, 10])
 
 
+def test_compare_op_with_checked_instrumentation(dummy_module):
+    constant_pool = ConstantPool()
+    constant_provider = DynamicConstantProvider(
+        pool=constant_pool,
+        delegate=EmptyConstantProvider(),
+        probability=1.0,
+        max_constant_length=50,
+    )
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    transformer = build_transformer(
+        tracer, {config.CoverageMetric.CHECKED}, constant_provider
+    )
+    dummy_module.compare_op_dummy.__code__ = transformer.instrument_module(
+        dummy_module.compare_op_dummy.__code__
+    )
+    assert dummy_module.compare_op_dummy(10, 11) == 1
+    assert constant_pool.get_all_constants_for(int) == OrderedSet([11, 10])
+
+
 def test_compare_op_float(dynamic_instr, dummy_module):
     dynamic, instr = dynamic_instr
     dummy_module.compare_op_dummy.__code__ = instr.instrument_module(
@@ -799,3 +823,48 @@ def test_binary_string_functions(dynamic_instr, func_name, inp1, inp2, tracked,
     assert func(inp1, inp2) == result
     assert dynamic.has_constant_for(str)
     assert dynamic.get_all_constants_for(str) == OrderedSet([tracked])
+
+
+@pytest.fixture()
+def for_loop_meta(simple_module):
+    tracer = ExecutionTracer()
+    transformer = InstrumentationTransformer(tracer, [])
+    transformer.instrument_module(simple_module.for_loop.__code__)
+    return tracer.get_subject_properties().existing_code_objects[0]
+
+
+def test_bytecode_index_basic_blocks(for_loop_meta):
+    bytecode_index = for_loop_meta.bytecode_index
+    for node in for_loop_meta.original_cfg.nodes:
+        if not node.basic_block:
+            with pytest.raises(InstructionNotFoundException):
+                bytecode_index.basic_block(node.index)
+            continue
+        assert bytecode_index.basic_block(node.index) == (
+            node.basic_block,
+            node.offset,
+        )
+        for index in range(len(node.basic_block)):
+            offset = node.offset + 2 * index
+            assert bytecode_index.instruction_index(node.index, offset) == index
+        end_offset = node.offset + 2 * len(node.basic_block)
+        for offset in (node.offset - 2, node.offset + 1, end_offset):
+            with pytest.raises(InstructionNotFoundException):
+                bytecode_index.instruction_index(node.index, offset)
+
+
+def test_bytecode_index_disassembly(for_loop_meta):
+    bytecode_index = for_loop_meta.bytecode_index
+    for dis_instr in dis.get_instructions(for_loop_meta.code_object):
+        assert (
+            bytecode_index.disassembled_instruction(dis_instr.opcode, dis_instr.offset)
+            == dis_instr
+        )
+    with pytest.raises(InstructionNotFoundException):
+        bytecode_index.disassembled_instruction(op.EXTENDED_ARG, 0)
+
+
+def test_bytecode_index_cdg_nodes(for_loop_meta):
+    for node in for_loop_meta.cdg.nodes:
+        assert for_loop_meta.bytecode_index.cdg_node(node.index) is node
+    assert for_loop_meta.bytecode_index.cdg_node(1000) is None
@@ -8,7 +8,13 @@ import asyncio
 import importlib
 import threading
 
+import pytest
+
+import pynguin.configuration as config
+
+from pynguin.instrumentation.machinery import InstrumentationRemover
 from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.instrumentation.machinery import reinstrument
 from pynguin.testcase.execution import ExecutionTracer
 
 
@@ -41,9 +47,167 @@ def test_module_instrumentation_integration():
         assert len(tracer.get_trace().executed_code_objects) == 10
 
 
+def test_profile_instrumentation():
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(
+        "tests.fixtures.instrumentation.mixed",
+        tracer,
+        {
+            config.CoverageMetric.BRANCH,
+            config.CoverageMetric.LINE,
+            config.CoverageMetric.CHECKED,
+        },
+    ):
+        module = importlib.import_module("tests.fixtures.instrumentation.mixed")
+        module = importlib.reload(module)
+    profile = tracer.enable_profiling()
+    assert module.function(6) == 0
+    code_object_id = next(
+        code_object_id
+        for code_object_id, meta in (
+            tracer.get_subject_properties().existing_code_objects.items()
+        )
+        if meta.code_object.co_name == "function"
+    )
+    hooks = {hook for hook, code_object, _, _ in profile.probes()}
+    assert {
+        "executed_code_object",
+        "executed_compare_predicate",
+        "track_line_visit",
+        "track_memory_access",
+    } <= hooks
+    assert all(
+        code_object == code_object_id for _, code_object, _, _ in profile.probes()
+    )
+
+
 async def run_async_generator(gen):
     """Small helper to execute async generator"""
     the_sum = 0
     async for i in gen:
         the_sum += i
     return the_sum
+
+
+def _import_with_cache(tmp_path, coverage_metrics):
+    config.configuration.test_execution.instrumentation_cache_path = str(tmp_path)
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(
+        "tests.fixtures.instrumentation.mixed", tracer, coverage_metrics
+    ):
+        module = importlib.import_module("tests.fixtures.instrumentation.mixed")
+        module = importlib.reload(module)
+        assert module.function(6) == 0
+    return tracer
+
+
+@pytest.mark.parametrize(
+    "coverage_metrics",
+    [
+        {config.CoverageMetric.BRANCH},
+        {config.CoverageMetric.LINE, config.CoverageMetric.CHECKED},
+    ],
+)
+def test_hook_with_instrumentation_cache(tmp_path, coverage_metrics):
+    instrumented = _import_with_cache(tmp_path, coverage_metrics)
+    assert len(list(tmp_path.iterdir())) == 1
+    cached = _import_with_cache(tmp_path, coverage_metrics)
+    properties = cached.get_subject_properties()
+    expected = instrumented.get_subject_properties()
+    assert properties is not expected
+    assert properties.existing_code_objects.keys() == (
+        expected.existing_code_objects.keys()
+    )
+    assert properties.existing_predicates.keys() == (
+        expected.existing_predicates.keys()
+    )
+    assert properties.existing_lines == expected.existing_lines
+    assert properties.branch_less_code_objects == expected.branch_less_code_objects
+    assert cached.get_trace().executed_code_objects == (
+        instrumented.get_trace().executed_code_objects
+    )
+    assert cached.get_trace().covered_line_ids == (
+        instrumented.get_trace().covered_line_ids
+    )
+
+
+def test_hook_with_instrumentation_cache_per_metrics(tmp_path):
+    _import_with_cache(tmp_path, {config.CoverageMetric.BRANCH})
+    _import_with_cache(tmp_path, {config.CoverageMetric.LINE})
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_hook_with_corrupt_instrumentation_cache(tmp_path):
+    _import_with_cache(tmp_path, {config.CoverageMetric.BRANCH})
+    (entry,) = tmp_path.iterdir()
+    entry.write_bytes(b"corrupt")
+    tracer = _import_with_cache(tmp_path, {config.CoverageMetric.BRANCH})
+    assert len(tracer.get_subject_properties().existing_code_objects) > 0
+
+
+def _code_object_id(tracer, name):
+    (code_object_id,) = (
+        code_object_id
+        for code_object_id, meta in (
+            tracer.get_subject_properties().existing_code_objects.items()
+        )
+        if meta.code_object.co_name == name
+    )
+    return code_object_id
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_remove_instrumentation(tmp_path, cached):
+    if cached:
+        _import_with_cache(tmp_path, {config.CoverageMetric.BRANCH})
+    tracer = _import_with_cache(
+        tmp_path if cached else "", {config.CoverageMetric.BRANCH}
+    )
+    mixed = importlib.import_module("tests.fixtures.instrumentation.mixed")
+    outer = _code_object_id(tracer, "method_with_nested")
+    nested = _code_object_id(tracer, "nested")
+    remover = InstrumentationRemover(tracer)
+    assert remover.remove({outer}) == 1
+    tracer.init_trace()
+    assert mixed.TestClass(5).method_with_nested(5) == 0
+    assert outer not in tracer.get_trace().executed_code_objects
+    assert nested in tracer.get_trace().executed_code_objects
+
+    remover.restore()
+    tracer.init_trace()
+    mixed.TestClass(5).method_with_nested(5)
+    assert outer in tracer.get_trace().executed_code_objects
+
+
+def test_remove_instrumentation_of_other_tracer():
+    tracer = _import_with_cache("", {config.CoverageMetric.BRANCH})
+    other = ExecutionTracer()
+    other.subject_properties = tracer.get_subject_properties()
+    function = _code_object_id(tracer, "function")
+    assert InstrumentationRemover(other).remove({function}) == 0
+
+
+def test_reinstrument():
+    tracer = _import_with_cache(
+        "", {config.CoverageMetric.BRANCH, config.CoverageMetric.CHECKED}
+    )
+    mixed = importlib.import_module("tests.fixtures.instrumentation.mixed")
+    import_trace = tracer.import_trace
+    assert import_trace.executed_instructions
+    properties = tracer.get_subject_properties()
+    assert reinstrument(tracer, {config.CoverageMetric.BRANCH}) > 0
+    tracer.init_trace()
+    assert mixed.function(6) == 0
+    trace = tracer.get_trace()
+    assert _code_object_id(tracer, "function") in trace.executed_code_objects
+    assert len(trace.executed_instructions) == len(import_trace.executed_instructions)
+
+    reinstrument(tracer, {config.CoverageMetric.BRANCH, config.CoverageMetric.CHECKED})
+    assert tracer.get_subject_properties().existing_lines == properties.existing_lines
+    tracer.init_trace()
+    assert mixed.function(6) == 0
+    assert len(tracer.get_trace().executed_instructions) > len(
+        import_trace.executed_instructions
+    )
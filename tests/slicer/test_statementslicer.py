@@ -16,6 +16,7 @@ import pytest
 import pynguin.configuration as config
 import pynguin.ga.testcasechromosome as tcc
 import pynguin.ga.testsuitechromosome as tsc
+import pynguin.slicer.statementslicingobserver as sso
 
 from pynguin.analyses.constants import EmptyConstantProvider
 from pynguin.analyses.module import generate_test_cluster
@@ -328,3 +329,104 @@ def test_get_line_id_by_instruction_throws_error():
         DynamicSlicer.get_line_id_by_instruction(
             instruction_mock, subject_properties_mock
         )
+
+
+class _RecordingSlicingObserver(StatementSlicingObserver):
+    def after_test_case_execution_inside_thread(self, test_case, result):
+        self.slicing_criteria = dict(self._slicing_local_state.slicing_criteria)
+        super().after_test_case_execution_inside_thread(test_case, result)
+
+
+def _instruction_keys(dynamic_slice):
+    return [
+        (instr.name, instr.code_object_id, instr.node_id, instr.offset)
+        for instr in dynamic_slice
+    ]
+
+
+def test_slice_all_equals_single_slices(setter_getter_test):
+    module_name = "tests.fixtures.linecoverage.setter_getter"
+    config.configuration.statistics_output.coverage_metrics = [
+        config.CoverageMetric.CHECKED,
+    ]
+
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = TestCaseExecutor(tracer)
+        observer = _RecordingSlicingObserver(tracer)
+        executor.add_observer(observer)
+        trace = executor.execute(setter_getter_test).execution_trace
+
+    criteria = [
+        observer.slicing_criteria[position]
+        for position in sorted(observer.slicing_criteria)
+    ]
+    assert len(criteria) == 4
+    slicer = DynamicSlicer(tracer.get_subject_properties().existing_code_objects)
+    expected = [
+        _instruction_keys(slicer.slice(trace, criterion)) for criterion in criteria
+    ]
+    assert [
+        _instruction_keys(dynamic_slice)
+        for dynamic_slice in slicer.slice_all(trace, criteria)
+    ] == expected
+    assert [
+        _instruction_keys(dynamic_slice)
+        for dynamic_slice in slicer.slice_all(trace, criteria[::-1])
+    ] == expected[::-1]
+
+
+def test_slicing_timeout_leaves_lines_unchecked(plus_three_test):
+    module_name = "tests.fixtures.linecoverage.plus"
+    config.configuration.statistics_output.coverage_metrics = [
+        config.CoverageMetric.CHECKED,
+    ]
+    config.configuration.stopping.maximum_slicing_time = 0
+
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = TestCaseExecutor(tracer)
+        executor.add_observer(StatementSlicingObserver(tracer))
+        result = executor.execute(plus_three_test)
+
+    assert not result.execution_trace.checked_lines
+
+
+def test_slicing_outside_executing_thread(plus_three_test, monkeypatch):
+    module_name = "tests.fixtures.linecoverage.plus"
+    config.configuration.statistics_output.coverage_metrics = [
+        config.CoverageMetric.CHECKED,
+    ]
+    compute_checked_lines = sso.compute_criteria_checked_lines
+    slicing_threads = []
+
+    def record_thread(*args):
+        slicing_threads.append(threading.current_thread())
+        return compute_checked_lines(*args)
+
+    monkeypatch.setattr(sso, "compute_criteria_checked_lines", record_thread)
+
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = TestCaseExecutor(tracer)
+        executor.add_observer(StatementSlicingObserver(tracer))
+        result = executor.execute(plus_three_test)
+
+    assert slicing_threads == [threading.current_thread()]
+    assert result.execution_trace.checked_lines
+    assert not result.statement_slicing_criteria
@@ -4,6 +4,9 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import json
+import threading
+
 from pathlib import Path
 from unittest import mock
 from unittest.mock import MagicMock
@@ -15,6 +18,7 @@ import pynguin.ga.computations as ff
 import pynguin.ga.postprocess as pp
 import pynguin.generator as gen
 
+from pynguin.testcase.execution import ExecutionTracer
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
@@ -139,6 +143,69 @@ def test__track_one_coverage_while_optimising_for_other(
     assert [type(elem[1]) for elem in to_calculate] == added
 
 
+@pytest.mark.parametrize(
+    "optimize,track,instrumented",
+    [
+        (
+            [config.CoverageMetric.BRANCH],
+            [RuntimeVariable.FinalLineCoverage],
+            {config.CoverageMetric.BRANCH, config.CoverageMetric.LINE},
+        ),
+        (
+            [config.CoverageMetric.LINE],
+            [RuntimeVariable.AssertionCheckedCoverage],
+            {config.CoverageMetric.LINE, config.CoverageMetric.CHECKED},
+        ),
+        ([config.CoverageMetric.BRANCH], [], {config.CoverageMetric.BRANCH}),
+    ],
+)
+def test__get_instrumented_coverage_metrics(optimize, track, instrumented):
+    config.configuration.statistics_output.coverage_metrics = optimize
+    config.configuration.statistics_output.output_variables = track
+    assert gen._get_instrumented_coverage_metrics() == instrumented
+
+
+@pytest.mark.parametrize(
+    "optimize,track,instrumented",
+    [
+        (
+            [config.CoverageMetric.BRANCH],
+            [RuntimeVariable.FinalLineCoverage],
+            {config.CoverageMetric.BRANCH, config.CoverageMetric.LINE},
+        ),
+        (
+            [config.CoverageMetric.LINE],
+            [RuntimeVariable.AssertionCheckedCoverage],
+            {config.CoverageMetric.LINE},
+        ),
+        (
+            [config.CoverageMetric.CHECKED],
+            [RuntimeVariable.AssertionCheckedCoverage],
+            {config.CoverageMetric.CHECKED},
+        ),
+    ],
+)
+def test__get_search_instrumented_coverage_metrics(optimize, track, instrumented):
+    config.configuration.statistics_output.coverage_metrics = optimize
+    config.configuration.statistics_output.output_variables = track
+    assert gen._get_search_instrumented_coverage_metrics() == instrumented
+
+
+def test__track_instrumentation_profile():
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    tracer.register_code_object(MagicMock())
+    tracer.enable_profiling()
+    tracer.executed_code_object(0)
+    with mock.patch.object(gen.stat, "track_output_variable") as track_mock:
+        gen._track_execution_statistics(MagicMock(tracer=tracer))
+    tracked = {call.args[0]: call.args[1] for call in track_mock.call_args_list}
+    assert tracked[RuntimeVariable.InstrumentationHookCalls] == 1
+    assert json.loads(tracked[RuntimeVariable.InstrumentationProfile]).keys() == {
+        "executed_code_object"
+    }
+
+
 def test__reset_cache_for_result():
     test_case = MagicMock()
     result = MagicMock(test_case_chromosomes=[test_case])
@@ -0,0 +1,63 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import ast
+
+import pytest
+
+import pynguin.testcase.execution as ex
+
+
+@pytest.fixture
+def code():
+    return compile("int_0 = 42", "<ast>", "exec")
+
+
+def test_key_for_equal_nodes():
+    first = ast.parse("int_0 = 42")
+    second = ast.parse("int_0 = 42")
+    assert ex.CompiledCodeCache.key_for(first) == ex.CompiledCodeCache.key_for(second)
+
+
+def test_key_for_different_nodes():
+    first = ast.parse("int_0 = 42")
+    second = ast.parse("int_0 = 43")
+    assert ex.CompiledCodeCache.key_for(first) != ex.CompiledCodeCache.key_for(second)
+
+
+def test_get_counts_hits_and_misses(code):
+    cache = ex.CompiledCodeCache()
+    assert cache.get("foo") is None
+    cache.put("foo", code, 3)
+    assert cache.get("foo") == (code, 3)
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_put_evicts_least_recently_used(code):
+    cache = ex.CompiledCodeCache(maxsize=2)
+    cache.put("foo", code)
+    cache.put("bar", code)
+    cache.get("foo")
+    cache.put("baz", code)
+    assert len(cache) == 2
+    assert cache.get("bar") is None
+    assert cache.get("foo") is not None
+
+
+def test_put_disabled(code):
+    cache = ex.CompiledCodeCache(maxsize=0)
+    cache.put("foo", code)
+    assert len(cache) == 0
+
+
+def test_clear(code):
+    cache = ex.CompiledCodeCache()
+    cache.put("foo", code)
+    cache.get("foo")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 1
@@ -4,8 +4,17 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import pickle
 
+import pynguin.utils.opcodes as op
+
+from pynguin.slicer.executedinstruction import ExecutedAttributeInstruction
+from pynguin.slicer.executedinstruction import ExecutedCallInstruction
+from pynguin.slicer.executedinstruction import ExecutedControlInstruction
 from pynguin.slicer.executedinstruction import ExecutedInstruction
+from pynguin.slicer.executedinstruction import ExecutedInstructionLog
+from pynguin.slicer.executedinstruction import ExecutedMemoryInstruction
+from pynguin.slicer.executedinstruction import ExecutedReturnInstruction
 
 
 def test_instruction_equal():
@@ -24,3 +33,91 @@ def test_instruction_equal():
     )
 
     assert instr1 == instr2
+
+
+def _instructions() -> list[ExecutedInstruction]:
+    return [
+        ExecutedInstruction("foo", 0, 1, op.NOP, None, None, 0),
+        ExecutedMemoryInstruction(
+            "foo", 0, 1, op.LOAD_FAST, "bar", 3, 2, 1234, True, False
+        ),
+        ExecutedAttributeInstruction(
+            "foo", 1, 0, op.LOAD_ATTR, "baz", 4, 4, 42, None, False
+        ),
+        ExecutedControlInstruction("bar", 1, 0, op.POP_JUMP_IF_TRUE, 2, 5, 6),
+        ExecutedCallInstruction("bar", 1, 2, op.CALL_FUNCTION, 1, 6, 8),
+        ExecutedReturnInstruction("bar", 1, 2, op.RETURN_VALUE, None, 7, 10),
+    ]
+
+
+def test_log_add():
+    log = ExecutedInstructionLog()
+    log.add(
+        ExecutedMemoryInstruction,
+        "foo",
+        0,
+        1,
+        op.LOAD_FAST,
+        "bar",
+        3,
+        2,
+        arg_address=1234,
+        is_mutable_type=True,
+    )
+    assert log == [_instructions()[1]]
+
+
+def test_log_get_item():
+    instructions = _instructions()
+    log = ExecutedInstructionLog(instructions)
+    assert len(log) == len(instructions)
+    assert log[-1] == instructions[-1]
+    assert log[1:3] == instructions[1:3]
+    assert list(log) == instructions
+    for position, instruction in enumerate(instructions):
+        assert type(log[position]) is type(instruction)
+
+
+def test_log_accessors():
+    log = ExecutedInstructionLog(_instructions())
+    assert log.file(3) == "bar"
+    assert log.code_object_id(3) == 1
+    assert log.node_id(4) == 2
+    assert log.opcode(1) == op.LOAD_FAST
+    assert log.argument(2) == "baz"
+    assert log.lineno(0) is None
+    assert log.lineno(3) == 5
+    assert log.offset(5) == 10
+    assert log.is_jump(3)
+    assert not log.is_jump(4)
+
+
+def test_log_rindex_opcode():
+    log = ExecutedInstructionLog(_instructions() * 2)
+    assert log.rindex_opcode(op.POP_JUMP_IF_TRUE) == 9
+    assert log.rindex_opcode(op.STORE_FAST) == -1
+
+
+def test_log_extend_translates_interned_values():
+    instructions = _instructions()
+    log = ExecutedInstructionLog(instructions[3:])
+    other = ExecutedInstructionLog(instructions[:3])
+    log.extend(other)
+    log.extend(log)
+    assert log == instructions[3:] + instructions[:3] + instructions[3:] + (
+        instructions[:3]
+    )
+    assert other == instructions[:3]
+
+
+def test_log_copy():
+    log = ExecutedInstructionLog(_instructions())
+    copied = log.copy()
+    copied.append(_instructions()[0])
+    assert len(log) == len(copied) - 1
+    assert copied[:-1] == log
+
+
+def test_log_pickle():
+    log = ExecutedInstructionLog(_instructions())
+    assert pickle.loads(pickle.dumps(log)) == log  # noqa: S301
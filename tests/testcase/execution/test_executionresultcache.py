@@ -0,0 +1,90 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import pynguin.testcase.execution as ex
+
+
+def _result(exception: BaseException | None = None) -> ex.ExecutionResult:
+    result = ex.ExecutionResult()
+    if exception is not None:
+        result.report_new_thrown_exception(1, exception)
+    return result
+
+
+def test_result_served_after_verification(short_test_case):
+    cache = ex.ExecutionResultCache()
+    cache.put(short_test_case, (), _result())
+    assert cache.get(short_test_case, ()) is None
+    cache.put(short_test_case, (), _result())
+    assert cache.get(short_test_case.clone(), ()) is not None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_result_is_copied(short_test_case):
+    cache = ex.ExecutionResultCache()
+    cache.put(short_test_case, (), _result(ValueError()))
+    cache.put(short_test_case, (), _result(ValueError()))
+    first = cache.get(short_test_case, ())
+    first.delete_statement_data({0})
+    second = cache.get(short_test_case, ())
+    assert first is not second
+    assert list(second.exceptions) == [1]
+
+
+def test_result_of_other_context_not_served(short_test_case):
+    cache = ex.ExecutionResultCache()
+    observer = object()
+    cache.put(short_test_case, (observer,), _result())
+    cache.put(short_test_case, (observer,), _result())
+    assert cache.get(short_test_case, (object(),)) is None
+
+
+def test_timeout_not_cached(short_test_case):
+    cache = ex.ExecutionResultCache()
+    cache.put(short_test_case, (), ex.ExecutionResult(timeout=True))
+    assert len(cache) == 0
+
+
+def test_nondeterministic_not_cached(short_test_case):
+    cache = ex.ExecutionResultCache()
+    cache.put(short_test_case, (), _result())
+    cache.put(short_test_case, (), _result(ValueError()))
+    cache.put(short_test_case, (), _result())
+    cache.put(short_test_case, (), _result())
+    assert len(cache) == 0
+    assert cache.get(short_test_case, ()) is None
+
+
+def test_least_recently_used_evicted(short_test_case):
+    cache = ex.ExecutionResultCache(budget=_result().execution_trace.approximate_size())
+    other = short_test_case.clone()
+    other.remove(1)
+    cache.put(short_test_case, (), _result())
+    cache.put(other, (), _result())
+    assert len(cache) == 1
+    cache.put(short_test_case, (), _result())
+    assert cache.get(short_test_case, ()) is None
+
+
+def test_size_tracks_cached_results(short_test_case):
+    cache = ex.ExecutionResultCache()
+    other = short_test_case.clone()
+    other.remove(1)
+    cache.put(short_test_case, (), _result())
+    cache.put(other, (), _result())
+    assert cache.size == 2 * _result().execution_trace.approximate_size()
+    cache.put(other, (), ex.ExecutionResult(timeout=True))
+    assert cache.size == _result().execution_trace.approximate_size()
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_result_larger_than_budget_not_cached(short_test_case):
+    cache = ex.ExecutionResultCache(budget=1)
+    cache.put(short_test_case, (), _result())
+    assert len(cache) == 0
+    assert cache.size == 0
@@ -4,11 +4,19 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+from math import inf
 from unittest.mock import MagicMock
 
+import pytest
+
 from pynguin.slicer.executedinstruction import ExecutedInstruction
+from pynguin.testcase.execution import AggregatedExecutionTrace
 from pynguin.testcase.execution import ExecutedAssertion
+from pynguin.testcase.execution import ExecutionResult
 from pynguin.testcase.execution import ExecutionTrace
+from pynguin.utils.compactcollections import DenseCountMapping
+from pynguin.utils.compactcollections import DenseSet
+from pynguin.utils.orderedset import OrderedSet
 
 
 def test_merge():
@@ -78,7 +86,94 @@ def test_merge_full():
 
 
 def test_merge_min():
-    dict0 = {0: 0.5, 1: 0.2}
-    dict1 = {0: 0.3, 1: 0.6}
-    ExecutionTrace._merge_min(dict0, dict1)
-    assert dict0 == {0: 0.3, 1: 0.2}
+    trace0 = ExecutionTrace(true_distances={0: 0.5, 1: 0.2})
+    trace1 = ExecutionTrace(true_distances={0: 0.3, 1: 0.6, 2: 1.0})
+    trace0.merge(trace1)
+    assert trace0.true_distances == {0: 0.3, 1: 0.2, 2: 1.0}
+
+
+def test_trace_uses_compact_containers():
+    trace = ExecutionTrace(
+        executed_code_objects=OrderedSet([1, 0]), executed_predicates={3: 2}
+    )
+    assert isinstance(trace.executed_code_objects, DenseSet)
+    assert isinstance(trace.executed_predicates, DenseCountMapping)
+    assert trace.executed_code_objects == OrderedSet([0, 1])
+    assert trace.executed_predicates == {3: 2}
+
+
+def test_update_predicate_distances():
+    trace = ExecutionTrace()
+    trace.update_predicate_distances(1.0, 0.0, 2)
+    trace.update_predicate_distances(0.5, inf, 2)
+    assert trace.executed_predicates == {2: 2}
+    assert trace.true_distances == {2: 0.5}
+    assert trace.false_distances == {2: 0.0}
+
+
+def _result(code_object, predicate, true_distance, line):
+    result = ExecutionResult()
+    result.execution_trace.executed_code_objects.add(code_object)
+    result.execution_trace.update_predicate_distances(
+        true_distance, 1.0 - true_distance, predicate
+    )
+    result.execution_trace.covered_line_ids.add(line)
+    result.execution_trace.add_instruction("foo", code_object, 0, 1, line, 2)
+    result.execution_trace.executed_assertions.append(
+        ExecutedAssertion(code_object, 0, 0, MagicMock())
+    )
+    return result
+
+
+def _merged(results):
+    merged = ExecutionTrace()
+    for result in results:
+        merged.merge(result.execution_trace)
+    return merged
+
+
+@pytest.fixture
+def results():
+    return [
+        _result(0, 0, 0.0, 1),
+        _result(1, 0, 0.5, 2),
+        _result(1, 1, 0.2, 3),
+        _result(2, 3, 0.7, 1),
+    ]
+
+
+def test_aggregated_trace_append(results):
+    aggregated = AggregatedExecutionTrace()
+    assert aggregated.update(results[:2]) == _merged(results[:2])
+    assert aggregated.update(results) == _merged(results)
+
+
+def test_aggregated_trace_unchanged(results):
+    aggregated = AggregatedExecutionTrace()
+    assert aggregated.update(results) is aggregated.update(list(results))
+
+
+@pytest.mark.parametrize(
+    "indices",
+    [
+        pytest.param([1, 2, 3], id="remove first"),
+        pytest.param([0, 2, 3], id="remove minimum holder"),
+        pytest.param([3, 2, 1, 0], id="reorder"),
+        pytest.param([0, 0, 2], id="duplicate"),
+        pytest.param([], id="empty"),
+    ],
+)
+def test_aggregated_trace_replace(results, indices):
+    aggregated = AggregatedExecutionTrace()
+    aggregated.update(results)
+    selected = [results[index] for index in indices]
+    assert aggregated.update(selected) == _merged(selected)
+    assert aggregated.update(results) == _merged(results)
+
+
+def test_aggregated_trace_clone(results):
+    aggregated = AggregatedExecutionTrace()
+    aggregated.update(results)
+    cloned = aggregated.clone()
+    assert cloned.update(results[:1]) == _merged(results[:1])
+    assert aggregated.update(results) == _merged(results)
@@ -12,6 +12,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import pynguin.configuration as config
 import pynguin.utils.typetracing as tt
 
 from pynguin.instrumentation.instrumentation import CodeObjectMetaData
@@ -62,6 +63,64 @@ def test_line_visit():
     assert tracer.get_trace().covered_line_ids == OrderedSet([42, 43])
 
 
+def test_switch_traced_coverage_metrics():
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    tracer.register_code_object(MagicMock())
+    assert tracer.traced_coverage_metrics == set(config.CoverageMetric)
+    tracer.set_traced_coverage_metrics([config.CoverageMetric.BRANCH])
+    assert tracer.traced_coverage_metrics == {config.CoverageMetric.BRANCH}
+    tracer.track_line_visit(42)
+    tracer.executed_code_object(0)
+    assert tracer.get_trace().covered_line_ids == OrderedSet()
+    assert tracer.get_trace().executed_code_objects == {0}
+    tracer.set_traced_coverage_metrics([config.CoverageMetric.LINE])
+    tracer.track_line_visit(42)
+    assert tracer.get_trace().covered_line_ids == OrderedSet([42])
+
+
+def test_profile_hooks():
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    tracer.register_code_object(MagicMock())
+    tracer.register_code_object(MagicMock())
+    tracer.register_predicate(MagicMock(code_object_id=1))
+    tracer.register_line(1, "foo.py", 42)
+    assert tracer.profile is None
+    profile = tracer.enable_profiling()
+    assert tracer.enable_profiling() is profile
+    tracer.executed_code_object(0)
+    tracer.executed_code_object(1)
+    tracer.executed_compare_predicate(1, 0, 0, PynguinCompare.EQ)
+    tracer.executed_bool_predicate(True, 0)
+    tracer.track_line_visit(0)
+    tracer.track_line_visit(0)
+    assert tracer.get_trace().executed_predicates == {0: 2}
+    assert {
+        hook: {code_object_id: calls for code_object_id, (calls, _) in calls.items()}
+        for hook, calls in profile.to_dict().items()
+    } == {
+        "executed_code_object": {0: 1, 1: 1},
+        "executed_compare_predicate": {1: 1},
+        "executed_bool_predicate": {1: 1},
+        "track_line_visit": {1: 2},
+    }
+    assert profile.total_calls == 6
+    assert profile.total_time_ns == sum(probe[3] for probe in profile.probes())
+    profile.reset()
+    assert profile.total_calls == 0
+
+
+def test_profile_hooks_killed_thread():
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident + 1
+    tracer.register_code_object(MagicMock())
+    profile = tracer.enable_profiling()
+    with pytest.raises(RuntimeError):
+        tracer.executed_code_object(0)
+    assert profile.total_calls == 1
+
+
 def test_update_metrics_covered():
     tracer = ExecutionTracer()
     tracer.current_thread_identifier = threading.current_thread().ident
@@ -398,8 +457,35 @@ def test_compare_predicate_executed_other_thread():
         (ExecutionTracer.track_line_visit.__name__, (None,)),
     ],
 )
-def test_killed_by_thread_guard(method, inputs):
+@pytest.mark.parametrize("traced", [True, False])
+def test_killed_by_thread_guard(method, inputs, traced):
     tracer = ExecutionTracer()
     tracer.current_thread_identifier = threading.current_thread().ident + 1
+    if not traced:
+        tracer.set_traced_coverage_metrics([])
     with pytest.raises(RuntimeError):
         getattr(tracer, method)(*inputs)
+
+
+def test_killed_after_new_generation():
+    tracer = ExecutionTracer()
+    tracer.register_code_object(MagicMock())
+    assert not tracer.is_current_thread()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    assert tracer.is_current_thread()
+    errors = []
+
+    def execute():
+        tracer.current_thread_identifier = threading.current_thread().ident
+        try:
+            tracer.executed_code_object(0)
+        except RuntimeError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=execute)
+    thread.start()
+    thread.join()
+    assert errors == []
+    assert not tracer.is_current_thread()
+    with pytest.raises(RuntimeError):
+        tracer.executed_code_object(0)
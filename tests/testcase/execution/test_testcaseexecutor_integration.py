@@ -7,25 +7,48 @@
 """Integration tests for the executor."""
 import ast
 import importlib
+import os
 import threading
 
+from queue import Queue
 from unittest.mock import MagicMock
 
 import pytest
 
 import pynguin.configuration as config
+import pynguin.testcase.execution as execution
 
 from pynguin.analyses.constants import EmptyConstantProvider
 from pynguin.analyses.module import generate_test_cluster
 from pynguin.analyses.seeding import AstToTestCaseTransformer
+from pynguin.ga.stoppingcondition import MaxStatementExecutionsStoppingCondition
+from pynguin.ga.stoppingcondition import MaxTestExecutionsStoppingCondition
 from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.testcase.execution import ExecutionResultCache
 from pynguin.testcase.execution import ExecutionTracer
 from pynguin.testcase.execution import ModuleProvider
+from pynguin.testcase.execution import ParallelTestCaseExecutor
+from pynguin.testcase.execution import PrefixSnapshotTestCaseExecutor
+from pynguin.testcase.execution import ReturnTypeObserver
 from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.testcase.execution import _ExecutionWorker
 from pynguin.testcase.statement import IntPrimitiveStatement
 from pynguin.testcase.statement import MethodStatement
 
 
+@pytest.fixture
+def accessible_tracer():
+    # The SUT of the short test case has to be instrumented with the tracer of the
+    # test, otherwise its code refers to the tracer of a previous test.
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+    return tracer
+
+
 def test_simple_execution(default_test_case):
     config.configuration.module_name = "tests.fixtures.accessibles.accessible"
     tracer = ExecutionTracer()
@@ -144,3 +167,360 @@ def test_killing_endless_loop():
             if "_execute_test_case" in thread.name:
                 thread.join()
         assert len(threading.enumerate()) == 1  # Only main thread should be alive.
+
+
+def test_worker_thread_is_reused(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.execute(short_test_case)
+    worker = executor._worker
+    executor.execute(short_test_case)
+    assert executor._worker is worker
+    assert worker.thread.is_alive()
+
+
+def test_worker_thread_replaced_after_timeout(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer, maximum_test_execution_timeout=0)
+    assert executor.execute(short_test_case).timeout
+    assert executor._worker is None
+
+
+def test_idle_worker_thread_terminates(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor._WORKER_IDLE_TIMEOUT = 0.01
+    executor.execute(short_test_case)
+    worker = executor._worker
+    worker.thread.join()
+    assert not worker.submit([short_test_case])
+    assert not executor.execute(short_test_case).timeout
+    assert executor._worker is not worker
+
+
+def test_abandoned_worker_drops_taken_test_case(short_test_case, monkeypatch):
+    executed = []
+    claimed = []
+    workers = []
+
+    class AbandoningQueue(Queue):
+        def get(self, block=True, timeout=None):
+            test_case = super().get(block, timeout)
+            if test_case is not None:
+                # The worker is abandoned right after it took the test case.
+                workers[0].abandon()
+            return test_case
+
+    monkeypatch.setattr(execution, "Queue", AbandoningQueue)
+    worker = _ExecutionWorker(
+        lambda test_case, results: executed.append(test_case),
+        idle_timeout=5,
+        claim=lambda: claimed.append(None),
+    )
+    workers.append(worker)
+    worker.submit([short_test_case])
+    worker.thread.join()
+    assert executed == []
+    assert claimed == []
+
+
+def test_observer_thread_local_state_is_reset(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.add_observer(ReturnTypeObserver(MagicMock()))
+    executor.execute(short_test_case)
+    short_test_case.remove(1)
+    result = executor.execute(short_test_case)
+    assert list(result.raw_return_types) == [0]
+
+
+def test_parallel_execution(short_test_case, accessible_tracer):
+    tracer = accessible_tracer
+    executor = ParallelTestCaseExecutor(tracer, number_of_processes=2)
+    failing = short_test_case.clone()
+    failing.remove(0)
+    observer = MagicMock()
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    executor.add_observer(observer)
+    results = executor.execute_many([short_test_case, failing, short_test_case])
+    assert [result.has_test_exceptions() for result in results] == [
+        False,
+        True,
+        False,
+    ]
+    assert observer.after_test_case_execution_outside_thread.call_count == 3
+
+
+def test_parallel_execution_kills_endless_loop():
+    config.configuration.module_name = "tests.fixtures.examples.loop"
+    module_name = config.configuration.module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = ParallelTestCaseExecutor(
+            tracer, maximum_test_execution_timeout=1, number_of_processes=2
+        )
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(
+            ast.parse(
+                """def test_case_0():
+    anything = module_0.loop_with_condition()
+"""
+            )
+        )
+        test_case = transformer.testcases[0]
+        results = executor.execute_many([test_case, test_case])
+        assert all(result.timeout for result in results)
+
+
+@pytest.mark.parametrize(
+    "fail", [threading.Event().wait, lambda: os._exit(1)], ids=["hang", "crash"]
+)
+def test_parallel_execution_reruns_remaining_test_cases(
+    short_test_case, accessible_tracer, fail
+):
+    executor = ParallelTestCaseExecutor(
+        accessible_tracer, maximum_test_execution_timeout=1, number_of_processes=2
+    )
+    broken = short_test_case.clone()
+    execute_in_worker = executor._execute_in_worker
+
+    def hang_or_crash(test_cases):
+        if test_cases[0] is broken:
+            fail()
+        return execute_in_worker(test_cases)
+
+    executor._execute_in_worker = hang_or_crash
+    # The first worker process fails before executing the third test case.
+    results = executor.execute_many(
+        [broken, short_test_case, short_test_case, short_test_case]
+    )
+    assert [result.timeout for result in results] == [True, False, False, False]
+    assert not results[2].has_test_exceptions()
+
+
+def test_parallel_execution_counts_executions(short_test_case, accessible_tracer):
+    failing = short_test_case.clone()
+    failing.remove(0)
+    test_cases = [short_test_case, failing, short_test_case]
+    counts = []
+    for executor in (
+        TestCaseExecutor(accessible_tracer),
+        ParallelTestCaseExecutor(accessible_tracer, number_of_processes=2),
+    ):
+        test_executions = MaxTestExecutionsStoppingCondition(100)
+        statement_executions = MaxStatementExecutionsStoppingCondition(100)
+        executor.add_observer(test_executions)
+        executor.add_observer(statement_executions)
+        executor.execute_many(test_cases)
+        counts.append(
+            (test_executions.current_value(), statement_executions.current_value())
+        )
+    assert counts[0] == counts[1] == (3, 5)
+
+
+def test_execute_many(short_test_case, accessible_tracer):
+    tracer = accessible_tracer
+    executor = TestCaseExecutor(tracer)
+    failing = short_test_case.clone()
+    failing.remove(0)
+    observer = MagicMock()
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    executor.add_observer(observer)
+    results = executor.execute_many([failing, short_test_case, failing])
+    assert [result.has_test_exceptions() for result in results] == [
+        True,
+        False,
+        True,
+    ]
+    assert observer.before_test_case_execution.call_count == 3
+    assert observer.after_test_case_execution_outside_thread.call_count == 3
+
+
+@pytest.mark.parametrize("rewrites_statements", [True, False])
+def test_compiled_and_statementwise_execution(
+    short_test_case, rewrites_statements, accessible_tracer
+):
+    tracer = accessible_tracer
+    executor = TestCaseExecutor(tracer)
+    failing = short_test_case.clone()
+    failing.remove(0)
+    failing.add_statement(IntPrimitiveStatement(failing, 3), 0)
+    observer = MagicMock(rewrites_statements=rewrites_statements)
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    executor.add_observer(observer)
+    result = executor.execute(failing)
+    assert result.get_first_position_of_thrown_exception() == 1
+    assert observer.before_statement_execution.call_count == 2
+    assert observer.after_statement_execution.call_count == 2
+    assert observer.after_statement_execution.call_args.args[3] is (
+        result.exceptions[1]
+    )
+
+
+def test_instrumented_code_is_reused(short_test_case):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    config.configuration.statistics_output.coverage_metrics = [
+        config.CoverageMetric.CHECKED
+    ]
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = TestCaseExecutor(tracer)
+        first = executor.execute(short_test_case)
+        code_objects = len(tracer.get_subject_properties().existing_code_objects)
+        second = executor.execute(short_test_case)
+        assert (
+            len(tracer.get_subject_properties().existing_code_objects) == code_objects
+        )
+        assert executor.code_cache.hits == 2
+        assert executor.code_cache.misses == 2
+        assert len(second.execution_trace.executed_instructions) == len(
+            first.execution_trace.executed_instructions
+        )
+
+
+def test_uninstrumented_code_is_not_cached(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    observer = MagicMock(rewrites_statements=True)
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    executor.add_observer(observer)
+    executor.execute(short_test_case)
+    assert executor.code_cache.hits == executor.code_cache.misses == 0
+    assert executor.last_code_object_id is None
+
+
+def test_result_cache(short_test_case, accessible_tracer):
+    tracer = accessible_tracer
+    executor = TestCaseExecutor(tracer)
+    executor.set_result_cache(ExecutionResultCache())
+    observer = MagicMock()
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    executor.add_observer(observer)
+    executor.execute_many([short_test_case, short_test_case.clone()])
+    result = executor.execute(short_test_case.clone())
+    assert not result.has_test_exceptions()
+    assert executor.result_cache.hits == 1
+    assert observer.before_test_case_execution.call_count == 2
+    assert observer.after_test_case_execution_outside_thread.call_count == 3
+
+
+def test_result_cache_stores_results_completed_outside_thread(
+    short_test_case, accessible_tracer
+):
+    executor = TestCaseExecutor(accessible_tracer)
+    executor.set_result_cache(ExecutionResultCache())
+    observer = MagicMock()
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    observer.after_test_case_execution_outside_thread.side_effect = (
+        lambda test_case, result: result.execution_trace.checked_lines.add(42)
+    )
+    executor.add_observer(observer)
+    results = [executor.execute(short_test_case.clone()) for _ in range(3)]
+    assert executor.result_cache.hits == 1
+    assert results[2].execution_trace.checked_lines == {42}
+
+
+@pytest.fixture
+def snapshot_executor(accessible_tracer):
+    executor = PrefixSnapshotTestCaseExecutor(
+        accessible_tracer, number_of_snapshots=2, snapshot_interval=0
+    )
+    yield executor
+    executor.clear_snapshots()
+
+
+def test_prefix_snapshot_execution(short_test_case, method_mock, snapshot_executor):
+    observer = ReturnTypeObserver(MagicMock())
+    snapshot_executor.add_observer(observer)
+    # Accessible objects of the test cluster can be sent to the snapshot.
+    short_test_case.test_cluster.add_modifier(method_mock.owner, method_mock)
+    snapshot_executor.execute(short_test_case)
+    offspring = short_test_case.clone()
+    int_stmt = IntPrimitiveStatement(offspring, 3)
+    offspring.add_statement(int_stmt)
+    offspring.add_statement(
+        MethodStatement(
+            offspring,
+            method_mock,
+            offspring.statements[1].ret_val,
+            {"x": int_stmt.ret_val},
+        )
+    )
+    plain_executor = TestCaseExecutor(snapshot_executor.tracer)
+    plain_executor.add_observer(observer)
+    expected = plain_executor.execute(offspring)
+    result = snapshot_executor.execute(offspring)
+    assert snapshot_executor.resumed_executions == 1
+    assert not result.has_test_exceptions()
+    assert result.raw_return_types == expected.raw_return_types
+    assert (
+        result.execution_trace.executed_code_objects
+        == expected.execution_trace.executed_code_objects
+    )
+
+
+def test_prefix_snapshot_execution_reports_exceptions(
+    short_test_case, method_mock, snapshot_executor
+):
+    short_test_case.test_cluster.add_modifier(method_mock.owner, method_mock)
+    snapshot_executor.execute(short_test_case)
+    offspring = short_test_case.clone()
+    offspring.add_statement(
+        MethodStatement(
+            offspring,
+            method_mock,
+            offspring.statements[1].ret_val,
+            {"x": offspring.statements[1].ret_val},
+        )
+    )
+    result = snapshot_executor.execute(offspring)
+    assert snapshot_executor.resumed_executions == 1
+    assert result.get_first_position_of_thrown_exception() == 2
+    assert offspring.statements[2] is not None
+
+
+def test_prefix_snapshots_are_bounded(short_test_case, snapshot_executor):
+    for value in range(4):
+        test_case = short_test_case.clone()
+        test_case.statements[0].value = value
+        snapshot_executor.execute(test_case)
+    assert len(snapshot_executor._snapshots) == 2
+    snapshot_executor.set_number_of_snapshots(0)
+    assert not snapshot_executor._snapshots
+    snapshot_executor.execute(short_test_case)
+    assert not snapshot_executor._snapshots
+
+
+def test_prefix_snapshots_release_pinned_objects(short_test_case, snapshot_executor):
+    snapshot_executor.execute(short_test_case)
+    assert len(snapshot_executor._pinned) > 0
+    snapshot_executor.clear_snapshots()
+    assert len(snapshot_executor._pinned) == 0
+    snapshot_executor.execute(short_test_case)
+    snapshot_executor.execute(short_test_case)
+    assert snapshot_executor.resumed_executions == 1
+
+
+def test_no_prefix_snapshots_with_unsupported_observer(
+    short_test_case, snapshot_executor
+):
+    observer = MagicMock(supports_prefix_snapshots=False)
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    snapshot_executor.add_observer(observer)
+    snapshot_executor.execute(short_test_case)
+    snapshot_executor.execute(short_test_case)
+    assert not snapshot_executor._snapshots
+    assert snapshot_executor.resumed_executions == 0
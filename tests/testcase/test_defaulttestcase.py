@@ -143,6 +143,51 @@ def test_hash(default_test_case):
     assert default_test_case.__hash__()
 
 
+def test_hash_is_cached(default_test_case):
+    default_test_case.add_statement(st.IntPrimitiveStatement(default_test_case, 5))
+    hash(default_test_case)
+    assert default_test_case._structural_hash is not None
+
+
+def test_hash_invalidated_by_add_statement(default_test_case):
+    default_test_case.add_statement(st.IntPrimitiveStatement(default_test_case, 5))
+    old_hash = hash(default_test_case)
+    default_test_case.add_statement(st.IntPrimitiveStatement(default_test_case, 6))
+    assert default_test_case._structural_hash is None
+    assert hash(default_test_case) != old_hash
+
+
+def test_hash_invalidated_by_remove(default_test_case):
+    default_test_case.add_statement(st.IntPrimitiveStatement(default_test_case, 5))
+    hash(default_test_case)
+    default_test_case.remove(0)
+    assert default_test_case._structural_hash is None
+
+
+def test_hash_invalidated_by_statement_change(default_test_case):
+    int_stmt = st.IntPrimitiveStatement(default_test_case, 5)
+    default_test_case.add_statement(int_stmt)
+    old_hash = hash(default_test_case)
+    int_stmt.value = 6
+    assert hash(default_test_case) != old_hash
+
+
+def test_hash_invalidated_by_statement_mutation(default_test_case):
+    int_stmt = st.IntPrimitiveStatement(default_test_case, 5)
+    default_test_case.add_statement(int_stmt)
+    hash(default_test_case)
+    int_stmt.mutate()
+    assert default_test_case._structural_hash is None
+
+
+def test_hash_copied_to_clone(default_test_case):
+    default_test_case.add_statement(st.IntPrimitiveStatement(default_test_case, 5))
+    clone = default_test_case.clone()
+    assert clone._structural_hash is None
+    old_hash = hash(default_test_case)
+    assert default_test_case.clone()._structural_hash == old_hash
+
+
 @pytest.mark.parametrize(
     "test_case,other,result",
     [
@@ -0,0 +1,148 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import copy
+import pickle
+import sys
+
+from math import inf
+
+import pytest
+
+from pynguin.utils.compactcollections import DenseCountMapping
+from pynguin.utils.compactcollections import DenseDistanceMapping
+from pynguin.utils.compactcollections import DenseSet
+from pynguin.utils.orderedset import OrderedSet
+
+
+def test_dense_set_add_and_contains():
+    dense_set = DenseSet()
+    dense_set.add(17)
+    dense_set.add(3)
+    dense_set.add(3)
+    assert 17 in dense_set
+    assert 3 in dense_set
+    assert 4 not in dense_set
+    assert 1000 not in dense_set
+    assert (3, 0.0) not in dense_set
+    assert len(dense_set) == 2
+    assert list(dense_set) == [3, 17]
+
+
+def test_dense_set_negative_value():
+    with pytest.raises(ValueError, match="non-negative"):
+        DenseSet().add(-1)
+
+
+def test_dense_set_discard():
+    dense_set = DenseSet([1, 2])
+    dense_set.discard(1)
+    dense_set.discard(100)
+    assert dense_set == {2}
+
+
+def test_dense_set_equals_other_sets():
+    assert DenseSet([2, 0]) == OrderedSet([0, 2])
+    assert OrderedSet([0, 2]) == DenseSet([2, 0])
+    assert DenseSet([2, 0]) == {0, 2}
+    assert DenseSet([2]) != {0, 2}
+
+
+def test_dense_set_update():
+    dense_set = DenseSet([1])
+    dense_set.update(DenseSet([40]), [2, 3])
+    assert dense_set == {1, 2, 3, 40}
+
+
+def test_dense_set_set_operations():
+    dense_set = DenseSet([1, 2, 3])
+    assert dense_set.intersection({2, 3, 4}) == {2, 3}
+    assert dense_set.difference([1], {3}) == {2}
+    assert dense_set.union([9]) == {1, 2, 3, 9}
+    assert dense_set.issubset({1, 2, 3, 4})
+    assert dense_set.issuperset([1, 3])
+    assert dense_set == {1, 2, 3}
+
+
+@pytest.mark.parametrize("copier", [pickle.loads, copy.deepcopy])
+def test_dense_set_copy(copier):
+    dense_set = DenseSet([0, 63, 64])
+    data = pickle.dumps(dense_set) if copier is pickle.loads else dense_set
+    copied = copier(data)
+    assert copied == dense_set
+    copied.add(5)
+    assert 5 not in dense_set
+
+
+def test_count_mapping():
+    counts = DenseCountMapping({4: 1})
+    counts.increment(4)
+    counts.increment(1, 3)
+    assert counts == {1: 3, 4: 2}
+    assert counts.get(2, 0) == 0
+    assert (4, 2) in counts.items()
+    del counts[4]
+    assert counts == {1: 3}
+    with pytest.raises(KeyError):
+        counts[4]
+
+
+def test_count_mapping_merge():
+    counts = DenseCountMapping({0: 1, 2: 2})
+    counts.merge(DenseCountMapping({2: 1, 9: 5}))
+    counts.merge({0: 1})
+    assert counts == {0: 2, 2: 3, 9: 5}
+
+
+def test_distance_mapping_merge():
+    distances = DenseDistanceMapping({0: 0.5, 1: 0.2})
+    distances.merge(DenseDistanceMapping({0: 0.3, 1: 0.6, 3: inf}))
+    assert distances == {0: 0.3, 1: 0.2, 3: inf}
+
+
+def test_distance_mapping_minimize():
+    distances = DenseDistanceMapping()
+    distances.minimize(2, inf)
+    assert distances == {2: inf}
+    distances.minimize(2, 1.0)
+    distances.minimize(2, 3.0)
+    assert distances[2] == 1.0
+    assert (2, 0.0) not in distances
+
+
+def test_distance_mapping_negative_key():
+    with pytest.raises(ValueError, match="non-negative"):
+        DenseDistanceMapping()[-1] = 0.0
+
+
+def test_distance_mapping_pickle():
+    distances = DenseDistanceMapping({5: 0.5})
+    assert pickle.loads(pickle.dumps(distances)) == {5: 0.5}  # noqa: S301
+
+
+def test_count_mapping_subtract():
+    counts = DenseCountMapping({0: 2, 3: 1})
+    counts.subtract(DenseCountMapping({0: 1, 3: 1}))
+    assert counts == {0: 1}
+
+
+def test_distance_mapping_copy():
+    distances = DenseDistanceMapping({1: 0.5})
+    copied = distances.copy()
+    copied[2] = 0.0
+    assert isinstance(copied, DenseDistanceMapping)
+    assert distances == {1: 0.5}
+
+
+def test_dense_collections_sizeof():
+    dense_set = DenseSet()
+    distances = DenseDistanceMapping()
+    empty_set_size = sys.getsizeof(dense_set)
+    empty_distances_size = sys.getsizeof(distances)
+    dense_set.add(999)
+    distances[999] = 0.0
+    assert sys.getsizeof(dense_set) >= empty_set_size + 1000
+    assert sys.getsizeof(distances) >= empty_distances_size + 9000